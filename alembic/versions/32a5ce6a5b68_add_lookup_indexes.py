@@ -0,0 +1,70 @@
+"""add lookup indexes
+
+Revision ID: 32a5ce6a5b68
+Revises: b57993198bad
+Create Date: 2026-10-17 10:12:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '32a5ce6a5b68'
+down_revision: Union[str, None] = 'b57993198bad'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Dialects supporting partial (filtered) indexes
+PARTIAL_INDEX_DIALECTS = ("postgresql", "sqlite")
+
+
+def upgrade() -> None:
+    # Indexes are created outside the migration transaction so PostgreSQL can
+    # build them concurrently, without locking large tables against writes.
+    dialect = op.get_bind().dialect.name
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_sessions_auth_user_id_is_active',
+            'sessions_auth',
+            ['user_id', 'is_active'],
+            postgresql_concurrently=True,
+        )
+
+        if dialect in PARTIAL_INDEX_DIALECTS:
+            op.create_index(
+                'ix_sessions_auth_active_user_id',
+                'sessions_auth',
+                ['user_id'],
+                postgresql_where=sa.text('is_active'),
+                postgresql_concurrently=True,
+                sqlite_where=sa.text('is_active = 1'),
+            )
+
+        op.create_index(
+            'ix_users_role_id',
+            'users',
+            ['role_id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_users_created_at_user_id',
+            'users',
+            ['created_at', 'user_id'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    op.drop_index('ix_users_created_at_user_id', table_name='users')
+    op.drop_index('ix_users_role_id', table_name='users')
+
+    if dialect in PARTIAL_INDEX_DIALECTS:
+        op.drop_index('ix_sessions_auth_active_user_id', table_name='sessions_auth')
+
+    op.drop_index('ix_sessions_auth_user_id_is_active', table_name='sessions_auth')
@@ -0,0 +1,33 @@
+"""add sessions_auth logout_at index
+
+Revision ID: 58fef90664d4
+Revises: 8759b1a4a136
+Create Date: 2026-10-17 14:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '58fef90664d4'
+down_revision: Union[str, None] = '8759b1a4a136'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Used by the revocation list refresh (sessions logged out since a given
+    # time) and by the session purge.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_sessions_auth_logout_at',
+            'sessions_auth',
+            ['logout_at'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_sessions_auth_logout_at', table_name='sessions_auth')
@@ -0,0 +1,82 @@
+"""store token digest
+
+Revision ID: 8759b1a4a136
+Revises: 8e9425ed2dad
+Create Date: 2026-10-17 13:05:00.000000
+
+"""
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8759b1a4a136'
+down_revision: Union[str, None] = '8e9425ed2dad'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Number of tokens backfilled per statement
+BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    # Replace the full JWT with its fixed-size SHA-256 digest.
+    with op.batch_alter_table('tokens') as batch_op:
+        batch_op.add_column(sa.Column('token_digest', sa.String(length=64), nullable=True))
+
+    tokens = sa.table(
+        'tokens',
+        sa.column('token_id', sa.String()),
+        sa.column('access_token', sa.String()),
+        sa.column('token_digest', sa.String()),
+    )
+    connection = op.get_bind()
+    last_token_id = ''
+
+    while True:
+        rows = connection.execute(
+            sa.select(tokens.c.token_id, tokens.c.access_token)
+            .where(tokens.c.token_id > last_token_id)
+            .order_by(tokens.c.token_id)
+            .limit(BATCH_SIZE)
+        ).all()
+
+        if not rows:
+            break
+
+        connection.execute(
+            tokens.update()
+            .where(tokens.c.token_id == sa.bindparam('b_token_id'))
+            .values(token_digest=sa.bindparam('b_token_digest')),
+            [
+                {
+                    'b_token_id': row.token_id,
+                    'b_token_digest': hashlib.sha256(row.access_token.encode()).hexdigest(),
+                }
+                for row in rows
+            ],
+        )
+        last_token_id = rows[-1].token_id
+
+    with op.batch_alter_table('tokens') as batch_op:
+        batch_op.alter_column('token_digest', existing_type=sa.String(length=64), nullable=False)
+        batch_op.create_unique_constraint('uq_tokens_token_digest', ['token_digest'])
+        batch_op.drop_column('access_token')
+
+
+def downgrade() -> None:
+    # The JWTs cannot be recovered from their digests, so the digest is kept
+    # in `access_token` to satisfy its NOT NULL and UNIQUE constraints.
+    with op.batch_alter_table('tokens') as batch_op:
+        batch_op.add_column(sa.Column('access_token', sa.String(), nullable=True))
+
+    op.execute('UPDATE tokens SET access_token = token_digest')
+
+    with op.batch_alter_table('tokens') as batch_op:
+        batch_op.alter_column('access_token', existing_type=sa.String(), nullable=False)
+        batch_op.create_unique_constraint('uq_tokens_access_token', ['access_token'])
+        batch_op.drop_constraint('uq_tokens_token_digest', type_='unique')
+        batch_op.drop_column('token_digest')
@@ -0,0 +1,32 @@
+"""add sessions_auth token_id index
+
+Revision ID: 8e9425ed2dad
+Revises: 32a5ce6a5b68
+Create Date: 2026-10-17 11:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e9425ed2dad'
+down_revision: Union[str, None] = '32a5ce6a5b68'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Used by the session purge to find tokens no session refers to.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_sessions_auth_token_id',
+            'sessions_auth',
+            ['token_id'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_sessions_auth_token_id', table_name='sessions_auth')
@@ -0,0 +1,37 @@
+"""add sessions_auth refresh token
+
+Revision ID: c3d1f0a7b925
+Revises: 58fef90664d4
+Create Date: 2026-10-17 15:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d1f0a7b925'
+down_revision: Union[str, None] = '58fef90664d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The SHA-256 digest of the current refresh token of each session; the unique
+    # constraint also serves as the index of the refresh lookup. Sessions created
+    # before this revision have no refresh token.
+    with op.batch_alter_table('sessions_auth') as batch_op:
+        batch_op.add_column(sa.Column('refresh_token_digest', sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column('refresh_expires_at', sa.DateTime(), nullable=True))
+        batch_op.create_unique_constraint(
+            'uq_sessions_auth_refresh_token_digest', ['refresh_token_digest']
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('sessions_auth') as batch_op:
+        batch_op.drop_constraint('uq_sessions_auth_refresh_token_digest', type_='unique')
+        batch_op.drop_column('refresh_expires_at')
+        batch_op.drop_column('refresh_token_digest')
@@ -0,0 +1,362 @@
+# /benchmarks/login.py
+
+# flake8: noqa: E501
+
+"""
+Benchmark measuring login latency with a large history of sessions.
+
+The administrator user is given `--sessions` inactive (logged out) sessions, which
+is what years of logins leave behind, and then `POST /api/v1/auth/login` is called
+in-process. Every login deactivates the active sessions of the user, so this
+shows how the `sessions_auth` indexes keep that lookup flat as the table grows.
+The lookup query is also timed on its own, since the login latency includes the
+password hash (lower `PASSWORD_HASH_ITERATIONS` to make the difference visible).
+
+The SQL statements executed by one login are listed first, and the run fails
+(exit status 1) if there are not `EXPECTED_LOGIN_STATEMENTS` of them. With
+`--check`, only this count is verified, without seeding or timing anything.
+
+With `--compare`, the `sessions_auth` indexes are dropped for a second run and
+recreated afterwards.
+
+The configured database must be migrated and seeded (`alembic upgrade head`).
+Seeded sessions are kept, so later runs only insert the missing ones.
+
+Usage:
+    python -m benchmarks.login --sessions 1000000 --logins 200 --compare
+    python -m benchmarks.login --check
+"""
+
+# PY
+import argparse
+import asyncio
+import hashlib
+import logging
+import statistics
+import time
+import uuid
+from datetime import datetime
+
+from fastapi import FastAPI
+from sqlalchemy import Index, event, func, insert, inspect, select
+from sqlalchemy.engine import Engine
+
+# Core
+from src.core.configurations import DatabaseConfig, EnvConfig
+
+# Data
+from src.data.models import (
+    SessionAuthModel,
+    TokenModel,
+    UserModel
+)
+from src.data.repositories import SessionAuthRepository
+
+# Utils
+from src.utils import GenUtil
+
+# Benchmarks
+from benchmarks.middleware import build_app, login
+
+API_NAME = EnvConfig().api_name
+API_USER_ADMINISTRATOR = EnvConfig().api_user_administrator
+
+# Statements of one login: user lookup, session deactivation, token and session inserts
+EXPECTED_LOGIN_STATEMENTS = 4
+
+
+def find_administrator_id() -> str:
+    """
+    Standalone function responsible for returning the administrator user ID.
+
+    Returns:
+        str: The administrator user ID.
+    """
+
+    session_db = next(DatabaseConfig.get_db())
+
+    try:
+        email = f"{API_USER_ADMINISTRATOR.lower()}@{API_NAME}.com"
+        return session_db.execute(
+            select(UserModel.user_id).where(UserModel.email == email)
+        ).scalar_one()
+    finally:
+        session_db.close()
+
+
+def seed_sessions(engine: Engine, user_id: str, sessions: int, batch_size: int) -> None:
+    """
+    Standalone function responsible for inserting inactive sessions until the user has `sessions` of them.
+
+    Args:
+        engine (Engine): The database engine.
+        user_id (str): The user owning the sessions.
+        sessions (int): The number of inactive sessions the user must have.
+        batch_size (int): Number of rows inserted per statement.
+
+    Returns:
+        None
+    """
+
+    with engine.connect() as connection:
+        existing = connection.execute(
+            select(func.count()).select_from(SessionAuthModel).where(
+                SessionAuthModel.user_id == user_id,
+                SessionAuthModel.is_active.is_(False),
+            )
+        ).scalar_one()
+
+    missing = max(sessions - existing, 0)
+    print(f"Inactive sessions: {existing} existing, {missing} to insert")
+
+    now = GenUtil.generate_formatted_datetime()
+    logout_at = datetime.now()
+    start_time = time.perf_counter()
+
+    for offset in range(0, missing, batch_size):
+        size = min(batch_size, missing - offset)
+        token_ids = [str(uuid.uuid4()) for _ in range(size)]
+
+        with engine.begin() as connection:
+            connection.execute(
+                insert(TokenModel),
+                [
+                    {
+                        "token_id": token_id,
+                        "token_digest": hashlib.sha256(token_id.encode()).hexdigest(),
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for token_id in token_ids
+                ],
+            )
+            connection.execute(
+                insert(SessionAuthModel),
+                [
+                    {
+                        "session_id": str(uuid.uuid4()),
+                        "token_id": token_id,
+                        "user_id": user_id,
+                        "login_at": now,
+                        "logout_at": logout_at,
+                        "is_active": False,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for token_id in token_ids
+                ],
+            )
+
+        print(f"\rInserted {offset + size}/{missing}", end="", flush=True)
+
+    if missing:
+        print(f"\nSeeded in {time.perf_counter() - start_time:.1f}s")
+
+
+def session_indexes(engine: Engine) -> list[Index]:
+    """
+    Standalone function responsible for returning the `sessions_auth` model indexes present in the database.
+
+    Args:
+        engine (Engine): The database engine.
+
+    Returns:
+        list[Index]: The indexes.
+    """
+
+    existing = {index["name"] for index in inspect(engine).get_indexes(SessionAuthModel.__tablename__)}
+
+    return [index for index in SessionAuthModel.__table__.indexes if index.name in existing]
+
+
+def percentiles(samples: list[float]) -> str:
+    """
+    Standalone function responsible for formatting the latency percentiles of a list of samples.
+
+    Args:
+        samples (list[float]): The latencies, in milliseconds.
+
+    Returns:
+        str: The p50, p95 and p99 latencies.
+    """
+
+    quantiles = statistics.quantiles(samples, n=100)
+    return f"p50 {quantiles[49]:>8.2f}ms  p95 {quantiles[94]:>8.2f}ms  p99 {quantiles[98]:>8.2f}ms"
+
+
+def measure_lookup(user_id: str, lookups: int) -> list[float]:
+    """
+    Standalone function responsible for timing the active sessions lookup performed on login.
+
+    Args:
+        user_id (str): The user whose sessions are looked up.
+        lookups (int): Number of lookups.
+
+    Returns:
+        list[float]: The latency of each lookup, in milliseconds.
+    """
+
+    session_db = next(DatabaseConfig.get_db())
+    repository = SessionAuthRepository(session_db)
+    samples = []
+
+    try:
+        for _ in range(lookups):
+            start_time = time.perf_counter()
+            repository.find_active_sessions_by_user_id(user_id)
+            samples.append((time.perf_counter() - start_time) * 1000)
+            session_db.rollback()
+    finally:
+        session_db.close()
+
+    return samples
+
+
+async def measure_login(app: FastAPI, logins: int) -> list[float]:
+    """
+    Standalone asynchronous function responsible for timing sequential logins of the administrator user.
+
+    Args:
+        app (FastAPI): The application instance.
+        logins (int): Number of logins.
+
+    Returns:
+        list[float]: The latency of each login, in milliseconds.
+    """
+
+    samples = []
+
+    for _ in range(logins):
+        start_time = time.perf_counter()
+        await login(app)
+        samples.append((time.perf_counter() - start_time) * 1000)
+
+    return samples
+
+
+async def count_login_statements(app: FastAPI, engine: Engine) -> list[str]:
+    """
+    Standalone asynchronous function responsible for capturing the SQL statements executed by one login.
+
+    Args:
+        app (FastAPI): The application instance.
+        engine (Engine): The database engine.
+
+    Returns:
+        list[str]: The first line of each executed statement.
+    """
+
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.strip().splitlines()[0])
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+
+    try:
+        await login(app)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return statements
+
+
+async def check_login_statements(app: FastAPI, engine: Engine) -> None:
+    """
+    Standalone asynchronous function responsible for printing and checking the SQL statements of one login.
+
+    Args:
+        app (FastAPI): The application instance.
+        engine (Engine): The database engine.
+
+    Returns:
+        None
+
+    Raises:
+        SystemExit: If the login does not execute `EXPECTED_LOGIN_STATEMENTS` statements.
+    """
+
+    statements = await count_login_statements(app, engine)
+    print(f"SQL statements per login: {len(statements)}")
+
+    for statement in statements:
+        print(f"    {statement}")
+
+    if len(statements) != EXPECTED_LOGIN_STATEMENTS:
+        raise SystemExit(
+            f"Login executed {len(statements)} SQL statements, expected {EXPECTED_LOGIN_STATEMENTS}!"
+        )
+
+
+async def main(sessions: int, logins: int, batch_size: int, compare: bool, check: bool) -> None:
+    """
+    Standalone asynchronous function responsible for seeding the sessions and printing the results.
+
+    Args:
+        sessions (int): Number of inactive sessions of the administrator user.
+        logins (int): Number of logins (and lookups) measured per run.
+        batch_size (int): Number of rows inserted per statement while seeding.
+        compare (bool): Whether to also measure without the `sessions_auth` indexes.
+        check (bool): Whether to only check the number of SQL statements per login.
+
+    Returns:
+        None
+
+    Raises:
+        SystemExit: If the login does not execute `EXPECTED_LOGIN_STATEMENTS` statements.
+    """
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    session_db = next(DatabaseConfig.get_db())
+    engine = session_db.get_bind()
+    session_db.close()
+
+    app = build_app(legacy=False)
+
+    if check:
+        await check_login_statements(app, engine)
+        return
+
+    user_id = find_administrator_id()
+    seed_sessions(engine, user_id, sessions, batch_size)
+
+    indexes = session_indexes(engine)
+
+    await check_login_statements(app, engine)
+
+    if not indexes:
+        print("Warning: no sessions_auth indexes found, run `alembic upgrade head` first")
+
+    runs = [("with indexes", False)]
+
+    if compare:
+        runs.append(("without indexes", True))
+
+    for name, drop_indexes in runs:
+        if drop_indexes:
+            for index in indexes:
+                index.drop(bind=engine)
+
+        try:
+            lookup_samples = measure_lookup(user_id, logins)
+            login_samples = await measure_login(app, logins)
+        finally:
+            if drop_indexes:
+                for index in indexes:
+                    index.create(bind=engine)
+
+        print(f"{name:<16} lookup {percentiles(lookup_samples)}")
+        print(f"{'':<16} login  {percentiles(login_samples)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=1_000_000)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.sessions, args.logins, args.batch_size, args.compare, args.check))
@@ -0,0 +1,267 @@
+# /benchmarks/middleware.py
+
+# flake8: noqa: E501
+
+"""
+Benchmark comparing the `BaseHTTPMiddleware` and pure ASGI middleware stacks.
+
+Both stacks are mounted on the same API router and exception handlers, and the
+`GET /api/v1/users` route is called in-process (no network, no HTTP client) so
+the measured difference is the middleware overhead.
+
+The configured database must be migrated and seeded (`alembic upgrade head`),
+since the benchmark logs in with the administrator user from the `.env` file.
+
+Usage:
+    python -m benchmarks.middleware --requests 2000 --concurrency 50
+"""
+
+# PY
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from starlette.middleware.base import BaseHTTPMiddleware
+
+# Core
+from src.core.configurations import EnvConfig
+from src.core.handlers.exception import ExceptionHandler
+from src.core.middleware import (
+    AuthMiddleware,
+    LoggerMiddleware
+)
+from src.core.middleware.auth import PUBLIC_PATHS
+
+# Presentation
+from src.presentation.routes import ApiRouter
+
+# Utils
+from src.utils import (
+    AuthUtil,
+    json_response
+)
+
+API_NAME = EnvConfig().api_name
+API_VERSION = EnvConfig().api_version
+API_USER_ADMINISTRATOR = EnvConfig().api_user_administrator
+API_PASSWORD_ADMINISTRATOR = EnvConfig().api_password_administrator
+
+
+class LegacyAuthMiddleware(BaseHTTPMiddleware):
+    """
+    Class reproducing the previous `BaseHTTPMiddleware` based authentication middleware.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        if request.url.path in PUBLIC_PATHS:
+            return await call_next(request)
+
+        try:
+            auth_header = request.headers.get("Authorization")
+            access_token = auth_header.split(" ")[1]  # type: ignore
+            AuthUtil.verify_token(access_token)
+        except HTTPException as error:
+            return json_response(error.status_code, str(error.detail))
+
+        request.state.access_token = access_token
+        return await call_next(request)
+
+
+class LegacyLoggerMiddleware(BaseHTTPMiddleware):
+    """
+    Class reproducing the previous `BaseHTTPMiddleware` based logger middleware.
+    """
+
+    async def dispatch(self, request, call_next):
+        start_time = time.time()
+        response = await call_next(request)
+        process_time = (time.time() - start_time) * 1000
+        logging.getLogger().info(
+            f"{request.method} - {response.status_code} - {request.url} - {process_time:.2f}ms"
+        )
+        return response
+
+
+def build_app(legacy: bool) -> FastAPI:
+    """
+    Standalone function responsible for building the application with one of the middleware stacks.
+
+    Args:
+        legacy (bool): Whether to use the `BaseHTTPMiddleware` stack.
+
+    Returns:
+        FastAPI: The application instance.
+    """
+
+    app = FastAPI()
+    app.add_exception_handler(HTTPException, ExceptionHandler.http_exception_handler)  # type: ignore
+    app.add_exception_handler(RequestValidationError, ExceptionHandler.json_decode_error_handler)  # type: ignore
+
+    if legacy:
+        app.add_middleware(LegacyLoggerMiddleware)
+        app.add_middleware(LegacyAuthMiddleware)
+    else:
+        app.add_middleware(AuthMiddleware)
+        app.add_middleware(LoggerMiddleware)
+
+    app.include_router(ApiRouter().router, prefix="/api")
+    return app
+
+
+async def call(
+    app: FastAPI,
+    method: str,
+    path: str,
+    headers: list[tuple[bytes, bytes]],
+    body: bytes = b""
+) -> tuple[int, bytes]:
+    """
+    Standalone asynchronous function responsible for sending one request to an ASGI application.
+
+    Args:
+        app (FastAPI): The application instance.
+        method (str): The HTTP method.
+        path (str): The request path.
+        headers (list[tuple[bytes, bytes]]): The raw request headers.
+        body (bytes, optional): The request body. Defaults to b"".
+
+    Returns:
+        tuple[int, bytes]: The response status code and body.
+    """
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 80),
+    }
+    request_sent = False
+    status_code = 0
+    chunks: list[bytes] = []
+
+    async def receive():
+        nonlocal request_sent
+        if request_sent:
+            await asyncio.sleep(3600)
+        request_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status_code, b"".join(chunks)
+
+
+async def login(app: FastAPI) -> str:
+    """
+    Standalone asynchronous function responsible for obtaining an access token for the administrator user.
+
+    Args:
+        app (FastAPI): The application instance.
+
+    Returns:
+        str: The access token.
+    """
+
+    body = json.dumps(
+        {
+            "email": f"{API_USER_ADMINISTRATOR.lower()}@{API_NAME}.com",
+            "password": API_PASSWORD_ADMINISTRATOR,
+        }
+    ).encode()
+    status_code, content = await call(
+        app,
+        "POST",
+        f"/api/{API_VERSION}/auth/login",
+        [(b"content-type", b"application/json")],
+        body,
+    )
+
+    if status_code != 200:
+        raise RuntimeError(f"Login failed ({status_code}): {content!r}")
+
+    return json.loads(content)["data"]["access_token"]
+
+
+async def run(app: FastAPI, access_token: str, requests: int, concurrency: int) -> float:
+    """
+    Standalone asynchronous function responsible for measuring the throughput of `GET /api/v1/users`.
+
+    Args:
+        app (FastAPI): The application instance.
+        access_token (str): The Bearer token sent with every request.
+        requests (int): Total number of requests.
+        concurrency (int): Number of concurrent requests.
+
+    Returns:
+        float: Requests per second.
+    """
+
+    path = f"/api/{API_VERSION}/users"
+    headers = [(b"authorization", f"Bearer {access_token}".encode())]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            status_code, content = await call(app, "GET", path, headers)
+            if status_code != 200:
+                raise RuntimeError(f"Unexpected response ({status_code}): {content!r}")
+
+    await asyncio.gather(*(one() for _ in range(min(requests, concurrency))))
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - start_time
+
+    return requests / elapsed
+
+
+async def main(requests: int, concurrency: int) -> None:
+    """
+    Standalone asynchronous function responsible for running both stacks and printing the results.
+
+    Args:
+        requests (int): Total number of requests per stack.
+        concurrency (int): Number of concurrent requests.
+
+    Returns:
+        None
+    """
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    results = {}
+
+    for name, legacy in (("before (BaseHTTPMiddleware)", True), ("after (pure ASGI)", False)):
+        app = build_app(legacy)
+        access_token = await login(app)
+        results[name] = await run(app, access_token, requests, concurrency)
+
+    for name, requests_per_second in results.items():
+        print(f"{name:<30} {requests_per_second:>10.1f} req/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,108 @@
+# /benchmarks/validate.py
+
+# flake8: noqa: E501
+
+"""
+Benchmark comparing the gateway verification endpoint with the validate endpoint.
+
+`GET /api/v1/auth/validate` returns the claims in the JSON response envelope from
+a synchronous route, while `GET /api/v1/auth/verify` returns them as headers of
+an empty `204` from an async route, reusing the payload verified by the
+authentication middleware. Both are called in-process with the same token, on
+the application middleware stack.
+
+The configured database must be migrated and seeded (`alembic upgrade head`),
+since the benchmark logs in with the administrator user from the `.env` file.
+
+Usage:
+    python -m benchmarks.validate --requests 5000 --concurrency 50
+"""
+
+# PY
+import argparse
+import asyncio
+import logging
+import time
+
+from fastapi import FastAPI
+
+# Core
+from src.core.configurations import EnvConfig
+
+# Benchmarks
+from benchmarks.middleware import build_app, call, login
+
+API_VERSION = EnvConfig().api_version
+
+
+async def run(
+    app: FastAPI,
+    path: str,
+    access_token: str,
+    requests: int,
+    concurrency: int
+) -> float:
+    """
+    Standalone asynchronous function responsible for measuring the throughput of one endpoint.
+
+    Args:
+        app (FastAPI): The application instance.
+        path (str): The request path.
+        access_token (str): The Bearer token sent with every request.
+        requests (int): Total number of requests.
+        concurrency (int): Number of concurrent requests.
+
+    Returns:
+        float: Requests per second.
+    """
+
+    headers = [(b"authorization", f"Bearer {access_token}".encode())]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            status_code, content = await call(app, "GET", path, headers)
+            if status_code not in (200, 204):
+                raise RuntimeError(f"Unexpected response ({status_code}): {content!r}")
+
+    await asyncio.gather(*(one() for _ in range(min(requests, concurrency))))
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - start_time
+
+    return requests / elapsed
+
+
+async def main(requests: int, concurrency: int) -> None:
+    """
+    Standalone asynchronous function responsible for running both endpoints and printing the results.
+
+    Args:
+        requests (int): Total number of requests per endpoint.
+        concurrency (int): Number of concurrent requests.
+
+    Returns:
+        None
+    """
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    app = build_app(legacy=False)
+    access_token = await login(app)
+
+    for name, path in (
+        ("GET /auth/validate (JSON)", f"/api/{API_VERSION}/auth/validate"),
+        ("GET /auth/verify (204)", f"/api/{API_VERSION}/auth/verify"),
+    ):
+        requests_per_second = await run(app, path, access_token, requests, concurrency)
+        print(f"{name:<30} {requests_per_second:>10.1f} req/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests, args.concurrency))
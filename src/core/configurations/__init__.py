@@ -4,6 +4,8 @@
 
 from src.core.configurations.environment import EnvConfig
 from src.core.configurations.database import DatabaseConfig
+from src.core.configurations.database.pool import DatabasePoolMonitor
+from src.core.configurations.database.query import DatabaseQueryMonitor, RequestQueries
 from src.core.configurations.database.utils import DatabaseConfigUtil
 from src.core.configurations.logger import LoggerConfig
 from src.core.configurations.scheduler import SchedulerConfig
\ No newline at end of file
@@ -2,16 +2,25 @@
 
 # flake8: noqa: E501, F401
 
-from typing import Any, Generator
+from typing import Any, AsyncGenerator, Generator
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import (
     Session,
     sessionmaker
 )
 
+from src.core.configurations.database.pool import DatabasePoolMonitor
+from src.core.configurations.database.query import DatabaseQueryMonitor
 from src.core.configurations.database.utils import DatabaseConfigUtil
+from src.core.configurations.environment import EnvConfig
+from src.core.exceptions.database import DatabaseInvalidConfigurationException
 
 
 class DatabaseConfig:
@@ -22,17 +31,54 @@ class DatabaseConfig:
     for defining database models. It also provides methods for retrieving database
     sessions and managing table creation.
 
+    The queries of both engines are instrumented by `DatabaseQueryMonitor`
+    (per-request query count and time, slow queries and repeated statements).
+
+    When `DATABASE_ASYNC` is enabled, an async engine and session factory are also
+    created, so routes can depend on `get_async_db` instead of running database I/O
+    in the thread pool.
+
     Class Args:
         None
     """
 
     _db_url = DatabaseConfigUtil().get_url()
-    _engine = create_engine(_db_url)
+    _engine_options = DatabaseConfigUtil().get_engine_options()
+    _engine = create_engine(_db_url, **_engine_options)
+    _pool_monitor = DatabasePoolMonitor(_engine, "sync")
+    _query_monitor = DatabaseQueryMonitor(_engine, "sync")
     _session_local = sessionmaker(
         autocommit=False, autoflush=False, bind=_engine
     )
     _base = declarative_base()
 
+    _async_enabled: bool = EnvConfig().database_async
+    _async_engine = (
+        create_async_engine(
+            DatabaseConfigUtil().get_async_url(),
+            **DatabaseConfigUtil().get_engine_options(use_async=True)
+        )
+        if _async_enabled
+        else None
+    )
+    _async_pool_monitor = (
+        DatabasePoolMonitor(_async_engine.sync_engine, "async")
+        if _async_engine is not None
+        else None
+    )
+    _async_query_monitor = (
+        DatabaseQueryMonitor(_async_engine.sync_engine, "async")
+        if _async_engine is not None
+        else None
+    )
+    _async_session_local = (
+        async_sessionmaker(
+            bind=_async_engine, autoflush=False, expire_on_commit=False
+        )
+        if _async_engine is not None
+        else None
+    )
+
     @classmethod
     def get_db(cls) -> Generator[Session, None, None]:
         """
@@ -57,6 +103,70 @@ class DatabaseConfig:
         finally:
             db.close()
 
+    @classmethod
+    async def get_async_db(cls) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Class method responsible for providing an async database session.
+
+        This method creates a new async database session, yields it for use,
+        and ensures proper cleanup by closing the session afterward.
+
+        Args:
+            None
+
+        Yields:
+            AsyncGenerator[AsyncSession, None]: An async database session.
+
+        Raises:
+            DatabaseInvalidConfigurationException: If the async mode is disabled.
+        """
+
+        if cls._async_session_local is None:
+            raise DatabaseInvalidConfigurationException(
+                "Async database mode is disabled! Set DATABASE_ASYNC=true to enable it."
+            )
+
+        db: AsyncSession = cls._async_session_local()
+        try:
+            yield db
+        finally:
+            await db.close()
+
+    @classmethod
+    def pool_stats(cls) -> list[dict]:
+        """
+        Class method responsible for returning the connection pool metrics.
+
+        Args:
+            None
+
+        Returns:
+            list[dict]: The metrics of the sync pool and, if enabled, the async pool.
+        """
+
+        monitors = [cls._pool_monitor, cls._async_pool_monitor]
+
+        return [monitor.stats for monitor in monitors if monitor is not None]
+
+    @classmethod
+    def log_pool_status(cls) -> None:
+        """
+        Class method responsible for logging the connection pool metrics.
+
+        This method is meant to be scheduled periodically to size the pools
+        against the number of workers.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        for monitor in (cls._pool_monitor, cls._async_pool_monitor):
+            if monitor is not None:
+                monitor.log_status()
+
     @classmethod
     def create_all(cls) -> None:
         """
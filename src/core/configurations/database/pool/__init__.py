@@ -0,0 +1,144 @@
+# /src/core/configurations/database/pool/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+import logging
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class DatabasePoolMonitor:
+    """
+    Class responsible for collecting connection pool metrics of an engine.
+
+    This class listens to the pool `connect`, `checkout` and `checkin` events,
+    keeps counters of them and logs a warning whenever the pool starts handing out
+    overflow connections, which signals that the pool is undersized for the
+    number of workers and concurrent requests.
+
+    Class Args:
+        engine (Engine): The (sync) engine whose pool is monitored.
+        name (str): Name used to identify the engine in the log messages.
+    """
+
+    def __init__(self, engine: Engine, name: str = "database") -> None:
+        """
+        Constructor method for DatabasePoolMonitor.
+
+        Registers the pool event listeners on the given engine.
+
+        Args:
+            engine (Engine): The (sync) engine whose pool is monitored.
+            name (str, optional): Name used in the log messages. Defaults to "database".
+        """
+
+        self.__engine: Engine = engine
+        self.__name: str = name
+        self.__logger = logging.getLogger(__name__)
+        self.__lock = threading.Lock()
+        self.__connects: int = 0
+        self.__checkouts: int = 0
+        self.__checkins: int = 0
+        self.__overflow_checkouts: int = 0
+        self.__in_overflow: bool = False
+
+        event.listen(self.__engine, "connect", self.__on_connect)
+        event.listen(self.__engine, "checkout", self.__on_checkout)
+        event.listen(self.__engine, "checkin", self.__on_checkin)
+
+    def __on_connect(self, dbapi_connection, connection_record) -> None:
+        """
+        Private method called when the pool opens a new DBAPI connection.
+        """
+
+        with self.__lock:
+            self.__connects += 1
+
+    def __on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        """
+        Private method called when a connection is checked out from the pool.
+        """
+
+        pool = self.__engine.pool
+        size = getattr(pool, "size", None)
+        checked_out = getattr(pool, "checkedout", None)
+        entered_overflow = False
+
+        with self.__lock:
+            self.__checkouts += 1
+
+            if size is not None and checked_out is not None and checked_out() > size():
+                self.__overflow_checkouts += 1
+                entered_overflow = not self.__in_overflow
+                self.__in_overflow = True
+
+        if entered_overflow:
+            self.__logger.warning(
+                f"Database pool ({self.__name}) is using overflow connections: {pool.status()}"
+            )
+
+    def __on_checkin(self, dbapi_connection, connection_record) -> None:
+        """
+        Private method called when a connection is returned to the pool.
+        """
+
+        pool = self.__engine.pool
+        size = getattr(pool, "size", None)
+        checked_out = getattr(pool, "checkedout", None)
+
+        with self.__lock:
+            self.__checkins += 1
+
+            if size is not None and checked_out is not None and checked_out() <= size():
+                self.__in_overflow = False
+
+    @property
+    def stats(self) -> dict[str, int | str]:
+        """
+        Property method responsible for returning the pool gauges and counters.
+
+        Args:
+            None
+
+        Returns:
+            dict[str, int | str]: Pool size, checked in/out connections, overflow
+                and the connect/checkout/checkin/overflow checkout counters.
+        """
+
+        pool = self.__engine.pool
+        gauges: dict[str, int | str] = {"name": self.__name}
+
+        for gauge in ("size", "checkedin", "checkedout", "overflow"):
+            method = getattr(pool, gauge, None)
+            if callable(method):
+                gauges[gauge] = method()
+
+        with self.__lock:
+            gauges.update(
+                {
+                    "connects": self.__connects,
+                    "checkouts": self.__checkouts,
+                    "checkins": self.__checkins,
+                    "overflow_checkouts": self.__overflow_checkouts,
+                }
+            )
+
+        return gauges
+
+    def log_status(self) -> None:
+        """
+        Public method responsible for logging the current pool metrics.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        stats = self.stats
+        message = " - ".join(f"{key}={value}" for key, value in stats.items())
+        self.__logger.info(f"Database pool -> {message}")
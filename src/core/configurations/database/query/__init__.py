@@ -0,0 +1,333 @@
+# /src/core/configurations/database/query/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+import logging
+import re
+import time
+from contextvars import ContextVar, Token
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+# Core
+from src.core.configurations.environment import EnvConfig
+
+
+class RequestQueries:
+    """
+    Class responsible for accumulating the queries run while handling one request.
+
+    Statements are grouped by shape: whitespace is collapsed and lists of bound
+    parameters (e.g. `IN (?, ?, ?)`) are reduced to `(...)`, so a statement run
+    once per row of a previous result is counted as one repeated shape.
+
+    Class Args:
+        request_id (str): The ID of the request.
+    """
+
+    __whitespace_pattern = re.compile(r"\s+")
+    __parameter_list_pattern = re.compile(
+        r"\(\s*(?:\?|%s|%\(\w+\)s|\$\d+|:\w+)(?:\s*,\s*(?:\?|%s|%\(\w+\)s|\$\d+|:\w+))*\s*\)"
+    )
+
+    def __init__(self, request_id: str) -> None:
+        """
+        Constructor method for RequestQueries.
+
+        Args:
+            request_id (str): The ID of the request.
+        """
+
+        self.__request_id: str = request_id
+        self.__count: int = 0
+        self.__duration: float = 0.0
+        self.__shapes: dict[str, int] = {}
+
+    @property
+    def request_id(self) -> str:
+        """
+        Property method responsible for returning the ID of the request.
+
+        Args:
+            None
+
+        Returns:
+            str: The request ID.
+        """
+
+        return self.__request_id
+
+    @property
+    def count(self) -> int:
+        """
+        Property method responsible for returning the number of queries run.
+
+        Args:
+            None
+
+        Returns:
+            int: The number of statements executed.
+        """
+
+        return self.__count
+
+    @property
+    def duration(self) -> float:
+        """
+        Property method responsible for returning the total time spent in the database.
+
+        Args:
+            None
+
+        Returns:
+            float: The total duration of the queries, in seconds.
+        """
+
+        return self.__duration
+
+    def record(self, statement: str, duration: float) -> None:
+        """
+        Public method responsible for recording a query.
+
+        Args:
+            statement (str): The SQL statement sent to the database.
+            duration (float): The duration of the query, in seconds.
+
+        Returns:
+            None
+        """
+
+        shape = self.__parameter_list_pattern.sub(
+            "(...)", self.__whitespace_pattern.sub(" ", statement).strip()
+        )
+
+        self.__count += 1
+        self.__duration += duration
+        self.__shapes[shape] = self.__shapes.get(shape, 0) + 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """
+        Public method responsible for returning the statement shapes run more than a given number of times.
+
+        Args:
+            threshold (int): The number of runs allowed per shape.
+
+        Returns:
+            list[tuple[str, int]]: The repeated shapes and their number of runs, most repeated first.
+        """
+
+        return sorted(
+            (
+                (shape, runs)
+                for shape, runs in self.__shapes.items()
+                if runs > threshold
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+
+
+class DatabaseQueryMonitor:
+    """
+    Class responsible for instrumenting the queries run by an engine.
+
+    This class listens to the `before_cursor_execute` and `after_cursor_execute`
+    events of the engine and:
+
+        - adds each query and its duration to the `RequestQueries` of the request
+          being handled (see `start_request`), so the number of queries and the
+          database time of a request are logged with its request ID;
+        - logs a warning for queries slower than `DATABASE_SLOW_QUERY_MS`, followed
+          by the query plan (`EXPLAIN`) of SELECT statements when the log level is DEBUG;
+        - at the end of a request, logs a warning for each statement run more than
+          `DATABASE_QUERY_REPEAT_THRESHOLD` times, the signature of an N+1 query.
+
+    The request queries are kept in a context variable, which follows the request
+    into the thread pool and the async engine greenlets.
+
+    Class Args:
+        engine (Engine): The (sync) engine whose queries are instrumented.
+        name (str): Name used to identify the engine in the log messages.
+    """
+
+    __request_queries: ContextVar[RequestQueries | None] = ContextVar(
+        "request_queries", default=None
+    )
+
+    __slow_query_seconds: float = EnvConfig().database_slow_query_ms / 1000
+
+    __repeat_threshold: int = EnvConfig().database_query_repeat_threshold
+
+    __explain_prefixes = {
+        "mysql": "EXPLAIN",
+        "postgresql": "EXPLAIN",
+        "sqlite": "EXPLAIN QUERY PLAN",
+    }
+
+    __start_times_key = "query_start_times"
+
+    __explain_savepoint = "query_monitor_explain"
+
+    def __init__(self, engine: Engine, name: str = "database") -> None:
+        """
+        Constructor method for DatabaseQueryMonitor.
+
+        Registers the cursor event listeners on the given engine.
+
+        Args:
+            engine (Engine): The (sync) engine whose queries are instrumented.
+            name (str, optional): Name used in the log messages. Defaults to "database".
+        """
+
+        self.__name: str = name
+        self.__logger = logging.getLogger(__name__)
+
+        event.listen(engine, "before_cursor_execute", self.__on_before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self.__on_after_cursor_execute)
+
+    @classmethod
+    def start_request(cls, request_id: str) -> Token:
+        """
+        Class method responsible for starting to record the queries of a request.
+
+        Args:
+            request_id (str): The ID of the request.
+
+        Returns:
+            Token: The token to pass to `finish_request`.
+        """
+
+        return cls.__request_queries.set(RequestQueries(request_id))
+
+    @classmethod
+    def finish_request(cls, token: Token) -> RequestQueries | None:
+        """
+        Class method responsible for ending the recording of the queries of a request.
+
+        Repeated statements are logged at this point.
+
+        Args:
+            token (Token): The token returned by `start_request`.
+
+        Returns:
+            RequestQueries | None: The queries of the request.
+        """
+
+        queries = cls.__request_queries.get()
+        cls.__request_queries.reset(token)
+
+        if queries is not None and cls.__repeat_threshold > 0:
+            logger = logging.getLogger(__name__)
+
+            for shape, runs in queries.repeated(cls.__repeat_threshold):
+                logger.warning(
+                    f"Statement run {runs} times in request {queries.request_id}, possible N+1 query: {shape[:500]}"
+                )
+
+        return queries
+
+    def __on_before_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool
+    ) -> None:
+        """
+        Private method called before a statement is sent to the database.
+        """
+
+        conn.info.setdefault(self.__start_times_key, []).append(time.perf_counter())
+
+    def __on_after_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool
+    ) -> None:
+        """
+        Private method called after a statement was run by the database.
+        """
+
+        start_times = conn.info.get(self.__start_times_key)
+
+        if not start_times:
+            return
+
+        duration = time.perf_counter() - start_times.pop()
+        queries = self.__request_queries.get()
+
+        if queries is not None:
+            queries.record(statement, duration)
+
+        if self.__slow_query_seconds <= 0 or duration < self.__slow_query_seconds:
+            return
+
+        request_id = queries.request_id if queries is not None else "-"
+
+        self.__logger.warning(
+            f"Slow query ({self.__name}) took {duration * 1000:.2f}ms in request {request_id}: {statement[:500]}"
+        )
+
+        if not executemany and self.__logger.isEnabledFor(logging.DEBUG):
+            plan = self.__explain(conn, statement, parameters)
+
+            if plan:
+                self.__logger.debug(f"Query plan ({self.__name}) in request {request_id}:\n{plan}")
+
+    def __explain(self, conn: Connection, statement: str, parameters: Any) -> str | None:
+        """
+        Private method responsible for returning the query plan of a SELECT statement.
+
+        The plan is read through a separate DBAPI cursor of the same connection,
+        so it does not go through the engine events, and inside a savepoint that
+        is rolled back if `EXPLAIN` fails: on PostgreSQL a failed statement would
+        otherwise abort the transaction of the request.
+
+        Args:
+            conn (Connection): The connection that ran the statement.
+            statement (str): The SQL statement.
+            parameters (Any): The bound parameters of the statement.
+
+        Returns:
+            str | None: The query plan, or None if it is not available.
+        """
+
+        prefix = self.__explain_prefixes.get(conn.dialect.name)
+
+        if prefix is None or not statement.lstrip().upper().startswith("SELECT"):
+            return None
+
+        savepoint = self.__explain_savepoint
+
+        try:
+            cursor = conn.connection.dbapi_connection.cursor()  # type: ignore
+
+            try:
+                cursor.execute(f"SAVEPOINT {savepoint}")
+
+                try:
+                    cursor.execute(f"{prefix} {statement}", parameters)
+                    rows = cursor.fetchall()
+                except Exception:
+                    cursor.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+                    raise
+                finally:
+                    cursor.execute(f"RELEASE SAVEPOINT {savepoint}")
+
+            finally:
+                cursor.close()
+
+        except Exception as error:
+            self.__logger.debug(f"Could not explain the slow query ({self.__name}): {error}")
+            return None
+
+        return "\n".join(" | ".join(str(column) for column in row) for row in rows)
@@ -35,6 +35,11 @@ class DatabaseConfigUtil:
         self.__db_user = EnvConfig().database_user
         self.__db_password = EnvConfig().database_password
         self.__db_type_default = DatabaseTypeEnum.SQLITE.value.upper()
+        self.__db_pool_size = EnvConfig().database_pool_size
+        self.__db_pool_max_overflow = EnvConfig().database_pool_max_overflow
+        self.__db_pool_timeout = EnvConfig().database_pool_timeout
+        self.__db_pool_recycle = EnvConfig().database_pool_recycle
+        self.__db_pool_pre_ping = EnvConfig().database_pool_pre_ping
 
     def get_url(self) -> str:
         """
@@ -67,6 +72,102 @@ class DatabaseConfigUtil:
             print(message)
             return self.__get_db_config(self.__db_type_default)
 
+    def get_async_url(self) -> str:
+        """
+        Method responsible for retrieving the async database connection URL.
+
+        This method verifies the database type and constructs the corresponding
+        connection URL using an asyncio driver (asyncpg, aiomysql or aiosqlite).
+
+        Args:
+            None
+
+        Returns:
+            str: The async database connection URL.
+        """
+
+        try:
+            checked_database_type = self.check_database_type(self.__db_type)
+
+            return self.__get_db_config(checked_database_type, use_async=True)
+
+        except Exception as error:
+            message = (
+                f"Error in the process of creating the async database url: {error}"
+            )
+            print(message)
+            return self.__get_db_config(self.__db_type_default, use_async=True)
+
+    def get_engine_options(self, use_async: bool = False) -> dict:
+        """
+        Method responsible for retrieving the connection pool options of the engine.
+
+        This method starts from sensible defaults for the detected database type and
+        overrides them with the `DATABASE_POOL_*` environment variables that are set.
+
+        The aiosqlite dialect uses a `NullPool`, so the queue sizing options are
+        left out for the async SQLite engine.
+
+        Args:
+            use_async (bool, optional): Whether the options are for the async engine. Defaults to False.
+
+        Returns:
+            dict: Keyword arguments for `create_engine` / `create_async_engine`.
+        """
+
+        try:
+            checked_database_type = self.check_database_type(self.__db_type)
+        except Exception:
+            checked_database_type = DatabaseTypeEnum.SQLITE.value
+
+        _pool_defaults = {
+            "PostgreSQL": {
+                "pool_size": 10,
+                "max_overflow": 20,
+                "pool_timeout": 30,
+                "pool_recycle": 1800,
+                "pool_pre_ping": True,
+            },
+            "MySQL": {
+                "pool_size": 10,
+                "max_overflow": 20,
+                "pool_timeout": 30,
+                "pool_recycle": 3600,
+                "pool_pre_ping": True,
+            },
+            "SQLite": {
+                "pool_size": 5,
+                "max_overflow": 10,
+                "pool_timeout": 30,
+                "pool_recycle": -1,
+                "pool_pre_ping": False,
+            },
+        }
+
+        _engine_options = dict(
+            _pool_defaults.get(
+                checked_database_type, _pool_defaults["SQLite"]
+            )
+        )
+
+        _overrides = {
+            "pool_size": self.__db_pool_size,
+            "max_overflow": self.__db_pool_max_overflow,
+            "pool_timeout": self.__db_pool_timeout,
+            "pool_recycle": self.__db_pool_recycle,
+            "pool_pre_ping": self.__db_pool_pre_ping,
+        }
+
+        for option, value in _overrides.items():
+            if value is not None:
+                _engine_options[option] = value
+
+        if use_async and checked_database_type == DatabaseTypeEnum.SQLITE.value:
+            for option in ("pool_size", "max_overflow", "pool_timeout"):
+                _engine_options.pop(option, None)
+
+        return _engine_options
+
     def check_database_type(self, db_type: str | None) -> str:
         """
         Method responsible for validating and retrieving the correct database type.
@@ -93,7 +194,7 @@ class DatabaseConfigUtil:
         else:
             return DatabaseTypeEnum[db_type.upper()].value
 
-    def __get_db_config(self, db_type: str) -> str:
+    def __get_db_config(self, db_type: str, use_async: bool = False) -> str:
         """
         Private method responsible for constructing the database connection URL.
 
@@ -101,6 +202,7 @@ class DatabaseConfigUtil:
 
         Args:
             db_type (str): The database type (e.g., PostgreSQL, MySQL, SQLite).
+            use_async (bool, optional): Whether to use the asyncio driver. Defaults to False.
 
         Returns:
             str: The database connection string.
@@ -108,6 +210,15 @@ class DatabaseConfigUtil:
 
         _parse_url = f"{self.__db_user}:{self.__db_password}@{self.__db_host}:{self.__db_port}/{self.__db_name}"
 
+        if use_async:
+            _db_identifier_config = {
+                "PostgreSQL": f"postgresql+asyncpg://{_parse_url}",
+                "MySQL": f"mysql+aiomysql://{_parse_url}",
+                "SQLite": f"sqlite+aiosqlite:///{self.__api_name}.db",
+            }
+
+            return _db_identifier_config.get(db_type, "SQLite")
+
         _db_identifier_config = {
             "PostgreSQL": f"postgresql+psycopg2://{_parse_url}",
             "MySQL": f"mysql+pymysql://{_parse_url}",
@@ -42,6 +42,45 @@ class EnvConfig:
         self.__api_port: int = int(os.getenv("API_PORT", 5000))
         self.__api_version: str = str(os.getenv("API_VERSION", "v1"))
         self.__api_log_level: str = str(os.getenv("API_LOG_LEVEL", "DEBUG"))
+        self.__api_log_queue_size: int = int(
+            os.getenv("API_LOG_QUEUE_SIZE", 10000)
+        )
+        self.__api_log_overflow_policy: str = str(
+            os.getenv("API_LOG_OVERFLOW_POLICY", "drop")
+        ).strip().lower()
+        self.__api_log_sample_rate: int = int(
+            os.getenv("API_LOG_SAMPLE_RATE", 10)
+        )
+        self.__api_log_batch_size: int = int(
+            os.getenv("API_LOG_BATCH_SIZE", 100)
+        )
+        self.__api_log_rotation: str = str(
+            os.getenv("API_LOG_ROTATION", "size")
+        ).strip().lower()
+        self.__api_log_max_bytes: int = int(
+            os.getenv("API_LOG_MAX_BYTES", 104857600)
+        )
+        self.__api_log_rotation_when: str = str(
+            os.getenv("API_LOG_ROTATION_WHEN", "midnight")
+        ).strip()
+        self.__api_log_backup_count: int = int(
+            os.getenv("API_LOG_BACKUP_COUNT", 7)
+        )
+        self.__api_log_compress: bool = (
+            str(os.getenv("API_LOG_COMPRESS", "true")).strip().lower()
+            in ("1", "true", "yes")
+        )
+        self.__api_access_log_format: str = str(
+            os.getenv("API_ACCESS_LOG_FORMAT", "text")
+        ).strip().lower()
+        self.__api_access_log_sample_rates: dict[str, float] = dict(
+            (status_class.strip().lower(), float(rate))
+            for status_class, _, rate in (
+                entry.partition("=")
+                for entry in str(os.getenv("API_ACCESS_LOG_SAMPLE_RATES", "")).split(",")
+                if entry.strip()
+            )
+        )
         self.__api_user_administrator: str = str(
             os.getenv("API_USER_ADMINISTRATOR")
         )
@@ -70,6 +109,42 @@ class EnvConfig:
         self.__database_port: int = int(os.getenv("DATABASE_PORT"))  # type: ignore
         self.__database_user: str = str(os.getenv("DATABASE_USER"))
         self.__database_password: str = str(os.getenv("DATABASE_PASSWORD"))
+        self.__database_async: bool = (
+            str(os.getenv("DATABASE_ASYNC", "false")).strip().lower()
+            in ("1", "true", "yes")
+        )
+
+        # Database Pool Setup
+        __database_pool_pre_ping = os.getenv("DATABASE_POOL_PRE_PING")
+
+        self.__database_pool_size: int | None = self.__get_optional_int(
+            "DATABASE_POOL_SIZE"
+        )
+        self.__database_pool_max_overflow: int | None = self.__get_optional_int(
+            "DATABASE_POOL_MAX_OVERFLOW"
+        )
+        self.__database_pool_timeout: int | None = self.__get_optional_int(
+            "DATABASE_POOL_TIMEOUT"
+        )
+        self.__database_pool_recycle: int | None = self.__get_optional_int(
+            "DATABASE_POOL_RECYCLE"
+        )
+        self.__database_pool_pre_ping: bool | None = (
+            __database_pool_pre_ping.strip().lower() in ("1", "true", "yes")
+            if __database_pool_pre_ping
+            else None
+        )
+        self.__database_pool_log_interval_seconds: int = int(
+            os.getenv("DATABASE_POOL_LOG_INTERVAL_SECONDS", 60)
+        )
+
+        # Database Query Setup
+        self.__database_slow_query_ms: float = float(
+            os.getenv("DATABASE_SLOW_QUERY_MS", 200)
+        )
+        self.__database_query_repeat_threshold: int = int(
+            os.getenv("DATABASE_QUERY_REPEAT_THRESHOLD", 10)
+        )
 
         # JWT Setup
         self.__jwt_secret_key: str = str(os.getenv("SECRET_KEY", "CHANGE-ME"))
@@ -77,6 +152,109 @@ class EnvConfig:
         self.__jwt_access_token_expire_minutes: int = int(
             os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES")  # type: ignore
         )
+        self.__jwt_refresh_token_expire_days: int = int(
+            os.getenv("JWT_REFRESH_TOKEN_EXPIRE_DAYS", 7)
+        )
+        self.__jwt_private_key_path: str = str(
+            os.getenv("JWT_PRIVATE_KEY_PATH", "")
+        ).strip()
+        self.__jwt_key_id: str = str(os.getenv("JWT_KEY_ID", "")).strip()
+        self.__jwt_public_keys: dict[str, str] = dict(
+            (kid.strip(), path.strip())
+            for kid, _, path in (
+                entry.partition("=")
+                for entry in str(os.getenv("JWT_PUBLIC_KEYS", "")).split(",")
+                if entry.strip()
+            )
+        )
+
+        # Auth Setup
+        self.__auth_session_cache_max_size: int = int(
+            os.getenv("AUTH_SESSION_CACHE_MAX_SIZE", 10000)
+        )
+        self.__auth_session_cache_ttl_seconds: int = int(
+            os.getenv("AUTH_SESSION_CACHE_TTL_SECONDS", 30)
+        )
+        self.__auth_verify_max_concurrency: int = int(
+            os.getenv("AUTH_VERIFY_MAX_CONCURRENCY", 20)
+        )
+        self.__auth_mode: str = str(
+            os.getenv("AUTH_MODE", "stateful")
+        ).strip().lower()
+        self.__auth_revocation_refresh_seconds: int = int(
+            os.getenv("AUTH_REVOCATION_REFRESH_SECONDS", 5)
+        )
+        self.__auth_verify_cache_seconds: int = int(
+            os.getenv("AUTH_VERIFY_CACHE_SECONDS", 5)
+        )
+        self.__auth_permission_refresh_seconds: int = int(
+            os.getenv("AUTH_PERMISSION_REFRESH_SECONDS", 60)
+        )
+
+        # Password Hash Setup
+        self.__password_hash_method: str = str(
+            os.getenv("PASSWORD_HASH_METHOD", "pbkdf2")
+        ).strip().lower()
+        self.__password_hash_iterations: int = int(
+            os.getenv("PASSWORD_HASH_ITERATIONS", 1000000)
+        )
+        self.__password_hash_scrypt_n: int = int(
+            os.getenv("PASSWORD_HASH_SCRYPT_N", 32768)
+        )
+        self.__password_hash_workers: int = int(
+            os.getenv("PASSWORD_HASH_WORKERS", 2)
+        )
+        self.__password_hash_max_concurrency: int = int(
+            os.getenv("PASSWORD_HASH_MAX_CONCURRENCY", 8)
+        )
+
+        # Session Purge Setup
+        self.__session_purge_interval_seconds: int = int(
+            os.getenv("SESSION_PURGE_INTERVAL_SECONDS", 3600)
+        )
+        self.__session_retention_days: int = int(
+            os.getenv("SESSION_RETENTION_DAYS", 30)
+        )
+        self.__session_purge_batch_size: int = int(
+            os.getenv("SESSION_PURGE_BATCH_SIZE", 1000)
+        )
+        self.__session_purge_batch_sleep_seconds: float = float(
+            os.getenv("SESSION_PURGE_BATCH_SLEEP_SECONDS", 0.1)
+        )
+
+        # Metrics Setup
+        self.__metrics_enabled: bool = (
+            str(os.getenv("METRICS_ENABLED", "true")).strip().lower()
+            in ("1", "true", "yes")
+        )
+        self.__metrics_refresh_seconds: int = int(
+            os.getenv("METRICS_REFRESH_SECONDS", 15)
+        )
+        self.__prometheus_multiproc_dir: str = str(
+            os.getenv("PROMETHEUS_MULTIPROC_DIR", "")
+        ).strip()
+        self.__metrics_token: str = str(
+            os.getenv("METRICS_TOKEN", "")
+        ).strip()
+
+    @staticmethod
+    def __get_optional_int(name: str) -> int | None:
+        """
+        Private static method responsible for reading an optional integer environment variable.
+
+        Args:
+            name (str): The environment variable name.
+
+        Returns:
+            int | None: The integer value, or None if the variable is unset or empty.
+        """
+
+        value = os.getenv(name)
+
+        if value is None or not value.strip():
+            return None
+
+        return int(value)
 
     # API Setup
     @property
@@ -149,6 +327,163 @@ class EnvConfig:
 
         return self.__api_log_level
 
+    @property
+    def api_log_queue_size(self) -> int:
+        """
+        Property method responsible for returning the capacity of the log record queue.
+
+        Args:
+            None
+
+        Returns:
+            int: Maximum number of log records waiting to be written.
+        """
+
+        return self.__api_log_queue_size
+
+    @property
+    def api_log_overflow_policy(self) -> str:
+        """
+        Property method responsible for returning what happens to a log record when the queue is full.
+
+        Args:
+            None
+
+        Returns:
+            str: `drop`, `block` or `sample`.
+        """
+
+        return self.__api_log_overflow_policy
+
+    @property
+    def api_log_sample_rate(self) -> int:
+        """
+        Property method responsible for returning the sampling rate of the `sample` overflow policy.
+
+        Args:
+            None
+
+        Returns:
+            int: One record below WARNING out of this many is kept while the queue is congested.
+        """
+
+        return self.__api_log_sample_rate
+
+    @property
+    def api_log_batch_size(self) -> int:
+        """
+        Property method responsible for returning the maximum number of log records written per batch.
+
+        Args:
+            None
+
+        Returns:
+            int: Log records written before the handlers are flushed.
+        """
+
+        return self.__api_log_batch_size
+
+    @property
+    def api_log_rotation(self) -> str:
+        """
+        Property method responsible for returning the rotation mode of the log file.
+
+        Args:
+            None
+
+        Returns:
+            str: 'size', 'time', or 'none' (for rotation by an external tool such as logrotate).
+        """
+
+        return self.__api_log_rotation
+
+    @property
+    def api_log_max_bytes(self) -> int:
+        """
+        Property method responsible for returning the size at which the log file is rotated.
+
+        Args:
+            None
+
+        Returns:
+            int: Maximum size of the log file, in bytes, with 'size' rotation.
+        """
+
+        return self.__api_log_max_bytes
+
+    @property
+    def api_log_rotation_when(self) -> str:
+        """
+        Property method responsible for returning the interval at which the log file is rotated.
+
+        Args:
+            None
+
+        Returns:
+            str: The `TimedRotatingFileHandler` interval (e.g. 'midnight', 'H', 'W0'), with 'time' rotation.
+        """
+
+        return self.__api_log_rotation_when
+
+    @property
+    def api_log_backup_count(self) -> int:
+        """
+        Property method responsible for returning the number of rotated log files kept.
+
+        Args:
+            None
+
+        Returns:
+            int: Rotated log files kept before the oldest is deleted.
+        """
+
+        return self.__api_log_backup_count
+
+    @property
+    def api_log_compress(self) -> bool:
+        """
+        Property method responsible for returning whether rotated log files are compressed.
+
+        Args:
+            None
+
+        Returns:
+            bool: True if rotated log files are compressed with gzip, otherwise False.
+        """
+
+        return self.__api_log_compress
+
+    @property
+    def api_access_log_format(self) -> str:
+        """
+        Property method responsible for returning the format of the access log.
+
+        Args:
+            None
+
+        Returns:
+            str: `text` (one readable line per request) or `json` (one JSON object per request).
+        """
+
+        return self.__api_access_log_format
+
+    @property
+    def api_access_log_sample_rates(self) -> dict[str, float]:
+        """
+        Property method responsible for returning the access log sampling rate of each status class.
+
+        Parsed from `API_ACCESS_LOG_SAMPLE_RATES`, a comma-separated list of
+        `class=rate` entries (e.g. `2xx=0.1,3xx=0.1`). Missing classes are fully logged.
+
+        Args:
+            None
+
+        Returns:
+            dict[str, float]: The fraction, between 0 and 1, of requests logged per status class.
+        """
+
+        return self.__api_access_log_sample_rates
+
     @property
     def api_user_administrator(self) -> str:
         """
@@ -290,6 +625,134 @@ class EnvConfig:
 
         return self.__database_password
 
+    @property
+    def database_async(self) -> bool:
+        """
+        Property method responsible for returning whether the async database engine is enabled.
+
+        Args:
+            None
+
+        Returns:
+            bool: True if the async engine and sessions are enabled, otherwise False.
+        """
+
+        return self.__database_async
+
+    # Database Pool Setup
+    @property
+    def database_pool_size(self) -> int | None:
+        """
+        Property method responsible for returning the number of connections kept open in the pool.
+
+        Args:
+            None
+
+        Returns:
+            int | None: Pool size, or None to use the dialect default.
+        """
+
+        return self.__database_pool_size
+
+    @property
+    def database_pool_max_overflow(self) -> int | None:
+        """
+        Property method responsible for returning the number of connections allowed above the pool size.
+
+        Args:
+            None
+
+        Returns:
+            int | None: Pool max overflow, or None to use the dialect default.
+        """
+
+        return self.__database_pool_max_overflow
+
+    @property
+    def database_pool_timeout(self) -> int | None:
+        """
+        Property method responsible for returning the seconds to wait for a connection before failing.
+
+        Args:
+            None
+
+        Returns:
+            int | None: Pool timeout, or None to use the dialect default.
+        """
+
+        return self.__database_pool_timeout
+
+    @property
+    def database_pool_recycle(self) -> int | None:
+        """
+        Property method responsible for returning the maximum age, in seconds, of a pooled connection.
+
+        Args:
+            None
+
+        Returns:
+            int | None: Pool recycle time, or None to use the dialect default.
+        """
+
+        return self.__database_pool_recycle
+
+    @property
+    def database_pool_pre_ping(self) -> bool | None:
+        """
+        Property method responsible for returning whether connections are tested before being checked out.
+
+        Args:
+            None
+
+        Returns:
+            bool | None: Pool pre-ping flag, or None to use the dialect default.
+        """
+
+        return self.__database_pool_pre_ping
+
+    @property
+    def database_pool_log_interval_seconds(self) -> int:
+        """
+        Property method responsible for returning the interval, in seconds, between pool status log lines.
+
+        Args:
+            None
+
+        Returns:
+            int: Pool status log interval (0 disables it).
+        """
+
+        return self.__database_pool_log_interval_seconds
+
+    # Database Query Setup
+    @property
+    def database_slow_query_ms(self) -> float:
+        """
+        Property method responsible for returning the duration, in milliseconds, above which a query is logged as slow.
+
+        Args:
+            None
+
+        Returns:
+            float: Slow query threshold (0 disables it).
+        """
+
+        return self.__database_slow_query_ms
+
+    @property
+    def database_query_repeat_threshold(self) -> int:
+        """
+        Property method responsible for returning how many times a request may run the same statement.
+
+        Args:
+            None
+
+        Returns:
+            int: Repetitions of a statement in one request above which a warning is logged (0 disables it).
+        """
+
+        return self.__database_query_repeat_threshold
+
     # JWT Setup
     @property
     def jwt_secret_key(self) -> str:
@@ -332,3 +795,348 @@ class EnvConfig:
         """
 
         return self.__jwt_access_token_expire_minutes
+
+    @property
+    def jwt_private_key_path(self) -> str:
+        """
+        Property method responsible for returning the path of the PEM private key used to sign tokens.
+
+        Args:
+            None
+
+        Returns:
+            str: Private key path, required by the asymmetric algorithms (RS*, ES*, EdDSA).
+        """
+
+        return self.__jwt_private_key_path
+
+    @property
+    def jwt_key_id(self) -> str:
+        """
+        Property method responsible for returning the key ID (`kid`) of the signing key.
+
+        Args:
+            None
+
+        Returns:
+            str: Signing key ID.
+        """
+
+        return self.__jwt_key_id
+
+    @property
+    def jwt_public_keys(self) -> dict[str, str]:
+        """
+        Property method responsible for returning the previous public keys still accepted for verification.
+
+        Parsed from `JWT_PUBLIC_KEYS`, a comma-separated list of `kid=path` entries.
+
+        Args:
+            None
+
+        Returns:
+            dict[str, str]: The PEM public key path of each key ID.
+        """
+
+        return self.__jwt_public_keys
+
+    @property
+    def jwt_refresh_token_expire_days(self) -> int:
+        """
+        Property method responsible for returning the refresh token lifetime in days.
+
+        The lifetime counts from login; rotating the refresh token does not extend it.
+
+        Args:
+            None
+
+        Returns:
+            int: Refresh token lifetime in days.
+        """
+
+        return self.__jwt_refresh_token_expire_days
+
+    # Auth Setup
+    @property
+    def auth_session_cache_max_size(self) -> int:
+        """
+        Property method responsible for returning the maximum number of sessions kept in the session cache.
+
+        Args:
+            None
+
+        Returns:
+            int: Session cache maximum size.
+        """
+
+        return self.__auth_session_cache_max_size
+
+    @property
+    def auth_session_cache_ttl_seconds(self) -> int:
+        """
+        Property method responsible for returning the time to live, in seconds, of a session cache entry.
+
+        Args:
+            None
+
+        Returns:
+            int: Session cache entry time to live.
+        """
+
+        return self.__auth_session_cache_ttl_seconds
+
+    @property
+    def auth_verify_max_concurrency(self) -> int:
+        """
+        Property method responsible for returning the maximum number of token verifications running concurrently in worker threads.
+
+        Args:
+            None
+
+        Returns:
+            int: Token verification concurrency limit.
+        """
+
+        return self.__auth_verify_max_concurrency
+
+    @property
+    def auth_mode(self) -> str:
+        """
+        Property method responsible for returning the token validation mode.
+
+        Args:
+            None
+
+        Returns:
+            str: `stateful` (session lookup on every request) or `stateless`
+                (signature, expiry and revocation list only).
+        """
+
+        return self.__auth_mode
+
+    @property
+    def auth_revocation_refresh_seconds(self) -> int:
+        """
+        Property method responsible for returning the interval, in seconds, between revocation list refreshes.
+
+        Args:
+            None
+
+        Returns:
+            int: Revocation list refresh interval, used in stateless mode.
+        """
+
+        return self.__auth_revocation_refresh_seconds
+
+    @property
+    def auth_verify_cache_seconds(self) -> int:
+        """
+        Property method responsible for returning how long, in seconds, a gateway may cache a token verification.
+
+        Args:
+            None
+
+        Returns:
+            int: The `max-age` of the verification endpoint responses (0 disables caching).
+        """
+
+        return self.__auth_verify_cache_seconds
+
+    @property
+    def auth_permission_refresh_seconds(self) -> int:
+        """
+        Property method responsible for returning the interval, in seconds, between permission cache refreshes.
+
+        Args:
+            None
+
+        Returns:
+            int: Permission cache refresh interval (0 disables the scheduled refresh).
+        """
+
+        return self.__auth_permission_refresh_seconds
+
+    # Password Hash Setup
+    @property
+    def password_hash_method(self) -> str:
+        """
+        Property method responsible for returning the password hashing algorithm.
+
+        Args:
+            None
+
+        Returns:
+            str: Password hash method ('pbkdf2' or 'scrypt').
+        """
+
+        return self.__password_hash_method
+
+    @property
+    def password_hash_iterations(self) -> int:
+        """
+        Property method responsible for returning the PBKDF2 iteration count.
+
+        Args:
+            None
+
+        Returns:
+            int: PBKDF2 iterations.
+        """
+
+        return self.__password_hash_iterations
+
+    @property
+    def password_hash_scrypt_n(self) -> int:
+        """
+        Property method responsible for returning the scrypt CPU/memory cost parameter.
+
+        Args:
+            None
+
+        Returns:
+            int: scrypt N parameter.
+        """
+
+        return self.__password_hash_scrypt_n
+
+    @property
+    def password_hash_workers(self) -> int:
+        """
+        Property method responsible for returning the number of password hashing processes.
+
+        Args:
+            None
+
+        Returns:
+            int: Password hashing worker processes (0 hashes in the calling thread).
+        """
+
+        return self.__password_hash_workers
+
+    @property
+    def password_hash_max_concurrency(self) -> int:
+        """
+        Property method responsible for returning the maximum number of concurrent password hashes.
+
+        Args:
+            None
+
+        Returns:
+            int: Password hashing concurrency limit.
+        """
+
+        return self.__password_hash_max_concurrency
+
+    # Session Purge Setup
+    @property
+    def session_purge_interval_seconds(self) -> int:
+        """
+        Property method responsible for returning the interval, in seconds, between session purge runs.
+
+        Args:
+            None
+
+        Returns:
+            int: Session purge interval (0 disables it).
+        """
+
+        return self.__session_purge_interval_seconds
+
+    @property
+    def session_retention_days(self) -> int:
+        """
+        Property method responsible for returning how many days expired sessions are kept.
+
+        Args:
+            None
+
+        Returns:
+            int: Session retention period, in days.
+        """
+
+        return self.__session_retention_days
+
+    @property
+    def session_purge_batch_size(self) -> int:
+        """
+        Property method responsible for returning the number of sessions deleted per purge batch.
+
+        Args:
+            None
+
+        Returns:
+            int: Session purge batch size.
+        """
+
+        return self.__session_purge_batch_size
+
+    @property
+    def session_purge_batch_sleep_seconds(self) -> float:
+        """
+        Property method responsible for returning the pause, in seconds, between purge batches.
+
+        Args:
+            None
+
+        Returns:
+            float: Session purge pause between batches.
+        """
+
+        return self.__session_purge_batch_sleep_seconds
+
+    # Metrics Setup
+    @property
+    def metrics_enabled(self) -> bool:
+        """
+        Property method responsible for returning whether the metrics endpoint is enabled.
+
+        Args:
+            None
+
+        Returns:
+            bool: True if requests are measured and `/metrics` is served, otherwise False.
+        """
+
+        return self.__metrics_enabled
+
+    @property
+    def metrics_refresh_seconds(self) -> int:
+        """
+        Property method responsible for returning the interval, in seconds, between metrics gauge refreshes.
+
+        Args:
+            None
+
+        Returns:
+            int: Interval at which each worker publishes its pool, cache and queue gauges.
+        """
+
+        return self.__metrics_refresh_seconds
+
+    @property
+    def prometheus_multiproc_dir(self) -> str:
+        """
+        Property method responsible for returning the directory shared by the workers for metrics.
+
+        Args:
+            None
+
+        Returns:
+            str: The multiprocess metrics directory, or an empty string in single-process mode.
+        """
+
+        return self.__prometheus_multiproc_dir
+
+    @property
+    def metrics_token(self) -> str:
+        """
+        Property method responsible for returning the bearer token required by the metrics endpoint.
+
+        Args:
+            None
+
+        Returns:
+            str: The metrics token, or an empty string if `/metrics` requires a user token.
+        """
+
+        return self.__metrics_token
@@ -2,32 +2,474 @@
 
 # flake8: noqa: E501
 
+import atexit
+import gzip
 import logging
 import os
+import queue
+import shutil
+import signal
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
 
 from colorlog import ColoredFormatter
 
 from src.core.configurations import EnvConfig
 
 
-class FlushingStreamHandler(logging.StreamHandler):
+class BatchWriteMixin:
     """
-    Custom stream handler that forces a flush after every log emission.
+    Mixin for stream handlers that write log records without flushing them.
 
-    This handler ensures that all log records are immediately written
-    to the output stream (such as stdout), avoiding delays caused by buffering.
-    It is especially useful in asynchronous or background task scenarios
-    where log messages may not appear promptly without an explicit flush.
+    `logging.StreamHandler` flushes its stream after every record. Handlers using
+    this mixin only write to the (buffered) stream, and `BatchQueueListener`
+    flushes them once per batch of records.
     """
-    def emit(self, record):
+
+    def emit(self, record: logging.LogRecord) -> None:
         """
-        Emit a log record and flush the output stream immediately.
+        Write a log record to the stream without flushing it.
 
         Args:
             record (LogRecord): The log record to be written.
         """
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BatchStreamHandler(BatchWriteMixin, logging.StreamHandler):
+    """
+    Console handler whose flush is deferred to the end of each batch.
+    """
+
+
+class BatchFileMixin(BatchWriteMixin):
+    """
+    Mixin for file handlers written in batches, whose file can be reopened.
+    """
+
+    def reopen(self) -> None:
+        """
+        Close the log file, so the next record opens it again at its path.
+
+        Used after the file was moved by an external tool such as logrotate.
+        """
+        self.acquire()
+        try:
+            if self.stream is not None:
+                self.stream.flush()
+                self.stream.close()
+                self.stream = None
+        finally:
+            self.release()
+
+
+class BatchFileHandler(BatchFileMixin, logging.FileHandler):
+    """
+    File handler whose flush is deferred to the end of each batch.
+    """
+
+
+class BatchRotationMixin(BatchFileMixin, ABC):
+    """
+    Mixin for rotating file handlers written in batches.
+
+    The rollover is checked once per batch, when the handler is flushed, instead
+    of before every record (the size check of `RotatingFileHandler` seeks the file
+    for each record), so a file may exceed its limit by one batch.
+
+    With `compress`, rotated files are compressed with gzip (`.gz` suffix) by a
+    background thread, and only the rename happens in the listener thread. A
+    rollover waits for the compression of the previous one, so rotated files are
+    never shifted while being compressed.
+
+    Like the stock rotating handlers, a failed rollover or compression is passed
+    to `handleError` (written to stderr) and never stops the listener thread. A
+    rotated file that could not be compressed is kept uncompressed.
+
+    Subclasses decide when the file is rotated by implementing `rollover_due`.
+
+    Rotation is done in-process, so it is only safe when a single process writes
+    the file: uvicorn workers sharing one log file would each rotate it under the
+    others. With several workers, use `API_LOG_ROTATION=none` and rotate the file
+    with logrotate, which sends SIGHUP so that every worker reopens it.
+    """
+
+    def __init__(self, *args, compress: bool = False, **kwargs) -> None:
+        """
+        Constructor method for BatchRotationMixin.
+
+        Args:
+            *args: The arguments of the rotating file handler.
+            compress (bool, optional): Whether to compress rotated files. Defaults to False.
+            **kwargs: The keyword arguments of the rotating file handler.
+        """
+        super().__init__(*args, **kwargs)
+        self.__compressor: ThreadPoolExecutor | None = None
+        self.__compression: Future | None = None
+
+        if compress:
+            self.__compressor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="LogCompressor"
+            )
+            self.namer = self.__compressed_name
+            self.rotator = self.__rotate_compressed
+
+    @abstractmethod
+    def rollover_due(self) -> bool:
+        """
+        Whether the log file must be rotated, checked after each batch is flushed.
+
+        Called from the listener thread with the stream open.
+        """
+
+    def flush(self) -> None:
+        """
+        Flush the stream, then rotate the log file if it is due.
+        """
+        super().flush()
+
+        try:
+            if self.stream is not None and self.rollover_due():
+                self.doRollover()
+        except Exception:
+            self.handleError(
+                logging.makeLogRecord({"msg": f"Rollover of the log file {self.baseFilename} failed."})
+            )
+
+    def doRollover(self) -> None:
+        """
+        Rotate the log file once the previous compression is done.
+
+        The compression reports its own errors, so waiting for it never raises.
+        """
+        if self.__compression is not None:
+            self.__compression.result()
+            self.__compression = None
+
+        super().doRollover()
+
+    def close(self) -> None:
+        """
+        Close the log file and wait for the pending compression.
+        """
+        super().close()
+
+        if self.__compressor is not None:
+            self.__compressor.shutdown(wait=True)
+
+    @staticmethod
+    def __compressed_name(name: str) -> str:
+        """
+        Name of a rotated log file once compressed.
+        """
+        return f"{name}.gz"
+
+    def __rotate_compressed(self, source: str, dest: str) -> None:
+        """
+        Move the log file aside and compress it to `dest` in the background.
+        """
+        rotated = dest.removesuffix(".gz")
+        os.replace(source, rotated)
+        self.__compression = self.__compressor.submit(self.__compress, rotated, dest)  # type: ignore
+
+    def __compress(self, source: str, dest: str) -> None:
+        """
+        Compress a rotated log file with gzip and remove the original.
+
+        On failure, the partial archive is removed, the original is kept, and the
+        error is passed to `handleError` rather than logged, since the listener
+        may be waiting for this compression while the log queue is full.
+        """
+        try:
+            with open(source, "rb") as source_file, gzip.open(dest, "wb") as dest_file:
+                shutil.copyfileobj(source_file, dest_file)
+            os.remove(source)
+        except Exception:
+            self.handleError(
+                logging.makeLogRecord({"msg": f"Compression of the rotated log file {source} failed."})
+            )
+
+            try:
+                if os.path.exists(source) and os.path.exists(dest):
+                    os.remove(dest)
+            except OSError:
+                pass
+
+
+class BatchRotatingFileHandler(BatchRotationMixin, RotatingFileHandler):
+    """
+    File handler rotated by size, whose flush is deferred to the end of each batch.
+    """
+
+    def rollover_due(self) -> bool:
+        """
+        Whether the log file reached `maxBytes`.
+        """
+        return self.maxBytes > 0 and self.stream.tell() >= self.maxBytes
+
+
+class BatchTimedRotatingFileHandler(BatchRotationMixin, TimedRotatingFileHandler):
+    """
+    File handler rotated at time intervals, whose flush is deferred to the end of each batch.
+    """
+
+    def rollover_due(self) -> bool:
+        """
+        Whether the current interval is over.
+        """
+        return time.time() >= self.rolloverAt
+
+
+class OverflowQueueHandler(QueueHandler):
+    """
+    Queue handler that enqueues log records into a bounded queue without blocking by default.
+
+    This is the only handler of the root logger, so logging from a request only
+    formats the message and puts the record in the queue. What happens when the
+    queue is full depends on the overflow policy:
+
+        - 'drop': the record is discarded and counted.
+        - 'block': the caller waits for room in the queue (no record is lost).
+        - 'sample': like 'drop', and once the queue is half full only one record
+          below WARNING out of `sample_rate` is kept.
+
+    Class Args:
+        log_queue (queue.Queue): The bounded queue read by the listener.
+        policy (str): The overflow policy.
+        sample_rate (int): The sampling rate of the 'sample' policy.
+    """
+
+    def __init__(self, log_queue: queue.Queue, policy: str, sample_rate: int) -> None:
+        """
+        Constructor method for OverflowQueueHandler.
+
+        Args:
+            log_queue (queue.Queue): The bounded queue read by the listener.
+            policy (str): The overflow policy ('drop', 'block' or 'sample').
+            sample_rate (int): The sampling rate of the 'sample' policy.
+        """
+        super().__init__(log_queue)
+        self.__policy: str = policy
+        self.__sample_rate: int = max(sample_rate, 1)
+        self.__congestion_size: int = max(log_queue.maxsize // 2, 1)
+        self.__sample_index: int = 0
+        self.__dropped: int = 0
+        self.__sampled: int = 0
+
+    @property
+    def policy(self) -> str:
+        """
+        The overflow policy.
+        """
+        return self.__policy
+
+    @property
+    def dropped(self) -> int:
+        """
+        Number of records discarded because the queue was full.
+        """
+        return self.__dropped
+
+    @property
+    def sampled(self) -> int:
+        """
+        Number of records discarded by sampling while the queue was congested.
+        """
+        return self.__sampled
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Enqueue a log record, unless it is sampled out.
+
+        Called with the handler lock held, which also guards the counters.
+
+        Args:
+            record (LogRecord): The log record to be enqueued.
+        """
+        if (
+            self.__policy == "sample" and
+            record.levelno < logging.WARNING and
+            self.queue.qsize() >= self.__congestion_size
+        ):
+            self.__sample_index += 1
+            if self.__sample_index % self.__sample_rate:
+                self.__sampled += 1
+                return
+
         super().emit(record)
-        self.flush()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Put a prepared log record in the queue according to the overflow policy.
+
+        Args:
+            record (LogRecord): The log record to be enqueued.
+        """
+        if self.__policy == "block":
+            self.queue.put(record)
+            return
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.__dropped += 1
+
+
+class BatchQueueListener(QueueListener):
+    """
+    Queue listener that writes log records in batches from a background thread.
+
+    Up to `batch_size` waiting records are taken from the queue at once, written
+    by the handlers, and the handlers are then flushed once. Records dropped by
+    the queue handler since the previous batch are reported with a warning.
+
+    Class Args:
+        log_queue (queue.Queue): The queue filled by the queue handler.
+        handlers (logging.Handler): The handlers writing the records.
+        queue_handler (OverflowQueueHandler): The handler filling the queue.
+        batch_size (int): Maximum number of records written per batch.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        *handlers: logging.Handler,
+        queue_handler: OverflowQueueHandler,
+        batch_size: int
+    ) -> None:
+        """
+        Constructor method for BatchQueueListener.
+
+        Args:
+            log_queue (queue.Queue): The queue filled by the queue handler.
+            *handlers (logging.Handler): The handlers writing the records.
+            queue_handler (OverflowQueueHandler): The handler filling the queue.
+            batch_size (int): Maximum number of records written per batch.
+        """
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.__queue_handler: OverflowQueueHandler = queue_handler
+        self.__batch_size: int = max(batch_size, 1)
+        self.__reported_dropped: int = 0
+        self.__reopen_requested = threading.Event()
+
+    def request_reopen(self) -> None:
+        """
+        Reopen the log files before the next batch.
+
+        Safe to call from a signal handler: the files are reopened by the listener thread.
+        """
+        self.__reopen_requested.set()
+
+    def handle(self, record: logging.LogRecord) -> None:
+        """
+        Pass a log record to each handler, isolating the handlers from each other's errors.
+
+        Args:
+            record (LogRecord): The log record to be written.
+        """
+        record = self.prepare(record)
+
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                try:
+                    handler.handle(record)
+                except Exception:
+                    handler.handleError(record)
+
+    def enqueue_sentinel(self) -> None:
+        """
+        Put the stop sentinel in the queue, waiting for room if it is full.
+        """
+        self.queue.put(self._sentinel)
+
+    def _monitor(self) -> None:
+        """
+        Write the queued records in batches until the stop sentinel is received.
+
+        Handler errors are passed to `handleError`, so the thread keeps draining
+        the queue whatever happens to a handler.
+        """
+        while True:
+            batch = [self.dequeue(True)]
+
+            while len(batch) < self.__batch_size:
+                try:
+                    batch.append(self.dequeue(False))
+                except queue.Empty:
+                    break
+
+            if self.__reopen_requested.is_set():
+                self.__reopen_requested.clear()
+                self.__reopen()
+
+            stop = False
+
+            for record in batch:
+                if record is self._sentinel:
+                    stop = True
+                else:
+                    self.handle(record)
+                self.queue.task_done()
+
+            self.__report_dropped()
+
+            for handler in self.handlers:
+                try:
+                    handler.flush()
+                except Exception:
+                    handler.handleError(
+                        logging.makeLogRecord({"msg": "Flush of the log handler failed."})
+                    )
+
+            if stop:
+                break
+
+    def __reopen(self) -> None:
+        """
+        Reopen the log files of the file handlers.
+        """
+        for handler in self.handlers:
+            if isinstance(handler, BatchFileMixin):
+                try:
+                    handler.reopen()
+                except Exception:
+                    handler.handleError(
+                        logging.makeLogRecord({"msg": "Reopen of the log file failed."})
+                    )
+
+    def __report_dropped(self) -> None:
+        """
+        Write a warning with the number of records dropped since the previous report.
+        """
+        dropped = self.__queue_handler.dropped
+
+        if dropped > self.__reported_dropped:
+            self.handle(
+                logging.makeLogRecord(
+                    {
+                        "name": "root",
+                        "levelno": logging.WARNING,
+                        "levelname": "WARNING",
+                        "msg": f"Log queue full: {dropped - self.__reported_dropped} log records dropped.",
+                    }
+                )
+            )
+            self.__reported_dropped = dropped
 
 
 class LoggerConfig:
@@ -37,10 +479,33 @@ class LoggerConfig:
     This class sets up a logger that writes logs to both a console (with colors)
     and a log file. The log level can be determined from an environment variable.
 
+    Logging never writes from the calling thread: the root logger only puts records
+    in a bounded queue (`API_LOG_QUEUE_SIZE`, full queue handled according to
+    `API_LOG_OVERFLOW_POLICY`), and a background listener writes them to the
+    console and the file in batches of up to `API_LOG_BATCH_SIZE`, with one flush
+    per batch. Queued records are written when the process exits.
+
+    The log file is rotated by size (`API_LOG_MAX_BYTES`) or at time intervals
+    (`API_LOG_ROTATION_WHEN`) according to `API_LOG_ROTATION`, keeping
+    `API_LOG_BACKUP_COUNT` rotated files, compressed in the background when
+    `API_LOG_COMPRESS` is set. With `API_LOG_ROTATION=none` the file is left to an
+    external tool such as logrotate, and is reopened when the process receives SIGHUP.
+
+    Size and time rotation are only safe with a single process writing the file.
+    When several uvicorn workers share `API_LOG_ROTATION=size` or `time`, each
+    worker rotates the file on its own and renames it under the others; use
+    `API_LOG_ROTATION=none` with logrotate (and its SIGHUP reopen) instead.
+
     Class Args:
         None
     """
 
+    __overflow_policies = ("drop", "block", "sample")
+
+    __rotations = ("size", "time", "none")
+
+    __queue_handler: OverflowQueueHandler | None = None
+
     def __init__(self) -> None:
         """
         Constructor method for LoggerUtil.
@@ -53,6 +518,15 @@ class LoggerConfig:
 
         self.__api_name: str = EnvConfig().api_name
         self.__api_log_level: str = EnvConfig().api_log_level
+        self.__api_log_queue_size: int = EnvConfig().api_log_queue_size
+        self.__api_log_overflow_policy: str = EnvConfig().api_log_overflow_policy
+        self.__api_log_sample_rate: int = EnvConfig().api_log_sample_rate
+        self.__api_log_batch_size: int = EnvConfig().api_log_batch_size
+        self.__api_log_rotation: str = EnvConfig().api_log_rotation
+        self.__api_log_max_bytes: int = EnvConfig().api_log_max_bytes
+        self.__api_log_rotation_when: str = EnvConfig().api_log_rotation_when
+        self.__api_log_backup_count: int = EnvConfig().api_log_backup_count
+        self.__api_log_compress: bool = EnvConfig().api_log_compress
 
         self.__valid_log_levels = [
             "DEBUG",
@@ -99,15 +573,41 @@ class LoggerConfig:
             _level = self.__get_log_level_variable()
 
             # File handler and console handler configuration
-            _file_handler = logging.FileHandler(_log_file)
+            _file_handler = self.__get_file_handler(_log_file)
             _file_handler.setFormatter(_file_formatter)
 
-            _stream_handler = FlushingStreamHandler()
+            _stream_handler = BatchStreamHandler()
             _stream_handler.setFormatter(_stream_formatter)
 
+            # Queue between the application threads and the writing thread
+            _log_queue: queue.Queue = queue.Queue(maxsize=max(self.__api_log_queue_size, 1))
+            _queue_handler = OverflowQueueHandler(
+                _log_queue,
+                self.__get_overflow_policy_variable(),
+                self.__api_log_sample_rate,
+            )
+            _listener = BatchQueueListener(
+                _log_queue,
+                _file_handler,
+                _stream_handler,
+                queue_handler=_queue_handler,
+                batch_size=self.__api_log_batch_size,
+            )
+            _listener.start()
+            atexit.register(_listener.stop)
+
+            # External rotation (logrotate): reopen the log file on SIGHUP
+            if hasattr(signal, "SIGHUP"):
+                try:
+                    signal.signal(signal.SIGHUP, lambda signum, frame: _listener.request_reopen())
+                except ValueError:
+                    # Signal handlers can only be set from the main thread
+                    pass
+
+            LoggerConfig.__queue_handler = _queue_handler
+
             self.__logger.setLevel(_level)
-            self.__logger.addHandler(_file_handler)
-            self.__logger.addHandler(_stream_handler)
+            self.__logger.addHandler(_queue_handler)
 
             if _level != "DEBUG":
                 logging.getLogger("apscheduler").handlers = []
@@ -158,6 +658,101 @@ class LoggerConfig:
 
         return obtained_log_level
 
+    def __get_overflow_policy_variable(self) -> str:
+        """
+        Private method responsible for obtaining the log queue overflow policy from the configuration.
+
+        If the value is invalid, it defaults to 'drop'.
+
+        Args:
+            None
+
+        Returns:
+            str: The overflow policy ('drop', 'block' or 'sample').
+        """
+
+        default_policy = "drop"
+
+        YELLOW = "\033[33m"
+        RESET = "\033[0m"
+
+        if self.__api_log_overflow_policy not in self.__overflow_policies:
+            print(
+                f"{YELLOW}LOG_OVERFLOW_POLICY -> Invalid value for 'API_LOG_OVERFLOW_POLICY' found: {self.__api_log_overflow_policy}! Using the default value '{default_policy}'!{RESET}"
+            )
+            return default_policy
+
+        return self.__api_log_overflow_policy
+
+    def __get_file_handler(self, log_file: str) -> BatchFileMixin:
+        """
+        Private method responsible for creating the log file handler from the rotation configuration.
+
+        If the rotation mode is invalid, it defaults to 'size'.
+
+        Args:
+            log_file (str): The path of the log file.
+
+        Returns:
+            BatchFileMixin: The file handler.
+        """
+
+        default_rotation = "size"
+        rotation = self.__api_log_rotation
+
+        YELLOW = "\033[33m"
+        RESET = "\033[0m"
+
+        if rotation not in self.__rotations:
+            print(
+                f"{YELLOW}LOG_ROTATION -> Invalid value for 'API_LOG_ROTATION' found: {self.__api_log_rotation}! Using the default value '{default_rotation}'!{RESET}"
+            )
+            rotation = default_rotation
+
+        if rotation == "none":
+            return BatchFileHandler(log_file)
+
+        if rotation == "time":
+            return BatchTimedRotatingFileHandler(
+                log_file,
+                when=self.__api_log_rotation_when,
+                backupCount=self.__api_log_backup_count,
+                compress=self.__api_log_compress,
+            )
+
+        return BatchRotatingFileHandler(
+            log_file,
+            maxBytes=self.__api_log_max_bytes,
+            backupCount=self.__api_log_backup_count,
+            compress=self.__api_log_compress,
+        )
+
+    @classmethod
+    def stats(cls) -> dict[str, int | str]:
+        """
+        Class method responsible for returning the log queue gauges and counters.
+
+        Args:
+            None
+
+        Returns:
+            dict[str, int | str]: The queued records, queue capacity, overflow policy,
+                and the records dropped and sampled out since startup.
+        """
+
+        queue_handler = cls.__queue_handler
+
+        if queue_handler is None:
+            return {}
+
+        return {
+            "queued": queue_handler.queue.qsize(),
+            "capacity": queue_handler.queue.maxsize,
+            "policy": queue_handler.policy,
+            "dropped": queue_handler.dropped,
+            "sampled": queue_handler.sampled,
+        }
+
     @property
     def logger(self) -> logging.Logger:
         """
@@ -0,0 +1,6 @@
+# /src/core/dependencies/__init__.py
+
+# flake8: noqa: E501, F401
+
+from src.core.dependencies.metrics import MetricsTokenDependency, require_metrics_token
+from src.core.dependencies.permission import PermissionDependency, require_permission
\ No newline at end of file
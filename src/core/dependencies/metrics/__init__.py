@@ -0,0 +1,80 @@
+# /src/core/dependencies/metrics/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+import hmac
+from typing import Any
+
+from fastapi import Depends, Request
+
+# Core
+from src.core.configurations.environment import EnvConfig
+from src.core.exceptions import UnauthorizedTokenException
+
+# Utils
+from src.utils import log
+
+
+class MetricsTokenDependency:
+    """
+    Class responsible for checking the bearer token of the metrics scraper.
+
+    When `METRICS_TOKEN` is set, `/metrics` is skipped by `AuthMiddleware` and only
+    answers requests carrying `Authorization: Bearer <METRICS_TOKEN>`, so a scraper
+    does not need a user access token. When it is empty, `/metrics` goes through
+    `AuthMiddleware` like any other route and this dependency has nothing to check.
+
+    Class Args:
+        None
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor method for MetricsTokenDependency.
+
+        Args:
+            None
+        """
+
+        self.__token: bytes = EnvConfig().metrics_token.encode()
+
+    def __call__(self, request: Request) -> None:
+        """
+        Public method responsible for checking the metrics token of the request.
+
+        Args:
+            request (Request): The incoming request.
+
+        Returns:
+            None
+
+        Raises:
+            UnauthorizedTokenException: If the metrics token is missing or does not match.
+        """
+
+        if not self.__token:
+            return
+
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+
+        if scheme.lower() != "bearer" or not hmac.compare_digest(token.strip().encode(), self.__token):
+            log.warning(f"Metrics token missing or invalid for {request.url.path}!")
+            raise UnauthorizedTokenException("Metrics token missing or invalid!")
+
+
+def require_metrics_token() -> Any:
+    """
+    Standalone function responsible for declaring that a route requires the metrics token.
+
+    Usage:
+        router.get(path="/metrics", dependencies=[require_metrics_token()])
+
+    Args:
+        None
+
+    Returns:
+        Any: The FastAPI dependency checking the metrics token.
+    """
+
+    return Depends(MetricsTokenDependency())
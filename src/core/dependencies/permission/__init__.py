@@ -0,0 +1,95 @@
+# /src/core/dependencies/permission/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+from typing import Any
+
+from fastapi import Depends, Request
+
+# Core
+from src.core.exceptions import (
+    ForbiddenException,
+    UnauthorizedTokenException
+)
+
+# Domain
+from src.domain.enums import UserRoleEnum
+
+# Utils
+from src.utils import (
+    log,
+    permission_cache
+)
+
+
+class PermissionDependency:
+    """
+    Class responsible for enforcing the permissions required by a route.
+
+    The role is read from the token payload verified by `AuthMiddleware` and
+    checked against the in-memory permission cache, so authorization never
+    queries the database. The super administrator role is granted every permission.
+
+    Class Args:
+        permissions (str): The permissions required, all of them, to call the route.
+    """
+
+    def __init__(self, *permissions: str) -> None:
+        """
+        Constructor method for PermissionDependency.
+
+        Args:
+            *permissions (str): The permissions required to call the route.
+        """
+
+        self.__permissions: tuple[str, ...] = tuple(
+            getattr(permission, "value", permission) for permission in permissions
+        )
+
+    def __call__(self, request: Request) -> None:
+        """
+        Public method responsible for checking the permissions of the authenticated user.
+
+        Args:
+            request (Request): The incoming request carrying the verified token payload.
+
+        Returns:
+            None
+
+        Raises:
+            UnauthorizedTokenException: If the request was not authenticated.
+            ForbiddenException: If the role of the user lacks a required permission.
+        """
+
+        payload = getattr(request.state, "token_payload", None)
+
+        if not payload:
+            raise UnauthorizedTokenException("Token missing or invalid!")
+
+        role_id = payload.get("role")
+
+        if role_id == UserRoleEnum.SUPER_ADMINISTRATOR:
+            return
+
+        for permission in self.__permissions:
+            if not permission_cache.has_permission(role_id, permission):
+                log.warning(f"Role {role_id} lacks the '{permission}' permission for {request.url.path}!")
+                raise ForbiddenException(f"Permission '{permission}' required!")
+
+
+def require_permission(*permissions: str) -> Any:
+    """
+    Standalone function responsible for declaring the permissions required by a route.
+
+    Usage:
+        router.get(path="", dependencies=[require_permission(UserPermissionEnum.READ)])
+
+    Args:
+        *permissions (str): The permissions required, all of them, to call the route.
+
+    Returns:
+        Any: The FastAPI dependency enforcing the permissions.
+    """
+
+    return Depends(PermissionDependency(*permissions))
@@ -145,4 +145,31 @@ class InvalidTokenOrIncorrectPayloadException(BaseHTTPException):
             status_code (int, optional): The HTTP status code to return (default: 401 Unauthorized).
         """
 
+        super().__init__(message, status_code)
+
+class ForbiddenException(BaseHTTPException):
+    """
+    Class responsible for handling exceptions related to missing permissions.
+
+    This exception is raised when an authenticated user's role is not granted
+    the permission required by a route.
+
+    Class Args:
+        message (str): The error message describing the authorization failure.
+        status_code (int): The HTTP status code associated with the exception (default: 403 Forbidden).
+    """
+
+    def __init__(
+        self, message: str, status_code: int = status.HTTP_403_FORBIDDEN
+    ):
+        """
+        Constructor method for ForbiddenException.
+
+        Initializes the exception with a message and an optional status code.
+
+        Args:
+            message (str): The error message describing the exception.
+            status_code (int, optional): The HTTP status code to return (default: 403 Forbidden).
+        """
+
         super().__init__(message, status_code)
\ No newline at end of file
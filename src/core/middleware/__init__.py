@@ -3,4 +3,5 @@
 # flake8: noqa: E501, F401
 
 from src.core.middleware.auth import AuthMiddleware
-from src.core.middleware.logger import LoggerMiddleware
\ No newline at end of file
+from src.core.middleware.logger import LoggerMiddleware
+from src.core.middleware.metrics import MetricsMiddleware
\ No newline at end of file
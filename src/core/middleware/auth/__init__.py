@@ -3,8 +3,10 @@
 # flake8: noqa: E501
 
 # PY
-from fastapi import HTTPException, Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from anyio import CapacityLimiter, to_thread
+from fastapi import HTTPException
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Core
 from src.core.configurations.environment import EnvConfig
@@ -14,14 +16,30 @@ from src.core.exceptions import InvalidTokenException
 from src.utils import (
     AuthUtil,
     log,
-    json_response
+    json_response,
+    revocation_list
 )
 
 # Env variables Setup
 API_VERSION: str = EnvConfig().api_version
+AUTH_VERIFY_MAX_CONCURRENCY: int = EnvConfig().auth_verify_max_concurrency
+METRICS_TOKEN: str = EnvConfig().metrics_token
+
+PUBLIC_PATHS: frozenset[str] = frozenset(
+    [
+        "/api",
+        f"/api/{API_VERSION}/auth/.well-known/jwks.json",
+        f"/api/{API_VERSION}/auth/login",
+        f"/api/{API_VERSION}/auth/refresh",
+        "/docs",
+        "/openapi.json",
+    ]
+    # With a metrics token, /metrics is checked by MetricsTokenDependency instead
+    + (["/metrics"] if METRICS_TOKEN else [])
+)
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
+class AuthMiddleware:
     """
     Class responsible for handling authentication middleware.
 
@@ -31,66 +49,102 @@ class AuthMiddleware(BaseHTTPMiddleware):
     If a request does not contain a valid JWT token in the `Authorization` header,
     an HTTP 401 Unauthorized error is returned.
 
+    It is implemented as a pure ASGI middleware, so requests and responses are
+    passed through without the extra tasks and memory streams of `BaseHTTPMiddleware`.
+
+    Token verification performs a blocking database lookup, so it runs in a worker
+    thread bounded by its own capacity limiter (`AUTH_VERIFY_MAX_CONCURRENCY`),
+    keeping the event loop free and leaving the default thread pool to the routes.
+    In stateless mode (`AUTH_MODE=stateless`) verification never touches the
+    database, so it runs inline on the event loop.
+
     Class Args:
-        None
+        app (ASGIApp): The next ASGI application in the pipeline.
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Constructor method for AuthMiddleware.
+
+        Args:
+            app (ASGIApp): The next ASGI application in the pipeline.
+        """
+
+        self.__app: ASGIApp = app
+        self.__verify_limiter = CapacityLimiter(AUTH_VERIFY_MAX_CONCURRENCY)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Public asynchronous method responsible for processing incoming requests.
 
         This method verifies if a request requires authentication and checks
-        the validity of the JWT token.
+        the validity of the JWT token. The verified token and its decoded payload
+        are stored in the request state as `access_token` and `token_payload`.
 
         Args:
-            request (Request): The incoming HTTP request to be processed.
-            call_next: The next middleware or route handler in the pipeline.
+            scope (Scope): The ASGI connection scope.
+            receive (Receive): The ASGI receive channel.
+            send (Send): The ASGI send channel.
 
         Returns:
-            Response: The processed response after authentication.
-
-        Raises:
-            HTTPException: If the authentication token is missing or invalid.
-            Exception: If an unexpected error occurs during processing.
+            None
         """
 
-        try:
-
-            PUBLIC_PATHS = [
-                "/api",
-                f"/api/{API_VERSION}/auth/login",
-                "/docs",
-                "/openapi.json",
-            ]
+        if scope["type"] != "http" or scope["path"] in PUBLIC_PATHS:
+            await self.__app(scope, receive, send)
+            return
 
-            if request.url.path in PUBLIC_PATHS:
-                response = await call_next(request)
-                return response
-
-            auth_header = request.headers.get("Authorization")
+        try:
+            auth_header = Headers(scope=scope).get("Authorization")
 
             if not auth_header or not auth_header.startswith("Bearer "):
                 raise InvalidTokenException("Token not provided!")
 
             access_token = auth_header.split(" ")[1]
-            payload = AuthUtil.verify_token(access_token)
+
+            if revocation_list.enabled:
+                payload = AuthUtil.verify_token(access_token)
+            else:
+                payload = await to_thread.run_sync(
+                    AuthUtil.verify_token,
+                    access_token,
+                    limiter=self.__verify_limiter,
+                )
 
             session_id = dict(payload).get("session_id")
- 
+
             if not session_id:
                 raise InvalidTokenException("Invalid token structure!")
 
-            request.state.access_token = access_token
-            try:
-                return await call_next(request)
-            except Exception as error:
-                log.error(f"Error in downstream handler: {str(error)}")
-                return json_response(500, "Internal Server Error")
-
         except HTTPException as error:
             log.error(f"Token validation error: {error.detail}")
-            return json_response(error.status_code, str(error.detail))
+            response = json_response(error.status_code, str(error.detail))
+            await response(scope, receive, send)
+            return
 
         except Exception as error:
             log.error(f"Unexpected error in JWT Middleware: {error}")
-            return json_response(500, str(error))
\ No newline at end of file
+            response = json_response(500, str(error))
+            await response(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+        state["access_token"] = access_token
+        state["token_payload"] = payload
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.__app(scope, receive, send_wrapper)
+        except Exception as error:
+            log.error(f"Error in downstream handler: {str(error)}")
+            if response_started:
+                raise
+            response = json_response(500, "Internal Server Error")
+            await response(scope, receive, send)
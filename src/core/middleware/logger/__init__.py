@@ -2,15 +2,38 @@
 
 # flake8: noqa: E501
 
+# PY
+import json
+import random
+import re
 import time
+import uuid
 from http import HTTPStatus
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.datastructures import Headers
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+# Core
+from src.core.configurations import (
+    DatabaseQueryMonitor,
+    EnvConfig,
+    RequestQueries
+)
+
+# Utils
 from src.utils import log
 
-class LoggerMiddleware(BaseHTTPMiddleware):
+# Env variables Setup
+API_ACCESS_LOG_FORMAT: str = EnvConfig().api_access_log_format
+API_ACCESS_LOG_SAMPLE_RATES: dict[str, float] = EnvConfig().api_access_log_sample_rates
+
+REQUEST_ID_HEADER: str = "X-Request-ID"
+
+STATUS_PHRASES: dict[int, str] = {status.value: status.phrase for status in HTTPStatus}
+
+
+class LoggerMiddleware:
     """
     Class responsible for handling request logging middleware.
 
@@ -19,11 +42,50 @@ class LoggerMiddleware(BaseHTTPMiddleware):
 
     If an error occurs during request processing, the middleware logs the error details.
 
+    It is implemented as a pure ASGI middleware, so streaming responses are forwarded
+    untouched and the status code is read from the `http.response.start` message.
+
+    Every request gets an ID, taken from the `X-Request-ID` header when the client (or
+    a gateway) sends a valid one and generated otherwise. It is stored in the request
+    state as `request_id` and returned in the `X-Request-ID` response header.
+
+    With `API_ACCESS_LOG_FORMAT=json`, each request is logged as one JSON object with
+    its ID, route template (not the full URL), status, duration, response size, and
+    the user and session of the token. `API_ACCESS_LOG_SAMPLE_RATES` sets the
+    fraction of requests logged per status class, in both formats.
+
+    The queries run while handling the request are recorded by `DatabaseQueryMonitor`
+    under its ID, and their number and total time are added to the log line.
+
     Class Args:
-        None
+        app (ASGIApp): The next ASGI application in the pipeline.
     """
 
-    async def dispatch(self, request, call_next) -> Response:
+    __formats = ("text", "json")
+
+    __request_id_pattern = re.compile(r"[A-Za-z0-9._:-]{1,128}")
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Constructor method for LoggerMiddleware.
+
+        Args:
+            app (ASGIApp): The next ASGI application in the pipeline.
+
+        Raises:
+            ValueError: If `API_ACCESS_LOG_FORMAT` is not supported.
+        """
+
+        if API_ACCESS_LOG_FORMAT not in self.__formats:
+            raise ValueError(
+                f"Invalid API_ACCESS_LOG_FORMAT '{API_ACCESS_LOG_FORMAT}'! Allowed values: {', '.join(self.__formats)}"
+            )
+
+        self.__app: ASGIApp = app
+        self.__json: bool = API_ACCESS_LOG_FORMAT == "json"
+        self.__sample_rates: dict[str, float] = API_ACCESS_LOG_SAMPLE_RATES
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Public asynchronous method responsible for logging HTTP requests and responses.
 
@@ -31,40 +93,165 @@ class LoggerMiddleware(BaseHTTPMiddleware):
         If an error occurs, it logs the error message before raising the exception.
 
         Args:
-            request (Request): The incoming HTTP request.
-            call_next: The next middleware or route handler in the pipeline.
+            scope (Scope): The ASGI connection scope.
+            receive (Receive): The ASGI receive channel.
+            send (Send): The ASGI send channel.
 
         Returns:
-            Response: The processed response after logging.
+            None
 
         Raises:
             Exception: If an error occurs while processing the request.
         """
 
-        start_time = time.time()
-        host = request.client.host if request.client else "unknown"
-        method = request.method
-        url = str(request.url)
-
-        try:
-            response = await call_next(request)
-            process_time = (time.time() - start_time) * 1000
-            status_code = response.status_code
-            status_name = HTTPStatus(status_code).phrase
+        if scope["type"] != "http":
+            await self.__app(scope, receive, send)
+            return
 
-            log_message = f"{host} - {method} - {status_code} - {status_name} - {url} - {process_time:.2f}ms"
+        start_time = time.perf_counter()
+        request_id = self.__get_request_id(scope)
+        scope.setdefault("state", {})["request_id"] = request_id
+        request_id_header = (REQUEST_ID_HEADER.lower().encode(), request_id.encode())
+        status_code = 500
+        bytes_out = 0
+        queries_token = DatabaseQueryMonitor.start_request(request_id)
 
-            if status_code >= 400:
-                log.error(log_message)
-            else:
-                log.info(log_message)
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, bytes_out
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message = {
+                    **message,
+                    "headers": [*message.get("headers", ()), request_id_header],
+                }
+            elif message["type"] == "http.response.body":
+                bytes_out += len(message.get("body", b""))
+            await send(message)
 
-            return response
+        try:
+            await self.__app(scope, receive, send_wrapper)
 
         except Exception as error:
             error_message = (
-                f"Error processing request {method} {url}: {str(error)}"
+                f"Error processing request {scope['method']} {scope['path']} [{request_id}]: {str(error)}"
             )
             log.error(error_message)
 
-            raise error
\ No newline at end of file
+            raise error
+
+        finally:
+            queries = DatabaseQueryMonitor.finish_request(queries_token)
+
+        rate = self.__sample_rates.get(f"{status_code // 100}xx", 1.0)
+
+        if rate < 1.0 and random.random() >= rate:
+            return
+
+        process_time = (time.perf_counter() - start_time) * 1000
+
+        if self.__json:
+            log_message = self.__json_message(scope, request_id, status_code, process_time, bytes_out, queries)
+        else:
+            log_message = self.__text_message(scope, status_code, process_time, queries)
+
+        if status_code >= 400:
+            log.error(log_message)
+        else:
+            log.info(log_message)
+
+    def __get_request_id(self, scope: Scope) -> str:
+        """
+        Private method responsible for returning the ID of a request.
+
+        Args:
+            scope (Scope): The ASGI connection scope.
+
+        Returns:
+            str: The `X-Request-ID` header if valid (up to 128 characters among
+                letters, digits and `._:-`), otherwise a new UUID.
+        """
+
+        request_id = Headers(scope=scope).get(REQUEST_ID_HEADER)
+
+        if request_id and self.__request_id_pattern.fullmatch(request_id):
+            return request_id
+
+        return uuid.uuid4().hex
+
+    def __text_message(
+        self,
+        scope: Scope,
+        status_code: int,
+        process_time: float,
+        queries: RequestQueries | None
+    ) -> str:
+        """
+        Private method responsible for formatting the readable access log line of a request.
+
+        Args:
+            scope (Scope): The ASGI connection scope.
+            status_code (int): The response status code.
+            process_time (float): The processing time, in milliseconds.
+            queries (RequestQueries | None): The queries run for the request.
+
+        Returns:
+            str: The access log line.
+        """
+
+        client = scope.get("client")
+        host = client[0] if client else "unknown"
+        status_name = STATUS_PHRASES.get(status_code, "")
+
+        log_message = f"{host} - {scope['method']} - {status_code} - {status_name} - {Request(scope).url} - {process_time:.2f}ms"
+
+        if queries is not None and queries.count:
+            log_message += f" - {queries.count} queries in {queries.duration * 1000:.2f}ms"
+
+        return log_message
+
+    def __json_message(
+        self,
+        scope: Scope,
+        request_id: str,
+        status_code: int,
+        process_time: float,
+        bytes_out: int,
+        queries: RequestQueries | None
+    ) -> str:
+        """
+        Private method responsible for formatting the JSON access log object of a request.
+
+        The route is the matched path template (e.g. `/api/v1/users/{user_id}`), or
+        None when no route matched, so the field has a bounded number of values.
+
+        Args:
+            scope (Scope): The ASGI connection scope.
+            request_id (str): The request ID.
+            status_code (int): The response status code.
+            process_time (float): The processing time, in milliseconds.
+            bytes_out (int): The size of the response body, in bytes.
+            queries (RequestQueries | None): The queries run for the request.
+
+        Returns:
+            str: The access log object, serialized on one line.
+        """
+
+        client = scope.get("client")
+        payload = scope["state"].get("token_payload") or {}
+
+        return json.dumps(
+            {
+                "request_id": request_id,
+                "method": scope["method"],
+                "route": getattr(scope.get("route"), "path", None),
+                "status": status_code,
+                "duration_ms": round(process_time, 2),
+                "bytes_out": bytes_out,
+                "db_queries": queries.count if queries is not None else 0,
+                "db_time_ms": round(queries.duration * 1000, 2) if queries is not None else 0.0,
+                "user_id": payload.get("user_id"),
+                "session_id": payload.get("session_id"),
+                "client": client[0] if client else None,
+            },
+            separators=(",", ":"),
+        )
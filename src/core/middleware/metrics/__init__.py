@@ -0,0 +1,74 @@
+# /src/core/middleware/metrics/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Utils
+from src.utils import metrics
+
+
+class MetricsMiddleware:
+    """
+    Class responsible for measuring the HTTP requests.
+
+    Each request is counted by method, route template and status, and its latency
+    is recorded, through the `metrics` util. The status code is read from the
+    `http.response.start` message, so streaming responses are forwarded untouched.
+
+    Class Args:
+        app (ASGIApp): The next ASGI application in the pipeline.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Constructor method for MetricsMiddleware.
+
+        Args:
+            app (ASGIApp): The next ASGI application in the pipeline.
+        """
+
+        self.__app: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Public asynchronous method responsible for measuring an HTTP request.
+
+        A request that raises an exception is recorded with the status 500.
+
+        Args:
+            scope (Scope): The ASGI connection scope.
+            receive (Receive): The ASGI receive channel.
+            send (Send): The ASGI send channel.
+
+        Returns:
+            None
+        """
+
+        if scope["type"] != "http":
+            await self.__app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        metrics.request_started()
+
+        try:
+            await self.__app(scope, receive, send_wrapper)
+        finally:
+            metrics.request_finished(
+                scope["method"],
+                getattr(scope.get("route"), "path", None),
+                status_code,
+                time.perf_counter() - start_time,
+            )
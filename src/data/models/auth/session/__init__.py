@@ -9,7 +9,10 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
-    String
+    Index,
+    String,
+    UniqueConstraint,
+    text
 )
 
 # Core
@@ -25,6 +28,21 @@ class SessionAuthModel(Base):
     """
     __tablename__ = "sessions_auth"
 
+    __table_args__ = (
+        Index("ix_sessions_auth_user_id_is_active", "user_id", "is_active"),
+        Index("ix_sessions_auth_token_id", "token_id"),
+        Index("ix_sessions_auth_logout_at", "logout_at"),
+        UniqueConstraint(
+            "refresh_token_digest", name="uq_sessions_auth_refresh_token_digest"
+        ),
+        Index(
+            "ix_sessions_auth_active_user_id",
+            "user_id",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active = 1"),
+        ).ddl_if(dialect=("postgresql", "sqlite")),
+    )
+
     session_id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     token_id = Column(
         String,
@@ -43,6 +61,8 @@ class SessionAuthModel(Base):
     )
     logout_at = Column(DateTime, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
+    refresh_token_digest = Column(String(64), nullable=True)
+    refresh_expires_at = Column(DateTime, nullable=True)
     created_at = Column(
         String,
         nullable=False,
@@ -7,7 +7,8 @@ import uuid
 
 from sqlalchemy import (
     Column,
-    String
+    String,
+    UniqueConstraint
 )
 from sqlalchemy.orm import relationship
 
@@ -28,8 +29,12 @@ class TokenModel(Base):
     """
     __tablename__ = "tokens"
 
+    __table_args__ = (
+        UniqueConstraint("token_digest", name="uq_tokens_token_digest"),
+    )
+
     token_id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    access_token = Column(String, nullable=False, unique=True)
+    token_digest = Column(String(64), nullable=False)
     created_at = Column(
         String,
         nullable=False,
@@ -5,7 +5,7 @@
 # PY
 import uuid
 
-from sqlalchemy import Column, Enum, ForeignKey, String
+from sqlalchemy import Column, Enum, ForeignKey, Index, String
 from sqlalchemy.orm import Session, relationship
 
 # Core
@@ -50,6 +50,11 @@ class UserModel(Base):
 
     __tablename__ = "users"
 
+    __table_args__ = (
+        Index("ix_users_role_id", "role_id"),
+        Index("ix_users_created_at_user_id", "created_at", "user_id"),
+    )
+
     _prefix_id = "U"
     _unique_id = GenUtil.generate_unique_id()
     _custom_id = f"{_prefix_id}{_unique_id}"
@@ -4,5 +4,6 @@
 
 from src.data.repositories.auth.login import LoginRepository
 from src.data.repositories.auth.token import TokenRepository
-from src.data.repositories.auth.session import SessionAuthRepository
+from src.data.repositories.auth.session import AsyncSessionAuthRepository, SessionAuthRepository
+from src.data.repositories.role import RoleRepository
 from src.data.repositories.user import UserRepository
\ No newline at end of file
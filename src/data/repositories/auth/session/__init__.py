@@ -3,10 +3,14 @@
 # flake8: noqa: E501
 
 # PY
+from datetime import datetime
+
+from sqlalchemy import Row, and_, delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 # Data
-from src.data.models import SessionAuthModel
+from src.data.models import SessionAuthModel, UserModel
 
 # Utils
 from src.utils import log
@@ -63,8 +67,6 @@ class SessionAuthRepository:
 
         self.__session_db.flush()
 
-        self.__session_db.refresh(user)
-
         return user
 
 
@@ -92,6 +94,29 @@ class SessionAuthRepository:
             is_active=True
         ).all()
 
+    def find_active_session_ids(self, session_ids: list[str]) -> set[str]:
+        """
+        Public method responsible for retrieving which of the given sessions are active, in a single statement.
+
+        Args:
+            session_ids (list[str]): The unique identifiers of the sessions.
+
+        Returns:
+            set[str]: The IDs of the sessions that exist and are active.
+        """
+
+        if not session_ids:
+            return set()
+
+        return set(
+            self.__session_db.execute(
+                select(SessionAuthModel.session_id).where(
+                    SessionAuthModel.session_id.in_(session_ids),
+                    SessionAuthModel.is_active.is_(True),
+                )
+            ).scalars()
+        )
+
     def deactivate_session(self, session: SessionAuthModel, update_data: dict) -> SessionAuthModel:
         """
         """
@@ -102,4 +127,274 @@ class SessionAuthRepository:
         self.__session_db.add(session)
         self.__session_db.flush()
 
-        return session
\ No newline at end of file
+        return session
+
+    def deactivate_active_session_by_session_id(self, session_id: str, logout_at: datetime) -> int:
+        """
+        Public method responsible for deactivating an active session in a single statement.
+
+        This method issues one conditional `UPDATE ... WHERE session_id = ? AND is_active`,
+        so no row has to be loaded beforehand.
+
+        Args:
+            session_id (str): The unique identifier of the session.
+            logout_at (datetime): The logout timestamp to store.
+
+        Returns:
+            int: The number of deactivated sessions (0 if it was already inactive or not found).
+        """
+
+        result = self.__session_db.execute(
+            update(SessionAuthModel)
+            .where(
+                SessionAuthModel.session_id == session_id,
+                SessionAuthModel.is_active.is_(True),
+            )
+            .values(is_active=False, logout_at=logout_at)
+            .execution_options(synchronize_session=False)
+        )
+
+        return result.rowcount
+
+    def deactivate_active_sessions_by_user_id(self, user_id: str, logout_at: datetime) -> list[str]:
+        """
+        Public method responsible for deactivating every active session of a user in a single statement.
+
+        The deactivated session IDs are returned with `UPDATE ... RETURNING` where the
+        dialect supports it (PostgreSQL, SQLite); otherwise they are selected first.
+
+        Args:
+            user_id (str): The unique identifier of the user.
+            logout_at (datetime): The logout timestamp to store.
+
+        Returns:
+            list[str]: The IDs of the deactivated sessions.
+        """
+
+        condition = and_(
+            SessionAuthModel.user_id == user_id,
+            SessionAuthModel.is_active.is_(True),
+        )
+        statement = (
+            update(SessionAuthModel)
+            .where(condition)
+            .values(is_active=False, logout_at=logout_at)
+            .execution_options(synchronize_session=False)
+        )
+
+        if self.__session_db.get_bind().dialect.update_returning:
+            return list(
+                self.__session_db.execute(
+                    statement.returning(SessionAuthModel.session_id)
+                ).scalars()
+            )
+
+        session_ids = list(
+            self.__session_db.execute(
+                select(SessionAuthModel.session_id).where(condition)
+            ).scalars()
+        )
+
+        if session_ids:
+            self.__session_db.execute(
+                statement.where(SessionAuthModel.session_id.in_(session_ids))
+            )
+
+        return session_ids
+
+    def find_refreshable_session(self, refresh_token_digest: str, now: datetime) -> Row | None:
+        """
+        Public method responsible for retrieving the active session bound to a refresh token.
+
+        The session is joined with its user, so the claims of the new access token
+        come from the same indexed lookup.
+
+        Args:
+            refresh_token_digest (str): The SHA-256 digest of the refresh token.
+            now (datetime): The current time, compared with the refresh token expiry.
+
+        Returns:
+            Row | None: The `session_id`, `token_id`, `user_id`, `email` and `role_id`
+                of the session if found, otherwise None.
+        """
+
+        return self.__session_db.execute(
+            select(
+                SessionAuthModel.session_id,
+                SessionAuthModel.token_id,
+                SessionAuthModel.user_id,
+                UserModel.email,
+                UserModel.role_id,
+            )
+            .join(UserModel, UserModel.user_id == SessionAuthModel.user_id)
+            .where(
+                SessionAuthModel.refresh_token_digest == refresh_token_digest,
+                SessionAuthModel.is_active.is_(True),
+                SessionAuthModel.refresh_expires_at > now,
+            )
+        ).first()
+
+    def rotate_refresh_token(
+        self,
+        session_id: str,
+        refresh_token_digest: str,
+        new_refresh_token_digest: str
+    ) -> int:
+        """
+        Public method responsible for replacing the refresh token of an active session in a single statement.
+
+        The `UPDATE` only matches while the session still holds `refresh_token_digest`,
+        so of two concurrent refreshes with the same token only one succeeds.
+
+        Args:
+            session_id (str): The unique identifier of the session.
+            refresh_token_digest (str): The digest of the refresh token being used.
+            new_refresh_token_digest (str): The digest of the refresh token replacing it.
+
+        Returns:
+            int: The number of updated sessions (0 if the token was already rotated or revoked).
+        """
+
+        result = self.__session_db.execute(
+            update(SessionAuthModel)
+            .where(
+                SessionAuthModel.session_id == session_id,
+                SessionAuthModel.refresh_token_digest == refresh_token_digest,
+                SessionAuthModel.is_active.is_(True),
+            )
+            .values(refresh_token_digest=new_refresh_token_digest)
+            .execution_options(synchronize_session=False)
+        )
+
+        return result.rowcount
+
+    def find_revoked_sessions(self, logged_out_since: datetime) -> list[tuple[str, datetime]]:
+        """
+        Public method responsible for retrieving the sessions deactivated since a given time.
+
+        Args:
+            logged_out_since (datetime): Logout timestamp lower bound (inclusive).
+
+        Returns:
+            list[tuple[str, datetime]]: The session ID and logout timestamp of each session.
+        """
+
+        rows = self.__session_db.execute(
+            select(SessionAuthModel.session_id, SessionAuthModel.logout_at)
+            .where(
+                SessionAuthModel.logout_at >= logged_out_since,
+                SessionAuthModel.is_active.is_(False),
+            )
+        )
+
+        return [(row.session_id, row.logout_at) for row in rows]
+
+    def find_expired_sessions(
+        self,
+        logged_out_before: datetime,
+        created_before: str,
+        limit: int
+    ) -> list[tuple[str, str]]:
+        """
+        Public method responsible for retrieving a batch of sessions past their retention period.
+
+        A session is expired if it was logged out before `logged_out_before`, or if it
+        was created before `created_before` (its token expired long ago, whether or
+        not it was logged out).
+
+        Args:
+            logged_out_before (datetime): Logout timestamp cutoff for inactive sessions.
+            created_before (str): Formatted creation timestamp cutoff for any session.
+            limit (int): Maximum number of sessions returned.
+
+        Returns:
+            list[tuple[str, str]]: The session ID and token ID of each expired session.
+        """
+
+        rows = self.__session_db.execute(
+            select(SessionAuthModel.session_id, SessionAuthModel.token_id)
+            .where(
+                or_(
+                    and_(
+                        SessionAuthModel.is_active.is_(False),
+                        SessionAuthModel.logout_at < logged_out_before,
+                    ),
+                    SessionAuthModel.created_at < created_before,
+                )
+            )
+            .limit(limit)
+        )
+
+        return [(row.session_id, row.token_id) for row in rows]
+
+    def delete_sessions_by_session_ids(self, session_ids: list[str]) -> int:
+        """
+        Public method responsible for deleting sessions in a single statement.
+
+        Args:
+            session_ids (list[str]): The unique identifiers of the sessions.
+
+        Returns:
+            int: The number of deleted sessions.
+        """
+
+        if not session_ids:
+            return 0
+
+        result = self.__session_db.execute(
+            delete(SessionAuthModel)
+            .where(SessionAuthModel.session_id.in_(session_ids))
+            .execution_options(synchronize_session=False)
+        )
+
+        return result.rowcount
+
+
+class AsyncSessionAuthRepository:
+    """
+    Class responsible for handling async database operations related to authentication sessions.
+
+    This repository holds the session queries served from the async engine when
+    the async database mode is enabled (see `IntrospectUseCase.call_async`).
+
+    Class Args:
+        session_db (AsyncSession): The async database session used for executing queries.
+    """
+
+    def __init__(
+        self,
+        session_db: AsyncSession
+    ) -> None:
+        """
+        Constructor method for AsyncSessionAuthRepository.
+
+        Initializes the repository with an async database session.
+
+        Args:
+            session_db (AsyncSession): The async database session used to execute queries.
+        """
+
+        self.__model: SessionAuthModel = SessionAuthModel
+        self.__session_db: AsyncSession = session_db
+
+    async def find_active_session_ids(self, session_ids: list[str]) -> set[str]:
+        """
+        Public asynchronous method responsible for retrieving which of the given sessions are active, in a single statement.
+
+        Args:
+            session_ids (list[str]): The unique identifiers of the sessions.
+
+        Returns:
+            set[str]: The IDs of the sessions that exist and are active.
+        """
+
+        if not session_ids:
+            return set()
+
+        result = await self.__session_db.execute(
+            select(SessionAuthModel.session_id).where(
+                SessionAuthModel.session_id.in_(session_ids),
+                SessionAuthModel.is_active.is_(True),
+            )
+        )
+        return set(result.scalars())
@@ -3,10 +3,11 @@
 # flake8: noqa: E501
 
 # PY
+from sqlalchemy import delete, exists, select, update
 from sqlalchemy.orm import Session
 
 # Data
-from src.data.models import TokenModel
+from src.data.models import SessionAuthModel, TokenModel
 
 # Utils
 from src.utils import log
@@ -61,8 +62,6 @@ class TokenRepository:
 
         self.__session_db.flush()
 
-        self.__session_db.refresh(token)
-
         return token
 
 
@@ -87,6 +86,42 @@ class TokenRepository:
             .first()
         )
 
+    def find_token_by_digest(self, token_digest: str) -> TokenModel | None:
+        """
+        Public method responsible for retrieving a token by the digest of the JWT.
+
+        Args:
+            token_digest (str): The SHA-256 digest of the JWT (see `AuthUtil.token_digest`).
+
+        Returns:
+            TokenModel | None: The token if found, otherwise None.
+        """
+
+        return self.__session_db.execute(
+            select(TokenModel).where(TokenModel.token_digest == token_digest)
+        ).scalars().first()
+
+    def update_token_digest(self, token_id: str, token_digest: str) -> int:
+        """
+        Public method responsible for replacing the JWT digest of a token in a single statement.
+
+        Args:
+            token_id (str): The unique identifier of the token.
+            token_digest (str): The SHA-256 digest of the new JWT.
+
+        Returns:
+            int: The number of updated tokens.
+        """
+
+        result = self.__session_db.execute(
+            update(TokenModel)
+            .where(TokenModel.token_id == token_id)
+            .values(token_digest=token_digest)
+            .execution_options(synchronize_session=False)
+        )
+
+        return result.rowcount
+
     def find_tokens(self) -> list[TokenModel] | None:
         """
         Public method responsible for retrieving all users except super administrators.
@@ -121,3 +156,48 @@ class TokenRepository:
         self.__session_db.delete(user)
 
         self.__session_db.commit()
+
+    def find_orphan_token_ids(self, created_before: str, limit: int) -> list[str]:
+        """
+        Public method responsible for retrieving a batch of tokens no session refers to.
+
+        Args:
+            created_before (str): Formatted creation timestamp cutoff.
+            limit (int): Maximum number of token IDs returned.
+
+        Returns:
+            list[str]: The orphaned token IDs.
+        """
+
+        return list(
+            self.__session_db.execute(
+                select(TokenModel.token_id)
+                .where(
+                    TokenModel.created_at < created_before,
+                    ~exists().where(SessionAuthModel.token_id == TokenModel.token_id),
+                )
+                .limit(limit)
+            ).scalars()
+        )
+
+    def delete_tokens_by_token_ids(self, token_ids: list[str]) -> int:
+        """
+        Public method responsible for deleting tokens in a single statement.
+
+        Args:
+            token_ids (list[str]): The unique identifiers of the tokens.
+
+        Returns:
+            int: The number of deleted tokens.
+        """
+
+        if not token_ids:
+            return 0
+
+        result = self.__session_db.execute(
+            delete(TokenModel)
+            .where(TokenModel.token_id.in_(token_ids))
+            .execution_options(synchronize_session=False)
+        )
+
+        return result.rowcount
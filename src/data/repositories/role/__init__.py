@@ -0,0 +1,54 @@
+# /src/data/repositories/role/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+# Data
+from src.data.models import RoleModel
+from src.data.models.role_permission import role_permission
+
+
+class RoleRepository:
+    """
+    Class responsible for handling database operations related to roles and their permissions.
+
+    Class Args:
+        session_db (Session): The database session used for executing queries.
+    """
+
+    def __init__(
+        self,
+        session_db: Session
+    ) -> None:
+        """
+        Constructor method for RoleRepository.
+
+        Initializes the repository with a database session.
+
+        Args:
+            session_db (Session): The database session used to execute queries.
+        """
+
+        self.__session_db: Session = session_db
+
+    def find_role_permissions(self) -> list[tuple[str, str | None]]:
+        """
+        Public method responsible for retrieving every role with its permissions in a single statement.
+
+        Args:
+            None
+
+        Returns:
+            list[tuple[str, str | None]]: One `(role_id, permission_id)` pair per granted
+                permission, and `(role_id, None)` for a role without permissions.
+        """
+
+        rows = self.__session_db.execute(
+            select(RoleModel.role_id, role_permission.c.permission_id)
+            .outerjoin(role_permission, role_permission.c.role_id == RoleModel.role_id)
+        )
+
+        return [(row.role_id, row.permission_id) for row in rows]
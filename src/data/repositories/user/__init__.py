@@ -2,6 +2,9 @@
 
 # flake8: noqa: E501
 
+from typing import Iterator
+
+from sqlalchemy import and_, insert, or_, select
 from sqlalchemy.orm import Session
 
 from src.domain.enums import UserRoleEnum
@@ -68,6 +71,55 @@ class UserRepository:
             log.error(f"Error creating user: {error}")
             raise
 
+    def create_users(self, users: list[dict]) -> None:
+        """
+        Public method responsible for inserting many users with a single statement.
+
+        The rows are sent as one `INSERT` executed with `executemany` (batched into
+        multi-row `VALUES` where the dialect supports it), without loading or
+        refreshing ORM instances.
+
+        Args:
+            users (list[dict]): The column values of each user.
+
+        Raises:
+            Exception: If an error occurs while inserting the users into the database.
+        """
+
+        if not users:
+            return
+
+        try:
+
+            self.__session_db.execute(insert(UserModel), users)
+
+            self.__session_db.commit()
+
+        except Exception as error:
+            self.__session_db.rollback()
+            log.error(f"Error creating users in bulk: {error}")
+            raise
+
+    def find_existing_emails(self, emails: list[str]) -> set[str]:
+        """
+        Public method responsible for retrieving which of the given emails are already registered.
+
+        Args:
+            emails (list[str]): The email addresses to check.
+
+        Returns:
+            set[str]: The subset of emails that already exist.
+        """
+
+        if not emails:
+            return set()
+
+        return set(
+            self.__session_db.execute(
+                select(UserModel.email).where(UserModel.email.in_(emails))
+            ).scalars()
+        )
+
     def find_user(self, user_id: str):
         """
         Public method responsible for retrieving a user by their user ID.
@@ -109,6 +161,123 @@ class UserRepository:
             .all()
         )
 
+    def find_users_page(
+        self,
+        limit: int,
+        after: tuple[str, str] | None = None,
+        status: str | None = None,
+        role_id: str | None = None,
+        email_prefix: str | None = None,
+    ) -> list:
+        """
+        Public method responsible for retrieving one page of users with keyset pagination.
+
+        Users are ordered by `(created_at, user_id)` and the page starts right after
+        the given key, so the cost of a page does not grow with its position. Only
+        the columns needed for the response are selected.
+
+        Args:
+            limit (int): Maximum number of users to return.
+            after (tuple[str, str] | None, optional): The `(created_at, user_id)` key of the
+                last user of the previous page. Defaults to None.
+            status (str | None, optional): Filter by user status. Defaults to None.
+            role_id (str | None, optional): Filter by role. Defaults to None.
+            email_prefix (str | None, optional): Filter by email prefix. Defaults to None.
+
+        Returns:
+            list: Rows with `user_id`, `name`, `email` and `created_at`.
+        """
+
+        query = self.__session_db.query(
+            UserModel.user_id,
+            UserModel.name,
+            UserModel.email,
+            UserModel.created_at,
+        ).filter(UserModel.role_id != UserRoleEnum.SUPER_ADMINISTRATOR)
+
+        if status is not None:
+            query = query.filter(UserModel.status == status)
+
+        if role_id is not None:
+            query = query.filter(UserModel.role_id == role_id)
+
+        if email_prefix:
+            escaped_prefix = (
+                email_prefix.replace("\\", "\\\\")
+                .replace("%", "\\%")
+                .replace("_", "\\_")
+            )
+            query = query.filter(
+                UserModel.email.like(f"{escaped_prefix}%", escape="\\")
+            )
+
+        if after is not None:
+            created_at, user_id = after
+            query = query.filter(
+                or_(
+                    UserModel.created_at > created_at,
+                    and_(
+                        UserModel.created_at == created_at,
+                        UserModel.user_id > user_id,
+                    ),
+                )
+            )
+
+        return (
+            query.order_by(UserModel.created_at, UserModel.user_id)
+            .limit(limit)
+            .all()
+        )
+
+    def stream_users(
+        self,
+        batch_size: int,
+        status: str | None = None,
+        role_id: str | None = None,
+    ) -> Iterator[list]:
+        """
+        Public method responsible for streaming all users except super administrators in batches.
+
+        The query is executed with `yield_per`, which uses a server-side cursor where
+        the driver supports it, so only one batch of rows is held in memory at a time.
+
+        Args:
+            batch_size (int): Number of rows fetched and yielded at once.
+            status (str | None, optional): Filter by user status. Defaults to None.
+            role_id (str | None, optional): Filter by role. Defaults to None.
+
+        Yields:
+            Iterator[list]: Batches of rows with the exported user columns.
+        """
+
+        statement = select(
+            UserModel.user_id,
+            UserModel.name,
+            UserModel.email,
+            UserModel.status,
+            UserModel.role_id,
+            UserModel.created_at,
+            UserModel.updated_at,
+        ).where(UserModel.role_id != UserRoleEnum.SUPER_ADMINISTRATOR)
+
+        if status is not None:
+            statement = statement.where(UserModel.status == status)
+
+        if role_id is not None:
+            statement = statement.where(UserModel.role_id == role_id)
+
+        result = self.__session_db.execute(
+            statement.order_by(UserModel.user_id).execution_options(
+                yield_per=batch_size
+            )
+        )
+
+        try:
+            for partition in result.partitions():
+                yield partition
+        finally:
+            result.close()
+
     def remove_user(self, user: UserModel) -> None:
         """
         Public method responsible for removing a user from the database.
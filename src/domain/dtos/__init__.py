@@ -3,7 +3,9 @@
 # flake8: noqa: E501
 
 # Request
+from src.domain.dtos.request.body.auth.introspect import *
 from src.domain.dtos.request.body.auth.login import *
+from src.domain.dtos.request.body.auth.refresh import *
 from src.domain.dtos.request.body.user import *
 from src.domain.dtos.request.path.user import *
 from src.domain.dtos.request.query.user import *
@@ -0,0 +1,54 @@
+# /src/domain/dtos/request/body/auth/introspect/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+from typing import List
+
+from pydantic import field_validator
+
+# Core
+from src.core.exceptions.dtos import InvalidValueInFieldException
+
+# Domain
+from src.domain.dtos.base import BaseDTO
+
+
+class IntrospectRequestDTO(BaseDTO):
+    """
+    Class responsible for the Data Transfer Object (DTO) for batch token introspection requests.
+
+    This class is used to validate and structure introspection request payloads,
+    bounding the number of tokens checked by a single request.
+
+    Class Args:
+        None
+    """
+
+    __max_tokens__ = 1000
+
+    tokens: List[str]
+
+    @field_validator("tokens", mode="before")
+    @classmethod
+    def validate_tokens(cls, value, info) -> List[str]:
+        """
+        Class method that validates if the token list is within the allowed size.
+
+        Args:
+            value: The value to be validated.
+            info: Field metadata provided by Pydantic.
+
+        Returns:
+            List[str]: The validated token list.
+
+        Raises:
+            InvalidValueInFieldException: If the value is not a list of 1 to the maximum number of tokens.
+        """
+
+        if not isinstance(value, list) or not 1 <= len(value) <= cls.__max_tokens__:
+            raise InvalidValueInFieldException(
+                f"The field {info.field_name} must be a list of 1 to {cls.__max_tokens__} tokens!"
+            )
+
+        return value
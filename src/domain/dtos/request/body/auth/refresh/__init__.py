@@ -0,0 +1,18 @@
+# /src/domain/dtos/request/body/auth/refresh/__init__.py
+
+# flake8: noqa: E501
+
+from src.domain.dtos.base import BaseDTO
+
+
+class RefreshRequestDTO(BaseDTO):
+    """
+    Class responsible for the Data Transfer Object (DTO) for token refresh requests.
+
+    This class is used to validate and structure refresh request payloads.
+
+    Class Args:
+        None
+    """
+
+    refresh_token: str
@@ -2,8 +2,18 @@
 
 # flake8: noqa: E501
 
+# PY
+from pydantic import field_validator
+
+# Core
+from src.core.exceptions.dtos import InvalidValueInFieldException
+
 # Domain
 from src.domain.dtos.base import BaseDTO
+from src.domain.enums import (
+    UserExportFormatEnum,
+    UserStatusEnum
+)
 
 
 class FindUserByUserIdQueryDTO(BaseDTO):
@@ -13,6 +23,83 @@ class FindUserByUserIdQueryDTO(BaseDTO):
     This class validates and structures query parameters used to fetch a specific user,
     ensuring that the required identifier is provided for user-related lookup operations.
 
+    When no `user_id` is given, the remaining fields page through the users:
+    `limit` bounds the page size, `cursor` is the opaque `next_cursor` returned by
+    the previous page, and `status`, `role_id` and `email_prefix` filter the results.
+
+    Validation mode: 'query'.
+
+    Class Args:
+        None.
+    """
+
+    __validation_mode__ = "query"
+
+    __max_limit__ = 500
+
+    user_id: str | None = None
+    limit: int = 50
+    cursor: str | None = None
+    status: UserStatusEnum | None = None
+    role_id: str | None = None
+    email_prefix: str | None = None
+
+    @field_validator("limit", mode="before")
+    @classmethod
+    def validate_limit(cls, value, info) -> int:
+        """
+        Class method that validates if the page size is within the allowed range.
+
+        Args:
+            value: The value to be validated.
+            info: Field metadata provided by Pydantic.
+
+        Returns:
+            int: The validated page size.
+
+        Raises:
+            InvalidValueInFieldException: If the value is not an integer between 1 and the maximum limit.
+        """
+
+        try:
+            limit = int(value)
+        except (TypeError, ValueError):
+            limit = 0
+
+        if not 1 <= limit <= cls.__max_limit__:
+            raise InvalidValueInFieldException(
+                f"The field {info.field_name} must be an integer between 1 and {cls.__max_limit__}!"
+            )
+
+        return limit
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def validate_status(cls, value, info) -> str | None:
+        """
+        Class method that validates if the given value is a valid UserStatusEnum member.
+
+        Args:
+            value: The value to be validated.
+            info: Field metadata provided by Pydantic.
+
+        Returns:
+            str | None: The validated status value, or None if not provided.
+        """
+
+        if value is None:
+            return None
+
+        return cls.validate_enum(value, info, UserStatusEnum)
+
+
+class ExportUserQueryDTO(BaseDTO):
+    """
+    Class responsible for the Data Transfer Object (DTO) for exporting users.
+
+    This class validates and structures the query parameters of the user export,
+    selecting the output format and optionally filtering the exported users.
+
     Validation mode: 'query'.
 
     Class Args:
@@ -21,4 +108,41 @@ class FindUserByUserIdQueryDTO(BaseDTO):
 
     __validation_mode__ = "query"
 
-    user_id: str | None = None
\ No newline at end of file
+    format: UserExportFormatEnum = UserExportFormatEnum.NDJSON
+    status: UserStatusEnum | None = None
+    role_id: str | None = None
+
+    @field_validator("format", mode="before")
+    @classmethod
+    def validate_format(cls, value, info) -> str:
+        """
+        Class method that validates if the given value is a valid UserExportFormatEnum member.
+
+        Args:
+            value: The value to be validated.
+            info: Field metadata provided by Pydantic.
+
+        Returns:
+            str: The validated format value.
+        """
+
+        return cls.validate_enum(value, info, UserExportFormatEnum)
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def validate_status(cls, value, info) -> str | None:
+        """
+        Class method that validates if the given value is a valid UserStatusEnum member.
+
+        Args:
+            value: The value to be validated.
+            info: Field metadata provided by Pydantic.
+
+        Returns:
+            str | None: The validated status value, or None if not provided.
+        """
+
+        if value is None:
+            return None
+
+        return cls.validate_enum(value, info, UserStatusEnum)
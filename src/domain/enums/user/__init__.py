@@ -64,4 +64,22 @@ class UserStatusEnum(str, Enum):
 
     ACTIVE = "active"
     INACTIVE = "inactive"
-    SUSPENDED = "suspended"
\ No newline at end of file
+    SUSPENDED = "suspended"
+
+
+class UserExportFormatEnum(str, Enum):
+    """
+    Enumerated class for user export formats.
+
+    This enum defines the formats in which the user table can be streamed.
+
+    Class Args:
+        None
+
+    Members:
+        NDJSON (str): One JSON object per line.
+        CSV (str): Comma-separated values with a header line.
+    """
+
+    NDJSON = "ndjson"
+    CSV = "csv"
@@ -3,12 +3,18 @@
 # flake8: noqa: E501, F401
 
 # Auth
+from src.domain.use_cases.auth.introspect import IntrospectUseCase
 from src.domain.use_cases.auth.login import LoginUseCase
 from src.domain.use_cases.auth.logout import LogoutUseCase
+from src.domain.use_cases.auth.purge import PurgeSessionUseCase
+from src.domain.use_cases.auth.refresh import RefreshUseCase
 from src.domain.use_cases.auth.validate import ValidateUseCase
+from src.domain.use_cases.auth.verify import VerifyUseCase
 
 # User
+from src.domain.use_cases.user.bulk import BulkCreateUserUseCase
 from src.domain.use_cases.user.create import CreateUserUseCase
+from src.domain.use_cases.user.export import ExportUserUseCase
 from src.domain.use_cases.user.find import FindUserUseCase
 from src.domain.use_cases.user.remove import RemoveUserUseCase
 from src.domain.use_cases.user.update import UpdateUserUseCase
\ No newline at end of file
@@ -0,0 +1,235 @@
+# /src/domain/use_cases/auth/introspect/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+from jwt.exceptions import PyJWTError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List
+
+# Core
+from src.core.exceptions import BaseHTTPException
+
+# Domain
+from src.domain.dtos import IntrospectRequestDTO
+
+# Data
+from src.data.repositories import (
+    AsyncSessionAuthRepository,
+    SessionAuthRepository
+)
+
+# Utils
+from src.utils import (
+    AuthUtil,
+    log,
+    revocation_list,
+    session_cache
+)
+
+
+class IntrospectUseCase:
+    """
+    Class responsible for handling the batch token introspection use case.
+
+    Every token is decoded first; the sessions of the valid ones are then resolved
+    together: from the revocation list in stateless mode, otherwise from the session
+    cache, with a single `WHERE session_id IN (...)` query for the cache misses.
+    This replaces one `AuthUtil.verify_token` call (and database round trip) per token.
+
+    Unlike `AuthUtil.verify_token`, introspection has no side effect: an expired
+    token is reported inactive without deactivating its session.
+
+    With an `AsyncSession` (async database mode), `call_async` runs the query
+    through `AsyncSessionAuthRepository` on the event loop.
+
+    Class Args:
+        session_db (Session | AsyncSession): The database session used for executing queries.
+    """
+
+    def __init__(
+        self,
+        session_db: Session | AsyncSession
+    ) -> None:
+        """
+        Constructor method for IntrospectUseCase.
+
+        Args:
+            session_db (Session | AsyncSession): The database session used for executing queries.
+        """
+
+        self.__session_db = session_db
+
+    def __call__(self, body: IntrospectRequestDTO) -> List[Dict[str, Any]]:
+        """
+        Public method responsible for checking a list of tokens.
+
+        Args:
+            body (IntrospectRequestDTO): The DTO containing the tokens to check.
+
+        Returns:
+            List[Dict[str, Any]]: One result per token, in the same order: `{"active": False}`
+                for an invalid, expired or revoked token, otherwise `{"active": True}` with
+                its user ID, role, session ID and expiry.
+        """
+
+        try:
+            payloads = [self.__decode(token) for token in body.tokens]
+            active_session_ids, uncached_session_ids = self.__find_known_session_ids(payloads)
+
+            if uncached_session_ids:
+                found_session_ids = SessionAuthRepository(
+                    self.__session_db  # type: ignore
+                ).find_active_session_ids(uncached_session_ids)
+
+                active_session_ids |= self.__cache_sessions(uncached_session_ids, found_session_ids)
+
+            return self.__results(payloads, active_session_ids)
+
+        except BaseHTTPException as error:
+            log.error(f"Error introspecting tokens: {error}")
+            raise
+
+    async def call_async(self, body: IntrospectRequestDTO) -> List[Dict[str, Any]]:
+        """
+        Public asynchronous method responsible for checking a list of tokens with an async session.
+
+        Args:
+            body (IntrospectRequestDTO): The DTO containing the tokens to check.
+
+        Returns:
+            List[Dict[str, Any]]: One result per token, as returned by `__call__`.
+        """
+
+        try:
+            payloads = [self.__decode(token) for token in body.tokens]
+            active_session_ids, uncached_session_ids = self.__find_known_session_ids(payloads)
+
+            if uncached_session_ids:
+                found_session_ids = await AsyncSessionAuthRepository(
+                    self.__session_db  # type: ignore
+                ).find_active_session_ids(uncached_session_ids)
+
+                active_session_ids |= self.__cache_sessions(uncached_session_ids, found_session_ids)
+
+            return self.__results(payloads, active_session_ids)
+
+        except BaseHTTPException as error:
+            log.error(f"Error introspecting tokens: {error}")
+            raise
+
+    def __decode(self, access_token: str) -> Dict[str, Any] | None:
+        """
+        Private method responsible for decoding a token and checking its signature and expiry.
+
+        Args:
+            access_token (str): The JWT token to decode.
+
+        Returns:
+            Dict[str, Any] | None: The token payload, or None if the token is invalid,
+                expired or has no session ID.
+        """
+
+        try:
+            payload = AuthUtil.decode_token(access_token)
+        except PyJWTError:
+            return None
+
+        return payload if payload.get("session_id") else None
+
+    def __find_known_session_ids(
+        self,
+        payloads: List[Dict[str, Any] | None]
+    ) -> tuple[set[str], List[str]]:
+        """
+        Private method responsible for resolving which sessions are active without the database.
+
+        Args:
+            payloads (List[Dict[str, Any] | None]): The decoded token payloads.
+
+        Returns:
+            tuple[set[str], List[str]]: The IDs of the sessions known to be active, and the
+                IDs of the sessions that must be looked up in the database.
+        """
+
+        session_ids = list({payload["session_id"] for payload in payloads if payload})
+
+        if revocation_list.enabled:
+            return {
+                session_id
+                for session_id in session_ids
+                if not revocation_list.is_revoked(session_id)
+            }, []
+
+        active_session_ids: set[str] = set()
+        uncached_session_ids: List[str] = []
+
+        for session_id in session_ids:
+            cached_session = session_cache.get(session_id)
+
+            if cached_session is None:
+                uncached_session_ids.append(session_id)
+            elif cached_session:
+                active_session_ids.add(session_id)
+
+        return active_session_ids, uncached_session_ids
+
+    def __cache_sessions(self, session_ids: List[str], active_session_ids: set[str]) -> set[str]:
+        """
+        Private method responsible for storing the state of the sessions read from the database in the session cache.
+
+        Args:
+            session_ids (List[str]): The IDs of the sessions looked up.
+            active_session_ids (set[str]): The IDs of the active sessions among them.
+
+        Returns:
+            set[str]: The IDs of the active sessions.
+        """
+
+        for session_id in session_ids:
+            session_cache.set(session_id, session_id in active_session_ids)
+
+        return active_session_ids
+
+    def __results(
+        self,
+        payloads: List[Dict[str, Any] | None],
+        active_session_ids: set[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Private method responsible for building the result of every token.
+
+        Args:
+            payloads (List[Dict[str, Any] | None]): The decoded token payloads.
+            active_session_ids (set[str]): The IDs of the active sessions.
+
+        Returns:
+            List[Dict[str, Any]]: One result per token, in the same order.
+        """
+
+        return [
+            self.__result(payload)
+            if payload and payload["session_id"] in active_session_ids
+            else {"active": False}
+            for payload in payloads
+        ]
+
+    def __result(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Private method responsible for formatting the result of an active token.
+
+        Args:
+            payload (Dict[str, Any]): The decoded token payload.
+
+        Returns:
+            Dict[str, Any]: The active flag and the token claims.
+        """
+
+        return {
+            "active": True,
+            "user_id": payload.get("user_id"),
+            "role": payload.get("role"),
+            "session_id": payload.get("session_id"),
+            "exp": payload.get("exp"),
+        }
@@ -5,11 +5,12 @@
 # PY
 import uuid
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from typing import Dict
 
 # Core
+from src.core.configurations import EnvConfig
 from src.core.exceptions import (
     BaseHTTPException,
     InvalidCredentialsException
@@ -32,9 +33,14 @@ from src.data.repositories import (
 # Utils
 from src.utils import (
     AuthUtil,
-    log
+    log,
+    revocation_list,
+    session_cache
 )
 
+# Env variables Setup
+JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = EnvConfig().jwt_refresh_token_expire_days
+
 
 class LoginUseCase:
     """
@@ -43,6 +49,9 @@ class LoginUseCase:
     This class manages user authentication by verifying credentials
     and generating JWT tokens.
 
+    Besides the access token, each login issues a refresh token bound to the new
+    session, valid for `JWT_REFRESH_TOKEN_EXPIRE_DAYS` (see `RefreshUseCase`).
+
     Class Args:
         session_db (Session): The database session used for executing queries.
     """
@@ -73,7 +82,7 @@ class LoginUseCase:
             body (AuthenticationRequestDTO): The DTO containing the user's email and password.
 
         Returns:
-            Dict[str, str]: A dictionary containing the access token and token type.
+            Dict[str, str]: A dictionary containing the access token, refresh token and token type.
 
         Raises:
             InvalidCredentialsException: If the email or password is incorrect.
@@ -81,6 +90,8 @@ class LoginUseCase:
         """
 
         try:
+            deactivated_session_ids: list[str] = []
+
             with self.__session_db.begin():
 
                 _token_repository = TokenRepository(self.__session_db)
@@ -102,16 +113,13 @@ class LoginUseCase:
                     )
                     raise InvalidCredentialsException("Invalid credentials!")
 
-                active_sessions = _session_auth_repository.find_active_sessions_by_user_id(verified_user.user_id)
-
-                if active_sessions:
-                    update_data = {
-                        "is_active": False,
-                        "logout_at": datetime.now(),
-                    }
+                if AuthUtil.needs_password_rehash(str(verified_user.password)):
+                    verified_user.password = AuthUtil.generate_password_hash(body.password)
+                    log.info(f"Password hash of user {verified_user.user_id} upgraded to the current parameters.")
 
-                    for session in active_sessions:
-                        _session_auth_repository.deactivate_session(session, update_data)
+                deactivated_session_ids = _session_auth_repository.deactivate_active_sessions_by_user_id(
+                    str(verified_user.user_id), datetime.now()
+                )
 
                 session_id = str(uuid.uuid4())
 
@@ -119,20 +127,28 @@ class LoginUseCase:
 
                 access_token = AuthUtil.create_token(token_data)
 
+                refresh_token = AuthUtil.create_refresh_token()
+
                 token_id = str(uuid.uuid4())
 
                 created_token: TokenModel = _token_repository.create_token(
                     token_id=token_id,
-                    access_token=access_token,
+                    token_digest=AuthUtil.token_digest(access_token),
                 )
 
                 _session_auth_repository.create_session(
                     session_id=session_id,
                     user_id=verified_user.user_id,
                     token_id=created_token.token_id,
+                    refresh_token_digest=AuthUtil.token_digest(refresh_token),
+                    refresh_expires_at=datetime.now() + timedelta(days=JWT_REFRESH_TOKEN_EXPIRE_DAYS),
                 )
 
-                return self.__response(access_token)
+            for deactivated_session_id in deactivated_session_ids:
+                session_cache.invalidate(deactivated_session_id)
+                revocation_list.revoke(deactivated_session_id)
+
+            return self.__response(access_token, refresh_token)
 
         except BaseHTTPException as error:
             log.error(f"Error authenticating user: {error}")
@@ -171,19 +187,21 @@ class LoginUseCase:
 
         return AuthUtil.check_password_hash(request_password, saved_password)
 
-    def __response(self, access_token: str) -> Dict[str, str]:
+    def __response(self, access_token: str, refresh_token: str) -> Dict[str, str]:
         """
         Private method responsible for formatting the authentication response.
 
         Args:
             access_token (str): The generated JWT access token.
+            refresh_token (str): The generated refresh token.
 
         Returns:
-            Dict[str, str]: A dictionary containing the access token and token type.
+            Dict[str, str]: A dictionary containing the access token, refresh token and token type.
         """
 
         return {
             "access_token": access_token,
+            "refresh_token": refresh_token,
             "token_type": "bearer",
         }
 
@@ -202,5 +220,5 @@ class LoginUseCase:
             "session_id": session_id,
             "user_id": str(user.user_id),
             "email": user.email,
-            "role": user.role.role_id,
+            "role": str(user.role_id),
         }
@@ -19,55 +19,79 @@ from src.data.repositories import SessionAuthRepository
 # Utils
 from src.utils import (
     AuthUtil,
-    log
+    log,
+    revocation_list,
+    session_cache
 )
 
 
 class LogoutUseCase:
     """
+    Class responsible for handling the logout use case.
+
+    This class deactivates the session bound to the authenticated token. The token
+    payload verified by `AuthMiddleware` is reused, and the session is deactivated
+    with a single conditional `UPDATE`.
+
+    Class Args:
+        session_db (Session): The database session used for executing queries.
     """
+
     def __init__(
         self,
-        sessio_db: Session
+        session_db: Session
     ):
-        self.__session_db = sessio_db
+        """
+        Constructor method for LogoutUseCase.
+
+        Args:
+            session_db (Session): The database session used for executing queries.
+        """
+
+        self.__session_db = session_db
 
     def __call__(
         self,
         request: Request
     ):
         """
-        """
-        try:
-            with self.__session_db.begin():
+        Public method responsible for logging out the authenticated session.
 
-                session_auth_repository = SessionAuthRepository(self.__session_db)
+        Args:
+            request (Request): The incoming request carrying the verified token payload.
+
+        Returns:
+            str: The logout confirmation message.
 
-                access_token = getattr(request.state, "access_token")
+        Raises:
+            UnauthorizedTokenException: If the token has no session or the session is already inactive.
+        """
+        try:
+            payload = getattr(request.state, "token_payload", None)
 
-                payload = AuthUtil.verify_token(access_token)
+            if payload is None:
+                payload = AuthUtil.verify_token(getattr(request.state, "access_token"))
 
-                session_id = payload.get("session_id")
+            session_id = payload.get("session_id")
 
-                if not session_id:
-                    raise UnauthorizedTokenException("Missing Session ID in token!")
+            if not session_id:
+                raise UnauthorizedTokenException("Missing Session ID in token!")
 
-                session = session_auth_repository.find_session_by_session_id(session_id)
+            with self.__session_db.begin():
 
-                if not session:
-                    raise UnauthorizedTokenException("Session already inactive or not found!")
+                session_auth_repository = SessionAuthRepository(self.__session_db)
 
-                update_data = {
-                    "is_active": False,
-                    "logout_at": datetime.now(),
-                }
+                deactivated_sessions = session_auth_repository.deactivate_active_session_by_session_id(
+                    session_id, datetime.now()
+                )
 
-                updated_session = session_auth_repository.deactivate_session(session, update_data)
+            session_cache.invalidate(session_id)
+            revocation_list.revoke(session_id)
 
-                session = session_auth_repository.find_active_session_by_session_id(updated_session.session_id)
+            if not deactivated_sessions:
+                raise UnauthorizedTokenException("Session already inactive or not found!")
 
-                if not session:
-                    return "Logout successful!"
+            return "Logout successful!"
 
         except (
             Exception,
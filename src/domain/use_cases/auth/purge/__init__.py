@@ -0,0 +1,117 @@
+# /src/domain/use_cases/auth/purge/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+import time
+from datetime import datetime, timedelta
+from typing import Dict
+
+# Core
+from src.core.configurations import DatabaseConfig, EnvConfig
+
+# Data
+from src.data.repositories import (
+    SessionAuthRepository,
+    TokenRepository
+)
+
+# Utils
+from src.utils import log
+
+# Env variables Setup
+JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = EnvConfig().jwt_access_token_expire_minutes
+JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = EnvConfig().jwt_refresh_token_expire_days
+SESSION_RETENTION_DAYS: int = EnvConfig().session_retention_days
+SESSION_PURGE_BATCH_SIZE: int = max(EnvConfig().session_purge_batch_size, 1)
+SESSION_PURGE_BATCH_SLEEP_SECONDS: float = EnvConfig().session_purge_batch_sleep_seconds
+
+
+class PurgeSessionUseCase:
+    """
+    Class responsible for handling the expired sessions purge use case.
+
+    Every login inserts a session and a token that are never removed, so this use
+    case deletes the sessions past their retention period (logged out, or created
+    long enough ago that their refresh token and last access token have expired)
+    together with their tokens, and then the tokens no session refers to.
+
+    Rows are deleted in batches of `SESSION_PURGE_BATCH_SIZE`, each in its own short
+    transaction followed by a `SESSION_PURGE_BATCH_SLEEP_SECONDS` pause, so the purge
+    never holds locks for long nor starves the request traffic.
+
+    It owns its database session, since it runs from the scheduler rather than a request.
+
+    Class Args:
+        None
+    """
+
+    def __call__(self) -> Dict[str, int]:
+        """
+        Public method responsible for purging the expired sessions and orphaned tokens.
+
+        Args:
+            None
+
+        Returns:
+            Dict[str, int]: The number of deleted sessions and tokens.
+        """
+
+        now = datetime.now()
+        logged_out_before = now - timedelta(days=SESSION_RETENTION_DAYS)
+        created_before = (
+            logged_out_before
+            - timedelta(days=JWT_REFRESH_TOKEN_EXPIRE_DAYS)
+            - timedelta(minutes=JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
+        ).strftime("%y-%m-%d %H:%M:%S")
+
+        start_time = time.perf_counter()
+        session_db = next(DatabaseConfig.get_db())
+
+        deleted = {"sessions": 0, "tokens": 0}
+
+        try:
+            session_repository = SessionAuthRepository(session_db)
+            token_repository = TokenRepository(session_db)
+
+            while True:
+                with session_db.begin():
+                    sessions = session_repository.find_expired_sessions(
+                        logged_out_before, created_before, SESSION_PURGE_BATCH_SIZE
+                    )
+                    deleted["sessions"] += session_repository.delete_sessions_by_session_ids(
+                        [session_id for session_id, _ in sessions]
+                    )
+                    deleted["tokens"] += token_repository.delete_tokens_by_token_ids(
+                        [token_id for _, token_id in sessions]
+                    )
+
+                if len(sessions) < SESSION_PURGE_BATCH_SIZE:
+                    break
+
+                time.sleep(SESSION_PURGE_BATCH_SLEEP_SECONDS)
+
+            while True:
+                with session_db.begin():
+                    token_ids = token_repository.find_orphan_token_ids(
+                        created_before, SESSION_PURGE_BATCH_SIZE
+                    )
+                    deleted["tokens"] += token_repository.delete_tokens_by_token_ids(token_ids)
+
+                if len(token_ids) < SESSION_PURGE_BATCH_SIZE:
+                    break
+
+                time.sleep(SESSION_PURGE_BATCH_SLEEP_SECONDS)
+
+        except Exception as error:
+            log.error(f"Error during the session purge process: {error}")
+            raise
+
+        finally:
+            session_db.close()
+
+        log.info(
+            f"Session purge -> sessions={deleted['sessions']} - tokens={deleted['tokens']} - {(time.perf_counter() - start_time):.2f}s"
+        )
+
+        return deleted
@@ -0,0 +1,125 @@
+# /src/domain/use_cases/auth/refresh/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+from datetime import datetime
+from sqlalchemy.orm import Session
+from typing import Dict
+
+# Core
+from src.core.exceptions import (
+    BaseHTTPException,
+    UnauthorizedTokenException
+)
+
+# Domain
+from src.domain.dtos import RefreshRequestDTO
+
+# Data
+from src.data.repositories import (
+    SessionAuthRepository,
+    TokenRepository
+)
+
+# Utils
+from src.utils import (
+    AuthUtil,
+    log
+)
+
+
+class RefreshUseCase:
+    """
+    Class responsible for handling the token refresh use case.
+
+    This class issues a new access token from the refresh token returned at login,
+    without verifying the password again. The refresh token is looked up by its
+    digest together with the session user in one indexed query, then rotated: the
+    session gets a new refresh token and the one used is no longer accepted.
+
+    The new access token keeps the session ID, so logging out the session revokes
+    both tokens. The refresh token lifetime counts from login and is not extended.
+
+    Class Args:
+        session_db (Session): The database session used for executing queries.
+    """
+
+    def __init__(
+        self,
+        session_db: Session
+    ) -> None:
+        """
+        Constructor method for RefreshUseCase.
+
+        Args:
+            session_db (Session): The database session used for executing queries.
+        """
+
+        self.__session_db = session_db
+
+    def __call__(self, body: RefreshRequestDTO) -> Dict[str, str]:
+        """
+        Public method responsible for exchanging a refresh token for a new access token.
+
+        Args:
+            body (RefreshRequestDTO): The DTO containing the refresh token.
+
+        Returns:
+            Dict[str, str]: A dictionary containing the access token, the new refresh token and token type.
+
+        Raises:
+            UnauthorizedTokenException: If the refresh token is unknown, expired, already used,
+                or its session is inactive.
+        """
+
+        try:
+            refresh_token_digest = AuthUtil.token_digest(body.refresh_token)
+
+            with self.__session_db.begin():
+
+                _session_auth_repository = SessionAuthRepository(self.__session_db)
+                _token_repository = TokenRepository(self.__session_db)
+
+                session = _session_auth_repository.find_refreshable_session(
+                    refresh_token_digest, datetime.now()
+                )
+
+                if not session:
+                    log.info("Refresh token unknown, expired or revoked!")
+                    raise UnauthorizedTokenException("Invalid refresh token!")
+
+                new_refresh_token = AuthUtil.create_refresh_token()
+
+                rotated_sessions = _session_auth_repository.rotate_refresh_token(
+                    session.session_id,
+                    refresh_token_digest,
+                    AuthUtil.token_digest(new_refresh_token),
+                )
+
+                if not rotated_sessions:
+                    log.warning(f"Refresh token of session {session.session_id} already used!")
+                    raise UnauthorizedTokenException("Invalid refresh token!")
+
+                access_token = AuthUtil.create_token(
+                    {
+                        "session_id": session.session_id,
+                        "user_id": str(session.user_id),
+                        "email": session.email,
+                        "role": str(session.role_id),
+                    }
+                )
+
+                _token_repository.update_token_digest(
+                    session.token_id, AuthUtil.token_digest(access_token)
+                )
+
+            return {
+                "access_token": access_token,
+                "refresh_token": new_refresh_token,
+                "token_type": "bearer",
+            }
+
+        except BaseHTTPException as error:
+            log.error(f"Error refreshing token: {error}")
+            raise
@@ -26,6 +26,9 @@ class ValidateUseCase:
 
     This class manages user authentication by verifying credentials
     and generating JWT tokens.
+
+    The token payload verified by `AuthMiddleware` is reused, so the token is not
+    verified a second time.
     """
 
     def __call__(self, request: Request) -> Dict[str, Any]:
@@ -53,7 +56,10 @@ class ValidateUseCase:
             if not access_token:
                 raise InvalidTokenException("Token missing or invalid!")
 
-            payload: Any = AuthUtil.verify_token(access_token)
+            payload: Any = getattr(request.state, "token_payload", None)
+
+            if payload is None:
+                payload = AuthUtil.verify_token(access_token)
 
             if not payload:
 
@@ -0,0 +1,50 @@
+# /src/domain/use_cases/auth/verify/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+from typing import Any, Dict
+
+from fastapi import Request
+
+# Core
+from src.core.exceptions import InvalidTokenException
+
+
+class VerifyUseCase:
+    """
+    Class responsible for handling the gateway token verification use case.
+
+    The token is verified once, by `AuthMiddleware`, and this use case only reads
+    the claims of the payload it stored in the request state: no database query
+    and no second signature check.
+
+    Class Args:
+        None
+    """
+
+    def __call__(self, request: Request) -> Dict[str, Any]:
+        """
+        Public method responsible for returning the claims of the verified token.
+
+        Args:
+            request (Request): The incoming request carrying the verified token payload.
+
+        Returns:
+            Dict[str, Any]: The user ID, role, session ID and expiry (UNIX time) of the token.
+
+        Raises:
+            InvalidTokenException: If the request was not authenticated by `AuthMiddleware`.
+        """
+
+        payload = getattr(request.state, "token_payload", None)
+
+        if not payload:
+            raise InvalidTokenException("Token missing or invalid!")
+
+        return {
+            "user_id": payload.get("user_id"),
+            "role": payload.get("role"),
+            "session_id": payload.get("session_id"),
+            "exp": payload.get("exp"),
+        }
@@ -0,0 +1,265 @@
+# /src/domain/use_cases/user/bulk/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+import uuid
+from typing import Any, Dict, List, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+
+# Core
+from src.core.exceptions import BaseHTTPException
+
+# Data
+from src.data.repositories import UserRepository
+
+# Domain
+from src.domain.dtos import CreateUserReqBodyDTO
+
+# Utils
+from src.utils import (
+    AuthUtil,
+    log
+)
+
+
+class BulkCreateUserUseCase:
+    """
+    Class responsible for handling the bulk user creation use case.
+
+    Users are processed in chunks. For each chunk, every item is validated on its
+    own, the registered emails are found with a single `IN` query, the passwords
+    are hashed in parallel in the password hashing process pool and the valid rows
+    are inserted with one batched `INSERT`.
+
+    Invalid or duplicated items do not abort the import: each item gets its own
+    result, with the created user ID or the reason it was rejected.
+
+    An instance tracks the emails seen across chunks, so it must be used for a
+    single import.
+
+    Class Args:
+        repository (UserRepository): The repository used to query and insert users.
+    """
+
+    __chunk_size = 500
+
+    def __init__(
+        self,
+        repository: UserRepository
+    ) -> None:
+        """
+        Constructor method for BulkCreateUserUseCase.
+
+        Args:
+            repository (UserRepository): The repository used to query and insert users.
+        """
+
+        self.__repository: UserRepository = repository
+        self.__seen_emails: set[str] = set()
+
+    @property
+    def chunk_size(self) -> int:
+        """
+        Property method responsible for returning the number of items processed per chunk.
+
+        Args:
+            None
+
+        Returns:
+            int: The chunk size.
+        """
+
+        return self.__chunk_size
+
+    def __call__(
+        self,
+        items: List[Tuple[int, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Public method responsible for creating one chunk of users.
+
+        Args:
+            items (List[Tuple[int, Any]]): The position of each item in the import and its raw value.
+
+        Returns:
+            List[Dict[str, Any]]: One result per item, ordered by position.
+        """
+
+        results: Dict[int, Dict[str, Any]] = {}
+        bodies: List[Tuple[int, CreateUserReqBodyDTO]] = []
+
+        for index, item in items:
+            try:
+                body = self.__validate(item)
+            except (BaseHTTPException, ValidationError, TypeError) as error:
+                results[index] = self.__failed(index, self.__error_message(error))
+                continue
+
+            if body.email in self.__seen_emails:
+                results[index] = self.__failed(
+                    index, f"User with email {body.email} is duplicated in the request!"
+                )
+                continue
+
+            self.__seen_emails.add(body.email)
+            bodies.append((index, body))
+
+        existing_emails = self.__repository.find_existing_emails(
+            [body.email for _, body in bodies]
+        )
+
+        new_bodies = []
+
+        for index, body in bodies:
+            if body.email in existing_emails:
+                results[index] = self.__failed(
+                    index, f"User with email {body.email} already exists!"
+                )
+            else:
+                new_bodies.append((index, body))
+
+        hashed_passwords = AuthUtil.generate_password_hashes(
+            [body.password for _, body in new_bodies]
+        )
+
+        rows = [
+            (
+                index,
+                {
+                    "user_id": str(uuid.uuid4()),
+                    "name": body.name,
+                    "email": body.email,
+                    "status": body.status,
+                    "password": hashed_password,
+                },
+            )
+            for (index, body), hashed_password in zip(new_bodies, hashed_passwords)
+        ]
+
+        results.update(self.__insert(rows))
+
+        return [results[index] for index in sorted(results)]
+
+    def __validate(self, item: Any) -> CreateUserReqBodyDTO:
+        """
+        Private method responsible for validating one item of the import.
+
+        Args:
+            item (Any): The raw item.
+
+        Returns:
+            CreateUserReqBodyDTO: The validated user.
+
+        Raises:
+            TypeError: If the item is not a JSON object.
+            BaseHTTPException: If a field is missing, extra or invalid.
+            ValidationError: If a field has an invalid type or format.
+        """
+
+        if not isinstance(item, dict):
+            raise TypeError("Each user must be a JSON object!")
+
+        return CreateUserReqBodyDTO.model_validate(item)
+
+    def __insert(
+        self,
+        rows: List[Tuple[int, Dict[str, Any]]]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Private method responsible for inserting the valid rows of a chunk.
+
+        The rows are inserted with a single statement. If it violates a constraint
+        (e.g. an email registered concurrently), the rows are retried one by one
+        so only the conflicting ones are reported as failed.
+
+        Args:
+            rows (List[Tuple[int, Dict[str, Any]]]): The position and column values of each user.
+
+        Returns:
+            Dict[int, Dict[str, Any]]: The result of each row, by position.
+        """
+
+        try:
+            self.__repository.create_users([row for _, row in rows])
+            return {index: self.__created(index, row) for index, row in rows}
+
+        except IntegrityError as error:
+            log.error(f"Bulk insert conflict, retrying rows one by one: {error.orig}")
+
+        results: Dict[int, Dict[str, Any]] = {}
+
+        for index, row in rows:
+            try:
+                self.__repository.create_users([row])
+                results[index] = self.__created(index, row)
+            except IntegrityError:
+                results[index] = self.__failed(
+                    index, f"User with email {row['email']} already exists!"
+                )
+
+        return results
+
+    @staticmethod
+    def __error_message(error: Exception) -> str:
+        """
+        Private method responsible for extracting a readable message from a validation error.
+
+        Args:
+            error (Exception): The validation error.
+
+        Returns:
+            str: The error message.
+        """
+
+        if isinstance(error, BaseHTTPException):
+            return str(error.detail)
+
+        if isinstance(error, ValidationError):
+            return "; ".join(
+                f"{'.'.join(str(loc) for loc in detail['loc'])}: {detail['msg']}"
+                for detail in error.errors()
+            )
+
+        return str(error)
+
+    @staticmethod
+    def __created(index: int, row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Private method responsible for formatting the result of a created user.
+
+        Args:
+            index (int): The position of the item in the import.
+            row (Dict[str, Any]): The inserted column values.
+
+        Returns:
+            Dict[str, Any]: The item result.
+        """
+
+        return {
+            "index": index,
+            "status": "created",
+            "user_id": row["user_id"],
+            "email": row["email"],
+        }
+
+    @staticmethod
+    def __failed(index: int, error: str) -> Dict[str, Any]:
+        """
+        Private method responsible for formatting the result of a rejected item.
+
+        Args:
+            index (int): The position of the item in the import.
+            error (str): The reason the item was rejected.
+
+        Returns:
+            Dict[str, Any]: The item result.
+        """
+
+        return {
+            "index": index,
+            "status": "failed",
+            "error": error,
+        }
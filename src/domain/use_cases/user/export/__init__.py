@@ -0,0 +1,145 @@
+# /src/domain/use_cases/user/export/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+import csv
+import io
+import json
+from typing import Any, Iterator
+
+# Core
+from src.core.configurations import DatabaseConfig
+
+# Data
+from src.data.repositories import UserRepository
+
+# Domain
+from src.domain.dtos import ExportUserQueryDTO
+from src.domain.enums import UserExportFormatEnum
+
+# Utils
+from src.utils import log
+
+
+class ExportUserUseCase:
+    """
+    Class responsible for handling the user export use case.
+
+    This class streams the user table as NDJSON or CSV. Users are read in batches
+    through a server-side cursor and each batch is serialized into one chunk, so
+    memory usage stays constant regardless of the table size.
+
+    The export owns its database session: it is opened when streaming starts and
+    closed when the last chunk has been produced (or the client disconnects).
+
+    Class Args:
+        None
+    """
+
+    __batch_size = 1000
+
+    __columns = (
+        "user_id",
+        "name",
+        "email",
+        "status",
+        "role_id",
+        "created_at",
+        "updated_at",
+    )
+
+    def __call__(self, query: ExportUserQueryDTO) -> Iterator[str]:
+        """
+        Public method responsible for producing the export stream.
+
+        Args:
+            query (ExportUserQueryDTO): The export format and filters.
+
+        Returns:
+            Iterator[str]: The serialized chunks of the export.
+        """
+
+        return self.__stream(query)
+
+    def __stream(self, query: ExportUserQueryDTO) -> Iterator[str]:
+        """
+        Private method responsible for reading the users and serializing each batch.
+
+        Args:
+            query (ExportUserQueryDTO): The export format and filters.
+
+        Yields:
+            Iterator[str]: The serialized chunks of the export.
+        """
+
+        session_db = next(DatabaseConfig.get_db())
+        exported = 0
+
+        try:
+            repository = UserRepository(session_db)
+            is_csv = query.format == UserExportFormatEnum.CSV
+
+            if is_csv:
+                yield self.__to_csv([self.__columns])
+
+            for rows in repository.stream_users(
+                batch_size=self.__batch_size,
+                status=query.status,
+                role_id=query.role_id,
+            ):
+                records = [self.__to_record(row) for row in rows]
+                exported += len(records)
+
+                if is_csv:
+                    yield self.__to_csv(
+                        [record.values() for record in records]
+                    )
+                else:
+                    yield "".join(
+                        json.dumps(record, separators=(",", ":")) + "\n"
+                        for record in records
+                    )
+
+            log.info(f"User export finished: {exported} users exported as {query.format.value}.")
+
+        except Exception as error:
+            log.error(f"Error during the user export process after {exported} users: {error}")
+            raise
+
+        finally:
+            session_db.close()
+
+    def __to_record(self, row: Any) -> dict[str, str | None]:
+        """
+        Private method responsible for converting a row into an export record.
+
+        Args:
+            row (Any): The row returned by the repository.
+
+        Returns:
+            dict[str, str | None]: The exported user fields.
+        """
+
+        record = dict(zip(self.__columns, row))
+        status = record["status"]
+        record["status"] = getattr(status, "value", status)
+
+        return record
+
+    @staticmethod
+    def __to_csv(rows: Any) -> str:
+        """
+        Private static method responsible for serializing rows into CSV lines.
+
+        Args:
+            rows (Any): The rows to serialize.
+
+        Returns:
+            str: The CSV lines.
+        """
+
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+
+        return buffer.getvalue()
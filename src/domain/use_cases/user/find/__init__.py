@@ -3,10 +3,16 @@
 # flake8: noqa: E501
 
 # PY
-from typing import Dict, List, Union
+import base64
+import binascii
+import json
+from typing import Any, Dict, List, Union
 
 # Core
-from src.core.exceptions import UserNotFoundException
+from src.core.exceptions import (
+    InvalidValueInFieldException,
+    UserNotFoundException
+)
 
 # Data
 from src.data.models import UserModel
@@ -46,34 +52,40 @@ class FindUserUseCase:
     def __call__(
         self,
         query: FindUserByUserIdQueryDTO
-    ) -> Union[Dict[str, str], List[Dict[str, str]]]:
+    ) -> Union[Dict[str, str], Dict[str, Any]]:
         """
         Public method responsible for searching for a user.
 
         If a `user_id` is provided, this method searches for the corresponding user.
-        If no `user_id` is provided, it retrieves all users.
+        If no `user_id` is provided, it retrieves one page of users using keyset
+        pagination and the optional filters.
 
         Args:
-            user_id (str | None, optional): The ID of the user to search for. Defaults to None.
+            query (FindUserByUserIdQueryDTO): The user ID, or the pagination and filter parameters.
 
         Returns:
-            Union[Dict[str, str], List[Dict[str, str]]]: A dictionary containing user details
-            if a single user is found, or a list of dictionaries for multiple users.
+            Union[Dict[str, str], Dict[str, Any]]: A dictionary containing user details
+            if a single user is found, or a dictionary with the `users` of the page
+            and the `next_cursor` (None on the last page).
 
         Raises:
             UserNotFoundException: If the specified user ID is invalid.
+            InvalidValueInFieldException: If the cursor is malformed.
             Exception: If an unexpected error occurs during user retrieval.
         """
 
         try:
             user_id = query.user_id
             if user_id is None:
-                users = self.__repository.find_users()
-
-                if users is None:
-                    log.info("No users found!")
-                    return []
-                return self.__response_list(users)
+                rows = self.__repository.find_users_page(
+                    limit=query.limit + 1,
+                    after=self.__decode_cursor(query.cursor),
+                    status=query.status,
+                    role_id=query.role_id,
+                    email_prefix=query.email_prefix,
+                )
+
+                return self.__response_page(rows, query.limit)
             else:
                 user = self.__repository.find_user(user_id)
                 if not user:
@@ -104,15 +116,71 @@ class FindUserUseCase:
             "email": str(user.email),
         }
 
-    def __response_list(self, users: List[UserModel]) -> List[Dict[str, str]]:
+    def __response_page(self, rows: List[Any], limit: int) -> Dict[str, Any]:
+        """
+        Private method responsible for formatting a page of users.
+
+        The repository is asked for one row more than the page size; if it is
+        returned, there is a next page and its cursor is the key of the last
+        user of the current page.
+
+        Args:
+            rows (List[Any]): The rows returned by the repository (up to `limit + 1`).
+            limit (int): The page size.
+
+        Returns:
+            Dict[str, Any]: The `users` of the page and the `next_cursor`.
+        """
+
+        page = rows[:limit]
+        next_cursor = None
+
+        if len(rows) > limit and page:
+            last = page[-1]
+            next_cursor = self.__encode_cursor(str(last.created_at), str(last.user_id))
+
+        return {
+            "users": [self.__response(row) for row in page],
+            "next_cursor": next_cursor,
+        }
+
+    @staticmethod
+    def __encode_cursor(created_at: str, user_id: str) -> str:
         """
-        Private method responsible for formatting a list of users.
+        Private static method responsible for encoding a pagination key into an opaque cursor.
 
         Args:
-            users (List[UserModel]): A list of user instances to format.
+            created_at (str): The creation date of the last user of the page.
+            user_id (str): The ID of the last user of the page.
 
         Returns:
-            List[Dict[str, str]]: A list of dictionaries containing user details.
+            str: The URL-safe cursor.
+        """
+
+        raw = json.dumps([created_at, user_id], separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def __decode_cursor(cursor: str | None) -> tuple[str, str] | None:
         """
+        Private static method responsible for decoding an opaque cursor into a pagination key.
 
-        return [self.__response(user) for user in users]
+        Args:
+            cursor (str | None): The cursor received in the query string.
+
+        Returns:
+            tuple[str, str] | None: The `(created_at, user_id)` key, or None for the first page.
+
+        Raises:
+            InvalidValueInFieldException: If the cursor is malformed.
+        """
+
+        if not cursor:
+            return None
+
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            created_at, user_id = json.loads(base64.urlsafe_b64decode(padded))
+            return str(created_at), str(user_id)
+        except (binascii.Error, ValueError, TypeError):
+            raise InvalidValueInFieldException("The field cursor is invalid!")
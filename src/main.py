@@ -12,6 +12,8 @@ the server.
 
 # PY
 import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 import uvicorn
 from fastapi import APIRouter, FastAPI, HTTPException
@@ -19,24 +21,33 @@ from fastapi.exceptions import RequestValidationError
 
 # Core
 from src.core.configurations import (
+    DatabaseConfig,
     EnvConfig,
     SchedulerConfig
 )
 from src.core.handlers.exception import ExceptionHandler
 from src.core.middleware import (
     AuthMiddleware,
-    LoggerMiddleware
+    LoggerMiddleware,
+    MetricsMiddleware
 )
 
+# Domain
+from src.domain.use_cases import PurgeSessionUseCase
+
 # Presentation
 from src.presentation.routes import ApiRouter
+from src.presentation.routes.metrics import metrics_router
 
 # Utils
 from src.utils import (
     DatabaseUtil,
     DotEnvUtil,
     log,
-    MessageUtil
+    MessageUtil,
+    metrics,
+    permission_cache,
+    revocation_list
 )
 
 # Env variables Setup
@@ -44,12 +55,12 @@ API_HOST = EnvConfig().api_host
 API_NAME = EnvConfig().api_name
 API_PORT = EnvConfig().api_port
 API_VERSION = EnvConfig().api_version
-
-app = FastAPI(
-    title=API_NAME,
-    version=API_VERSION,
-    description=f"{API_NAME} API documentation!"
-)
+DATABASE_POOL_LOG_INTERVAL_SECONDS = EnvConfig().database_pool_log_interval_seconds
+SESSION_PURGE_INTERVAL_SECONDS = EnvConfig().session_purge_interval_seconds
+AUTH_REVOCATION_REFRESH_SECONDS = EnvConfig().auth_revocation_refresh_seconds
+AUTH_PERMISSION_REFRESH_SECONDS = EnvConfig().auth_permission_refresh_seconds
+METRICS_ENABLED = EnvConfig().metrics_enabled
+METRICS_REFRESH_SECONDS = EnvConfig().metrics_refresh_seconds
 
 
 def my_function():
@@ -68,15 +79,81 @@ def my_function():
     log.info(f"Testing... {time.strftime("%Y-%m-%d %H:%M:%S")}")
 
 
-my_scheduler_task = SchedulerConfig()
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Standalone function responsible for starting and stopping the scheduled tasks.
+
+    The caches are loaded and the tasks scheduled when the server starts rather
+    than when this module is imported, since the password hashing worker
+    processes (started with `forkserver`) import the main module again.
+
+    Args:
+        app (FastAPI): The application instance.
+
+    Yields:
+        None
+    """
+
+    my_scheduler_task = SchedulerConfig()
+
+    # my_scheduler_task.init(my_function, 5)
 
-# my_scheduler_task.init(my_function, 5)
+    if DATABASE_POOL_LOG_INTERVAL_SECONDS > 0:
+        my_scheduler_task.init(
+            DatabaseConfig.log_pool_status,
+            DATABASE_POOL_LOG_INTERVAL_SECONDS
+        )
+
+    if revocation_list.enabled:
+        revocation_list.refresh()
+        my_scheduler_task.init(
+            revocation_list.refresh,
+            max(AUTH_REVOCATION_REFRESH_SECONDS, 1)
+        )
+
+    permission_cache.refresh()
+
+    if AUTH_PERMISSION_REFRESH_SECONDS > 0:
+        my_scheduler_task.init(
+            permission_cache.refresh,
+            AUTH_PERMISSION_REFRESH_SECONDS
+        )
+
+    if METRICS_ENABLED and metrics.multiprocess and METRICS_REFRESH_SECONDS > 0:
+        my_scheduler_task.init(
+            metrics.refresh,
+            METRICS_REFRESH_SECONDS
+        )
+
+    if SESSION_PURGE_INTERVAL_SECONDS > 0:
+        my_scheduler_task.init(
+            PurgeSessionUseCase(),
+            SESSION_PURGE_INTERVAL_SECONDS
+        )
+
+    try:
+        yield
+    finally:
+        my_scheduler_task.shutdown()
+
+
+app = FastAPI(
+    title=API_NAME,
+    version=API_VERSION,
+    description=f"{API_NAME} API documentation!",
+    lifespan=lifespan
+)
 
 app.add_exception_handler(HTTPException, ExceptionHandler.http_exception_handler)  # type: ignore
 app.add_exception_handler(RequestValidationError, ExceptionHandler.json_decode_error_handler)  # type: ignore
 
-app.add_middleware(LoggerMiddleware)
 app.add_middleware(AuthMiddleware)
+app.add_middleware(LoggerMiddleware)
+
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router)
 
 api_router: APIRouter = ApiRouter().router
 
@@ -3,12 +3,21 @@
 # flake8: noqa: E501, F401
 
 # Auth
+from src.presentation.controllers.auth.introspect import IntrospectController
+from src.presentation.controllers.auth.jwks import JwksController
 from src.presentation.controllers.auth.login import LoginController
 from src.presentation.controllers.auth.logout import LogoutController
+from src.presentation.controllers.auth.refresh import RefreshController
 from src.presentation.controllers.auth.validate import ValidateController
+from src.presentation.controllers.auth.verify import VerifyController
+
+# Metrics
+from src.presentation.controllers.metrics import MetricsController
 
 # User
+from src.presentation.controllers.user.bulk import BulkCreateUserController
 from src.presentation.controllers.user.create import CreateUserController
+from src.presentation.controllers.user.export import ExportUserController
 from src.presentation.controllers.user.find import FindUserController
 from src.presentation.controllers.user.remove import RemoveUserController
 from src.presentation.controllers.user.update import UpdateUserController
\ No newline at end of file
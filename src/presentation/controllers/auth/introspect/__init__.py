@@ -0,0 +1,81 @@
+# /src/presentation/controllers/auth/introspect/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+from fastapi import status
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+# Domain
+from src.domain.dtos import IntrospectRequestDTO
+from src.domain.use_cases import IntrospectUseCase
+
+# Utils
+from src.utils import json_response
+
+
+class IntrospectController:
+    """
+    Class Controller responsible for handling batch token introspection requests.
+
+    This class provides an endpoint for internal services to check many tokens
+    in one request.
+
+    Class Args:
+        session_db (Session | AsyncSession): The database session used for executing queries.
+    """
+
+    def __init__(
+        self,
+        session_db: Session | AsyncSession
+    ) -> None:
+        """
+        Constructor method that initializes the IntrospectController with database dependencies.
+
+        Args:
+            session_db (Session | AsyncSession): Database session dependency,
+                injected via FastAPI's Depends.
+        """
+        self.__use_case = IntrospectUseCase(session_db)
+
+    def __call__(self, body: IntrospectRequestDTO) -> JSONResponse:
+        """
+        Public method that checks the given tokens.
+
+        Args:
+            body (IntrospectRequestDTO): Data Transfer Object (DTO) containing the tokens.
+
+        Returns:
+            JSONResponse: A JSON response with one result per token, in the request order.
+        """
+        response = self.__use_case(body)
+
+        message = "Tokens introspected!"
+
+        return json_response(
+            status_code=status.HTTP_200_OK,
+            message=message,
+            data=response,
+        )
+
+    async def call_async(self, body: IntrospectRequestDTO) -> JSONResponse:
+        """
+        Public asynchronous method that checks the given tokens with an async session.
+
+        Args:
+            body (IntrospectRequestDTO): Data Transfer Object (DTO) containing the tokens.
+
+        Returns:
+            JSONResponse: A JSON response with one result per token, in the request order.
+        """
+        response = await self.__use_case.call_async(body)
+
+        message = "Tokens introspected!"
+
+        return json_response(
+            status_code=status.HTTP_200_OK,
+            message=message,
+            data=response,
+        )
@@ -0,0 +1,37 @@
+# /src/presentation/controllers/auth/jwks/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+from fastapi.responses import JSONResponse
+
+# Utils
+from src.utils import AuthUtil
+
+
+class JwksController:
+    """
+    Class Controller responsible for publishing the token verification keys.
+
+    The keys are returned as a standard JSON Web Key Set (not wrapped in the API
+    response envelope), so other services can validate tokens locally with any
+    JWKS-aware JWT library.
+
+    Class Args:
+        None
+    """
+
+    __max_age_seconds = 300
+
+    def __call__(self) -> JSONResponse:
+        """
+        Public method that returns the JSON Web Key Set.
+
+        Returns:
+            JSONResponse: The JWKS document, cacheable by clients.
+        """
+
+        return JSONResponse(
+            content=AuthUtil.jwks(),
+            headers={"Cache-Control": f"public, max-age={self.__max_age_seconds}"},
+        )
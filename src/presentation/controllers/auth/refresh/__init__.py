@@ -0,0 +1,66 @@
+# /src/presentation/controllers/auth/refresh/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+from fastapi import status
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+# Domain
+from src.domain.dtos import (
+    LoginResponseDTO,
+    RefreshRequestDTO
+)
+from src.domain.use_cases import RefreshUseCase
+
+# Utils
+from src.utils import json_response
+
+
+class RefreshController:
+    """
+    Class Controller responsible for handling token refresh requests.
+
+    This class provides an endpoint to exchange a refresh token for a new access
+    token and a new refresh token.
+
+    Class Args:
+        session_db (Session): The database session used for executing queries.
+    """
+
+    def __init__(
+        self,
+        session_db: Session
+    ) -> None:
+        """
+        Constructor method that initializes the RefreshController with database dependencies.
+
+        Args:
+            session_db (Session): Database session dependency,
+                injected via FastAPI's Depends.
+        """
+        self.__use_case = RefreshUseCase(session_db)
+
+    def __call__(self, body: RefreshRequestDTO) -> JSONResponse:
+        """
+        Public method that renews the access token of a session.
+
+        Args:
+            body (RefreshRequestDTO): Data Transfer Object (DTO) containing the refresh token.
+
+        Returns:
+            JSONResponse: A JSON response containing the new tokens if successful.
+
+        Raises:
+            HTTPException: If the refresh token is invalid.
+        """
+        response = self.__use_case(body)
+
+        message = "Token refreshed successfully!"
+
+        return json_response(
+            status_code=status.HTTP_200_OK,
+            message=message,
+            data=LoginResponseDTO(root=response).model_dump(),
+        )
@@ -0,0 +1,81 @@
+# /src/presentation/controllers/auth/verify/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+import time
+
+from fastapi import Request, Response, status
+
+# Core
+from src.core.configurations import EnvConfig
+
+# Domain
+from src.domain.use_cases import VerifyUseCase
+
+# Utils
+from src.utils import AuthUtil
+
+# Env variables Setup
+AUTH_VERIFY_CACHE_SECONDS: int = EnvConfig().auth_verify_cache_seconds
+
+
+class VerifyController:
+    """
+    Class Controller responsible for handling gateway token verification requests.
+
+    The response has an empty body (`204 No Content`): the claims are returned in
+    the `X-User-Id`, `X-User-Role` and `X-Session-Id` headers, which a gateway can
+    forward upstream (e.g. nginx `auth_request_set`, Envoy `ext_authz`).
+
+    The response may be cached for `AUTH_VERIFY_CACHE_SECONDS`, never beyond the
+    token expiry. Its `ETag` is the token digest, so a request with a matching
+    `If-None-Match` gets a `304 Not Modified` once the token is verified again.
+
+    Class Args:
+        None
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor method that initializes the VerifyController.
+
+        Args:
+            None
+        """
+        self.__use_case = VerifyUseCase()
+
+    def __call__(self, request: Request) -> Response:
+        """
+        Public method that returns the claims of the verified token as response headers.
+
+        Args:
+            request (Request): The incoming request carrying the verified token payload.
+
+        Returns:
+            Response: An empty `204 No Content` (or `304 Not Modified`) response.
+
+        Raises:
+            HTTPException: If the request was not authenticated.
+        """
+        claims = self.__use_case(request)
+
+        etag = f'"{AuthUtil.token_digest(request.state.access_token)}"'
+        max_age = min(
+            AUTH_VERIFY_CACHE_SECONDS,
+            int(claims["exp"] or 0) - int(time.time()),
+        )
+
+        headers = {
+            "X-User-Id": str(claims["user_id"]),
+            "X-User-Role": str(claims["role"]),
+            "X-Session-Id": str(claims["session_id"]),
+            "ETag": etag,
+            "Cache-Control": f"private, max-age={max_age}" if max_age > 0 else "no-store",
+            "Vary": "Authorization",
+        }
+
+        if request.headers.get("If-None-Match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        return Response(status_code=status.HTTP_204_NO_CONTENT, headers=headers)
@@ -0,0 +1,33 @@
+# /src/presentation/controllers/metrics/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+from fastapi.responses import Response
+
+# Utils
+from src.utils import metrics
+
+
+class MetricsController:
+    """
+    Class Controller responsible for exposing the application metrics.
+
+    The metrics are returned in the Prometheus text format (not wrapped in the API
+    response envelope), aggregated across the workers in multiprocess mode.
+
+    Class Args:
+        None
+    """
+
+    def __call__(self) -> Response:
+        """
+        Public method that returns the metrics document.
+
+        Returns:
+            Response: The metrics, in the Prometheus text exposition format.
+        """
+
+        content, media_type = metrics.render()
+
+        return Response(content=content, media_type=media_type)
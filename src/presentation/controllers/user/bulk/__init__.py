@@ -0,0 +1,166 @@
+# /src/presentation/controllers/user/bulk/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+import json
+from typing import Any, AsyncIterator, Callable, Dict, List, Tuple
+
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+# Core
+from src.core.exceptions import InvalidValueInFieldException
+
+# Data
+from src.data.repositories import UserRepository
+
+# Domain
+from src.domain.use_cases import BulkCreateUserUseCase
+
+# Utils
+from src.utils import ResponseUtil
+
+response_json: Callable[..., JSONResponse] = ResponseUtil().json_response
+
+
+class BulkCreateUserController:
+    """
+    Class Controller responsible for handling bulk user creation requests.
+
+    The body is either a JSON array of users or an NDJSON stream (one user per
+    line, `Content-Type: application/x-ndjson`). NDJSON bodies are read
+    incrementally, so only one chunk of users is held in memory at a time.
+
+    Class Args:
+        session_db (Session): The database session used for executing queries.
+    """
+
+    def __init__(
+        self,
+        session_db: Session
+    ) -> None:
+        """
+        Constructor method that initializes the BulkCreateUserController with database dependencies.
+
+        Args:
+            session_db (Session): The database session used for executing queries.
+        """
+        self.__repository = UserRepository(session_db)
+        self.__use_case = BulkCreateUserUseCase(self.__repository)
+
+    async def __call__(
+        self,
+        request: Request
+    ) -> JSONResponse:
+        """
+        Public asynchronous method that creates the users of the request body.
+
+        Each chunk is created in a worker thread, since it runs blocking queries
+        and waits for the password hashes.
+
+        Args:
+            request (Request): The incoming request.
+
+        Returns:
+            JSONResponse: A JSON response with the created and failed counts and one result per user.
+                The status is 201 if every user was created, otherwise 207.
+        """
+
+        results: List[Dict[str, Any]] = []
+        chunk: List[Tuple[int, Any]] = []
+
+        async for index, item, error in self.__items(request):
+            if error is not None:
+                results.append({"index": index, "status": "failed", "error": error})
+                continue
+
+            chunk.append((index, item))
+
+            if len(chunk) >= self.__use_case.chunk_size:
+                results.extend(await run_in_threadpool(self.__use_case, chunk))
+                chunk = []
+
+        if chunk:
+            results.extend(await run_in_threadpool(self.__use_case, chunk))
+
+        results.sort(key=lambda result: result["index"])
+
+        created = sum(1 for result in results if result["status"] == "created")
+        failed = len(results) - created
+
+        return response_json(
+            status_code=status.HTTP_201_CREATED if not failed else status.HTTP_207_MULTI_STATUS,
+            message=f"{created} users created, {failed} failed!",
+            data={
+                "created": created,
+                "failed": failed,
+                "results": results,
+            },
+        )
+
+    async def __items(self, request: Request) -> AsyncIterator[Tuple[int, Any, str | None]]:
+        """
+        Private asynchronous method responsible for reading the users from the request body.
+
+        Args:
+            request (Request): The incoming request.
+
+        Yields:
+            Tuple[int, Any, str | None]: The position of each item, its decoded value
+                and, if the item could not be decoded, the error message.
+
+        Raises:
+            InvalidValueInFieldException: If a JSON body is not an array.
+        """
+
+        if "ndjson" in request.headers.get("content-type", ""):
+            index = 0
+            buffer = b""
+
+            async for data in request.stream():
+                buffer += data
+                *lines, buffer = buffer.split(b"\n")
+
+                for line in lines:
+                    if line.strip():
+                        yield self.__decode(index, line)
+                        index += 1
+
+            if buffer.strip():
+                yield self.__decode(index, buffer)
+
+            return
+
+        try:
+            body = json.loads(await request.body())
+        except ValueError:
+            body = None
+
+        if not isinstance(body, list):
+            raise InvalidValueInFieldException(
+                "The request body must be a JSON array of users or an NDJSON stream!"
+            )
+
+        for index, item in enumerate(body):
+            yield index, item, None
+
+    @staticmethod
+    def __decode(index: int, line: bytes) -> Tuple[int, Any, str | None]:
+        """
+        Private method responsible for decoding one NDJSON line.
+
+        Args:
+            index (int): The position of the line in the stream.
+            line (bytes): The raw line.
+
+        Returns:
+            Tuple[int, Any, str | None]: The position, the decoded value and the error message, if any.
+        """
+
+        try:
+            return index, json.loads(line), None
+        except ValueError:
+            return index, None, "Invalid JSON line!"
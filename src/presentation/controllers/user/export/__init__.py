@@ -0,0 +1,60 @@
+# /src/presentation/controllers/user/export/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+from fastapi.responses import StreamingResponse
+
+# Domain
+from src.domain.dtos import ExportUserQueryDTO
+from src.domain.enums import UserExportFormatEnum
+from src.domain.use_cases import ExportUserUseCase
+
+
+class ExportUserController:
+    """
+    Class Controller responsible for handling user export requests.
+
+    This class streams every user in the requested format.
+
+    Class Args:
+        None
+    """
+
+    __media_types = {
+        UserExportFormatEnum.NDJSON: "application/x-ndjson",
+        UserExportFormatEnum.CSV: "text/csv",
+    }
+
+    def __init__(self) -> None:
+        """
+        Constructor method that initializes the ExportUserController.
+
+        Args:
+            None
+        """
+        self.__use_case = ExportUserUseCase()
+
+    def __call__(
+        self,
+        query: ExportUserQueryDTO
+    ) -> StreamingResponse:
+        """
+        Public method that streams the exported users.
+
+        Args:
+            query (ExportUserQueryDTO): The export format and filters.
+
+        Returns:
+            StreamingResponse: A streaming response with one chunk per batch of users.
+        """
+
+        export_format = UserExportFormatEnum(query.format)
+
+        return StreamingResponse(
+            self.__use_case(query),
+            media_type=self.__media_types[export_format],
+            headers={
+                "Content-Disposition": f'attachment; filename="users.{export_format.value}"'
+            },
+        )
@@ -45,10 +45,7 @@ class FindUserController:
         Args:
             session_db (Session): The database session used for executing queries.
         """
-        self.__repository = UserRepository(
-            UserModel,
-            session_db,
-        )
+        self.__repository = UserRepository(session_db)
         self.__use_case = FindUserUseCase(self.__repository)
 
     def __call__(
@@ -61,29 +58,40 @@ class FindUserController:
         Args:
             request_query:
                 user_id (str, optional): Unique identifier of the user to retrieve.
-                    If not provided, retrieves all users.
+                    If not provided, retrieves one page of users, using `limit`,
+                    `cursor`, `status`, `role_id` and `email_prefix`.
 
         Returns:
-            JSONResponse: A JSON response containing the requested user data.
+            JSONResponse: A JSON response containing the requested user data and,
+                for a page of users, the `next_cursor` in `meta`.
         """
 
         use_case_response = self.__use_case(query)
 
-        if isinstance(use_case_response, list) and not use_case_response:
-            message = "No users found!"
+        if query.user_id is not None:
             return ResponseUtil().json_response(
                 status_code=status.HTTP_200_OK,
-                message=message
+                message="User retrieved!",
+                data=UserResponseDTO(root=use_case_response).model_dump(),
             )
 
-        message = (
-            "Users retrieved!"
-            if isinstance(use_case_response, list)
-            else "User retrieved!"
-        )
+        users = use_case_response["users"]
+        meta = {
+            "limit": query.limit,
+            "next_cursor": use_case_response["next_cursor"],
+        }
+
+        if not users:
+            message = "No users found!"
+            return ResponseUtil().json_response(
+                status_code=status.HTTP_200_OK,
+                message=message,
+                meta=meta
+            )
 
         return ResponseUtil().json_response(
             status_code=status.HTTP_200_OK,
-            message=message,
-            data=UserResponseDTO(root=use_case_response).model_dump(),
+            message="Users retrieved!",
+            data=UserResponseDTO(root=users).model_dump(),
+            meta=meta
         )
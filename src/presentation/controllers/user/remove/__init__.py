@@ -42,10 +42,7 @@ class RemoveUserController:
         Args:
             session_db (Session): The database session used for executing queries.
         """
-        self.__repository = UserRepository(
-            UserModel,
-            session_db,
-        )
+        self.__repository = UserRepository(session_db)
         self.__use_case = RemoveUserUseCase(self.__repository)
 
     def __call__(
@@ -46,10 +46,7 @@ class UpdateUserController:
         Args:
             session_db (Session): The database session used for executing queries.
         """
-        self.__repository = UserRepository(
-            UserModel,
-            session_db,
-        )
+        self.__repository = UserRepository(session_db)
         self.__use_case = UpdateUserUseCase(self.__repository)
 
     def __call__(
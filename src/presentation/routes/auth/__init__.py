@@ -6,14 +6,22 @@
 from fastapi import APIRouter
 
 # Presentation
+from src.presentation.routes.auth.introspect import IntrospectRouter
+from src.presentation.routes.auth.jwks import JwksRouter
 from src.presentation.routes.auth.login import LoginRouter
 from src.presentation.routes.auth.logout import LogoutRouter
+from src.presentation.routes.auth.refresh import RefreshRouter
 from src.presentation.routes.auth.validate import ValidateRouter
+from src.presentation.routes.auth.verify import VerifyRouter
 
 
 auth_router = APIRouter()
 
 
+IntrospectRouter(auth_router)
+JwksRouter(auth_router)
 LoginRouter(auth_router)
 LogoutRouter(auth_router)
+RefreshRouter(auth_router)
 ValidateRouter(auth_router)
+VerifyRouter(auth_router)
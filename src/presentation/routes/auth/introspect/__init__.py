@@ -0,0 +1,59 @@
+# /src/presentation/routes/auth/introspect/__init__.py
+
+# flake8: noqa: E501
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+# Core
+from src.core.configurations import DatabaseConfig, EnvConfig
+
+# Domain
+from src.domain.dtos import IntrospectRequestDTO
+
+# Presentation
+from src.presentation.controllers import IntrospectController
+
+
+class IntrospectRouter:
+    """
+    """
+    def __init__(self, auth_router: APIRouter) -> None:
+        """
+        """
+        self.__router: APIRouter = auth_router
+
+        self.__router.post(
+            path="/introspect",
+            description="Checks a list of tokens at once and returns, for each one, whether it is active and its claims."
+        )(self.__call_async if EnvConfig().database_async else self.__call__)
+
+    def __call__(
+        self,
+        body: IntrospectRequestDTO,
+        session_db: Session = Depends(DatabaseConfig().get_db)
+    ) -> JSONResponse:
+        """
+        Endpoint that handles batch token introspection.
+
+        This method decodes every token and resolves their sessions
+            with a single query.
+        """
+        controller = IntrospectController(session_db=session_db)
+        return controller(body)
+
+    async def __call_async(
+        self,
+        body: IntrospectRequestDTO,
+        session_db: AsyncSession = Depends(DatabaseConfig().get_async_db)
+    ) -> JSONResponse:
+        """
+        Endpoint that handles batch token introspection in async database mode.
+
+        The session query runs on the event loop through the async engine
+            instead of in the thread pool.
+        """
+        controller = IntrospectController(session_db=session_db)
+        return await controller.call_async(body)
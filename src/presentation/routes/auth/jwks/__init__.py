@@ -0,0 +1,32 @@
+# /src/presentation/routes/auth/jwks/__init__.py
+
+# flake8: noqa: E501
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+# Presentation
+from src.presentation.controllers import JwksController
+
+
+class JwksRouter:
+    """
+    """
+    def __init__(self, auth_router: APIRouter) -> None:
+        """
+        """
+        self.__router: APIRouter = auth_router
+
+        self.__router.get(
+            path="/.well-known/jwks.json",
+            description="Public keys used to verify the access tokens, as a JSON Web Key Set."
+        )(self.__call__)
+
+    def __call__(self) -> JSONResponse:
+        """
+        Endpoint that returns the token verification keys.
+
+        It is public, so other services can fetch the keys without a token.
+        """
+        controller = JwksController()
+        return controller()
@@ -0,0 +1,44 @@
+# /src/presentation/routes/auth/refresh/__init__.py
+
+# flake8: noqa: E501
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+# Core
+from src.core.configurations import DatabaseConfig
+
+# Domain
+from src.domain.dtos import RefreshRequestDTO
+
+# Presentation
+from src.presentation.controllers import RefreshController
+
+
+class RefreshRouter:
+    """
+    """
+    def __init__(self, auth_router: APIRouter) -> None:
+        """
+        """
+        self.__router: APIRouter = auth_router
+
+        self.__router.post(
+            path="/refresh",
+            description="Exchanges a refresh token for a new access token and refresh token."
+        )(self.__call__)
+
+    def __call__(
+        self,
+        session_db: Session = Depends(DatabaseConfig().get_db),
+        body: RefreshRequestDTO = None
+    ) -> JSONResponse:
+        """
+        Endpoint that handles access token renewal.
+
+        This method exchanges a refresh token for new tokens without
+            verifying the user's password again.
+        """
+        controller = RefreshController(session_db=session_db)
+        return controller(body)
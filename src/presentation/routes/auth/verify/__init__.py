@@ -0,0 +1,37 @@
+# /src/presentation/routes/auth/verify/__init__.py
+
+# flake8: noqa: E501
+
+from fastapi import APIRouter, Request, Response
+
+# Presentation
+from src.presentation.controllers import VerifyController
+
+
+class VerifyRouter:
+    """
+    """
+    def __init__(self, auth_router: APIRouter) -> None:
+        """
+        """
+        self.__router: APIRouter = auth_router
+
+        self.__router.get(
+            path="/verify",
+            description="Verifies the Bearer token for a gateway subrequest. Returns 204 with the claims in the X-User-Id, X-User-Role and X-Session-Id headers.",
+            status_code=204,
+            response_class=Response,
+        )(self.__call__)
+
+    async def __call__(
+        self,
+        request: Request
+    ) -> Response:
+        """
+        Endpoint that handles gateway token verification.
+
+        It runs on the event loop: the token was already verified by the
+        authentication middleware, so no blocking work is left.
+        """
+        controller = VerifyController()
+        return controller(request)
@@ -0,0 +1,45 @@
+# /src/presentation/routes/metrics/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+# Core
+from src.core.dependencies import require_metrics_token
+
+# Presentation
+from src.presentation.controllers import MetricsController
+
+
+class MetricsRouter:
+    """
+    """
+    def __init__(self, metrics_router: APIRouter) -> None:
+        """
+        """
+        self.__router: APIRouter = metrics_router
+
+        self.__router.get(
+            path="/metrics",
+            include_in_schema=False,
+            dependencies=[require_metrics_token()],
+            description="Application metrics in the Prometheus text format."
+        )(self.__call__)
+
+    def __call__(self) -> Response:
+        """
+        Endpoint that returns the application metrics.
+
+        It requires the `METRICS_TOKEN` bearer token when one is set, and a user
+            access token otherwise.
+        """
+        controller = MetricsController()
+        return controller()
+
+
+metrics_router = APIRouter()
+
+
+MetricsRouter(metrics_router)
@@ -6,7 +6,9 @@
 from fastapi import APIRouter
 
 # Presentation
+from src.presentation.routes.user.bulk import BulkCreateUserRouter
 from src.presentation.routes.user.create import CreateUserRouter
+from src.presentation.routes.user.export import ExportUserRouter
 from src.presentation.routes.user.get import GetUserRouter
 from src.presentation.routes.user.remove import RemoveUserRouter
 from src.presentation.routes.user.update import UpdateUserRouter
@@ -14,7 +16,9 @@ from src.presentation.routes.user.update import UpdateUserRouter
 user_router = APIRouter()
 
 
+BulkCreateUserRouter(user_router)
 CreateUserRouter(user_router)
+ExportUserRouter(user_router)
 GetUserRouter(user_router)
 RemoveUserRouter(user_router)
 UpdateUserRouter(user_router)
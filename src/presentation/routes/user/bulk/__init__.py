@@ -0,0 +1,63 @@
+# /src/presentation/routes/user/bulk/__init__.py
+
+# flake8: noqa: E501
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+# Core
+from src.core.configurations import DatabaseConfig
+from src.core.dependencies import require_permission
+
+# Domain
+from src.domain.enums import UserPermissionEnum
+
+# Presentation
+from src.presentation.controllers import BulkCreateUserController
+
+
+class BulkCreateUserRouter:
+    """
+    """
+    def __init__(self, user_router: APIRouter) -> None:
+        """
+        """
+        self.__router: APIRouter = user_router
+
+        self.__router.post(
+            path="/bulk",
+            dependencies=[require_permission(UserPermissionEnum.CREATE)],
+            description="Creates users from a JSON array or an NDJSON stream of user objects.",
+            response_model=None,
+            openapi_extra={
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "array",
+                                "items": {"$ref": "#/components/schemas/CreateUserReqBodyDTO"},
+                            }
+                        },
+                        "application/x-ndjson": {
+                            "schema": {"$ref": "#/components/schemas/CreateUserReqBodyDTO"}
+                        },
+                    },
+                }
+            },
+        )(self.__call__)
+
+    async def __call__(
+        self,
+        request: Request,
+        session_db: Session = Depends(DatabaseConfig().get_db)
+    ) -> JSONResponse:
+        """
+        Endpoint that handles bulk user creation.
+
+        The body is read by the controller, so NDJSON streams are consumed
+        incrementally and every user is validated on its own.
+        """
+        controller = BulkCreateUserController(session_db)
+        return await controller(request)
@@ -8,9 +8,11 @@ from sqlalchemy.orm import Session
 
 # Core
 from src.core.configurations import DatabaseConfig
+from src.core.dependencies import require_permission
 
 # Domain
 from src.domain.dtos import CreateUserReqBodyDTO
+from src.domain.enums import UserPermissionEnum
 
 # Presentation
 from src.presentation.controllers import CreateUserController
@@ -26,6 +28,7 @@ class CreateUserRouter:
 
         self.__router.post(
             path="",
+            dependencies=[require_permission(UserPermissionEnum.CREATE)],
             description="",
             response_model=None
         )(self.__call__)
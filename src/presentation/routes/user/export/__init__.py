@@ -0,0 +1,44 @@
+# /src/presentation/routes/user/export/__init__.py
+
+# flake8: noqa: E501
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+# Core
+from src.core.dependencies import require_permission
+
+# Domain
+from src.domain.dtos import ExportUserQueryDTO
+from src.domain.enums import UserPermissionEnum
+
+# Presentation
+from src.presentation.controllers import ExportUserController
+
+
+class ExportUserRouter:
+    """
+    """
+    def __init__(self, user_router: APIRouter) -> None:
+        """
+        """
+        self.__router: APIRouter = user_router
+
+        self.__router.get(
+            path="/export",
+            dependencies=[require_permission(UserPermissionEnum.READ)],
+            response_model=None
+        )(self.__call__)
+
+    def __call__(
+        self,
+        query: ExportUserQueryDTO = Depends()
+    ) -> StreamingResponse:
+        """
+        Endpoint that streams every user as NDJSON or CSV.
+
+        The database session is owned by the export stream, so it stays open
+        until the last chunk is sent.
+        """
+        controller = ExportUserController()
+        return controller(query)
@@ -8,9 +8,11 @@ from sqlalchemy.orm import Session
 
 # Core
 from src.core.configurations import DatabaseConfig
+from src.core.dependencies import require_permission
 
 # Domain
 from src.domain.dtos import FindUserByUserIdQueryDTO
+from src.domain.enums import UserPermissionEnum
 
 # Presentation
 from src.presentation.controllers import FindUserController
@@ -20,6 +22,7 @@ class GetUserRouter:
         self.__router: APIRouter = user_router
         self.__router.get(
             path="",
+            dependencies=[require_permission(UserPermissionEnum.READ)],
             response_model=None
         )(self.__call__)
 
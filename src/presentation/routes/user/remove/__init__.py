@@ -8,9 +8,11 @@ from sqlalchemy.orm import Session
 
 # Core
 from src.core.configurations import DatabaseConfig
+from src.core.dependencies import require_permission
 
 # Domain
 from src.domain.dtos import RemoveUserByUserIdReqPathDTO
+from src.domain.enums import UserPermissionEnum
 
 # Presentation
 from src.presentation.controllers import RemoveUserController
@@ -26,6 +28,7 @@ class RemoveUserRouter:
 
         self.__router.delete(
             path="/{user_id}",
+            dependencies=[require_permission(UserPermissionEnum.DELETE)],
             response_model=None
         )(self.__call__)
 
@@ -8,12 +8,14 @@ from sqlalchemy.orm import Session
 
 # Core
 from src.core.configurations import DatabaseConfig
+from src.core.dependencies import require_permission
 
 # Domain
 from src.domain.dtos import (
     UpdateUserReqBodyDTO,
     UpdateUserReqPathDTO
 )
+from src.domain.enums import UserPermissionEnum
 
 # Presentation
 from src.presentation.controllers import UpdateUserController
@@ -29,6 +31,7 @@ class UpdateUserRouter:
 
         self.__router.patch(
             path="/{user_id}",
+            dependencies=[require_permission(UserPermissionEnum.UPDATE)],
             response_model=None
         )(self.__call__)
 
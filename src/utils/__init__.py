@@ -3,9 +3,15 @@
 # flake8: noqa: E501, F401
 
 from src.utils.auth import AuthUtil
+from src.utils.cache import SessionCacheUtil, session_cache
 from src.utils.database import DatabaseUtil
 from src.utils.dot_env import DotEnvUtil
 from src.utils.generator import GenUtil
-from src.utils.logger import Logger, LogFormatter  # Replace with actual symbols used
+from src.utils.jwt_key import JWTKeyUtil, jwt_keys
+from src.utils.logger import LoggerUtil, log
 from src.utils.message import MessageUtil
+from src.utils.metrics import MetricsUtil, metrics
+from src.utils.password import PasswordHashUtil, password_hasher
+from src.utils.permission import PermissionCacheUtil, permission_cache
 from src.utils.response import *
+from src.utils.revocation import RevocationListUtil, revocation_list
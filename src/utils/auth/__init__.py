@@ -3,7 +3,9 @@
 # flake8: noqa: E501
 
 # PY
+import hashlib
 import jwt
+import secrets
 from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException
 from jwt.exceptions import (
@@ -12,7 +14,6 @@ from jwt.exceptions import (
     InvalidTokenError,
 )
 from typing import Any
-from werkzeug.security import check_password_hash, generate_password_hash
 
 # Core
 from src.core.configurations.environment import EnvConfig
@@ -21,11 +22,14 @@ from src.core.exceptions import UnauthorizedTokenException
 
 
 # Utils
+from src.utils.cache import session_cache
+from src.utils.jwt_key import jwt_keys
 from src.utils.logger import log
+from src.utils.password import password_hasher
+from src.utils.revocation import revocation_list
 
 # Env variables Setup
 JWT_ACCESS_TOKEN_EXPIRE_MINUTES = EnvConfig().jwt_access_token_expire_minutes
-JWT_SECRET_KEY = EnvConfig().jwt_secret_key
 JWT_ALGORITHM = EnvConfig().jwt_algorithm
 
 
@@ -67,11 +71,95 @@ class AuthUtil:
         to_encode.update({"exp": expire})
         encoded_jwt = jwt.encode(
             payload=to_encode,
-            key=JWT_SECRET_KEY,
-            algorithm=JWT_ALGORITHM
+            key=jwt_keys.signing_key,
+            algorithm=JWT_ALGORITHM,
+            headers={"kid": jwt_keys.key_id} if jwt_keys.key_id else None
         )
         return encoded_jwt
 
+    @staticmethod
+    def create_refresh_token() -> str:
+        """
+        Static method responsible for creating an opaque refresh token.
+
+        The refresh token is a random string rather than a JWT: it is only ever
+        checked against the digest stored on its session (see `token_digest`).
+
+        Args:
+            None
+
+        Returns:
+            str: The URL-safe refresh token (256 random bits).
+        """
+
+        return secrets.token_urlsafe(32)
+
+    @staticmethod
+    def decode_token(access_token: str, verify_exp: bool = True) -> Any:
+        """
+        Static method responsible for decoding a JWT token and checking its signature.
+
+        The verification key is chosen from the `kid` header when an asymmetric
+        algorithm is configured. The session state is not checked.
+
+        Args:
+            access_token (str): The JWT token to decode.
+            verify_exp (bool, optional): Whether to reject expired tokens. Defaults to True.
+
+        Returns:
+            dict: The decoded token payload.
+
+        Raises:
+            ExpiredSignatureError: If the token is expired and `verify_exp` is True.
+            InvalidTokenError: If the token is malformed or has an invalid signature.
+            InvalidKeyError: If no verification key matches the token `kid`.
+        """
+
+        key_id = (
+            jwt.get_unverified_header(access_token).get("kid")
+            if jwt_keys.key_id
+            else None
+        )
+
+        return jwt.decode(
+            jwt=access_token,
+            key=jwt_keys.verification_key(key_id),
+            algorithms=[JWT_ALGORITHM],
+            options={"verify_exp": verify_exp}
+        )
+
+    @staticmethod
+    def jwks() -> dict:
+        """
+        Static method responsible for returning the public verification keys as a JSON Web Key Set.
+
+        Args:
+            None
+
+        Returns:
+            dict: The JWKS document (empty with an HMAC algorithm).
+        """
+
+        return jwt_keys.jwks
+
+    @staticmethod
+    def token_digest(access_token: str) -> str:
+        """
+        Static method responsible for computing the digest stored for a JWT token.
+
+        The tokens table keeps this fixed-size SHA-256 digest instead of the full
+        token, which is enough to look a token up without storing it. Refresh
+        tokens are stored the same way on their session.
+
+        Args:
+            access_token (str): The JWT token.
+
+        Returns:
+            str: The hexadecimal SHA-256 digest (64 characters).
+        """
+
+        return hashlib.sha256(access_token.encode()).hexdigest()
+
     @classmethod
     def verify_token(cls, access_token: str) -> Any:
         """
@@ -79,6 +167,9 @@ class AuthUtil:
 
         This method decodes a JWT token, ensuring its validity and integrity.
 
+        In stateless mode (`AUTH_MODE=stateless`) the session is checked against the
+        in-memory revocation list instead of the database.
+
         Args:
             token (str): The JWT token to be verified.
 
@@ -91,14 +182,17 @@ class AuthUtil:
         """
 
         try:
-            payload: Any = jwt.decode(
-                jwt=access_token,
-                key=JWT_SECRET_KEY,
-                algorithms=[JWT_ALGORITHM]
-            )
+            payload: Any = cls.decode_token(access_token)
 
             session_id = payload.get("session_id")
 
+            if revocation_list.enabled:
+                if not revocation_list.is_revoked(session_id):
+                    return payload
+
+                log.warning(f"Session with session_id {session_id} is revoked!")
+                raise UnauthorizedTokenException("Token expired or invalid!")
+
             validated_session = cls.validate_session(session_id)
 
             if validated_session:
@@ -108,13 +202,11 @@ class AuthUtil:
             raise UnauthorizedTokenException("Token expired or invalid!")
 
         except ExpiredSignatureError:
+            if revocation_list.enabled:
+                raise UnauthorizedTokenException("Token expired!")
+
             try:
-                payload = jwt.decode(
-                    jwt=access_token,
-                    key=JWT_SECRET_KEY,
-                    algorithms=[JWT_ALGORITHM],
-                    options={"verify_exp": False}
-                )
+                payload = cls.decode_token(access_token, verify_exp=False)
                 session_id = payload.get("session_id")
                 if session_id:
                     invalidated_session = cls.invalidate_session(session_id)
@@ -144,6 +236,7 @@ class AuthUtil:
         Static method responsible for verifying a password.
 
         This method checks if a provided password matches a stored hashed password.
+        The verification runs in the password hashing process pool.
 
         Args:
             request_password (str): The plain-text password entered by the user.
@@ -153,14 +246,15 @@ class AuthUtil:
             bool: True if the passwords match, otherwise False.
         """
 
-        return check_password_hash(saved_password, request_password)
+        return password_hasher.check_password_hash(request_password, saved_password)
 
     @staticmethod
     def generate_password_hash(password: str) -> str:
         """
         Static method responsible for hashing a password.
 
-        This method hashes a given password using the PBKDF2-SHA256 algorithm.
+        This method hashes a given password using the configured algorithm and cost
+        (PBKDF2-SHA256 by default). The hash runs in the password hashing process pool.
 
         Args:
             password (str): The plain-text password to hash.
@@ -169,22 +263,58 @@ class AuthUtil:
             str: The hashed password.
         """
 
-        return generate_password_hash(
-            password=password,
-            method="pbkdf2:sha256",
-        )
+        return password_hasher.generate_password_hash(password)
+
+    @staticmethod
+    def generate_password_hashes(passwords: list[str]) -> list[str]:
+        """
+        Static method responsible for hashing many passwords at once.
+
+        The hashes are spread across every process of the password hashing pool.
+
+        Args:
+            passwords (list[str]): The plain-text passwords to hash.
+
+        Returns:
+            list[str]: The hashed passwords, in the same order.
+        """
+
+        return password_hasher.generate_password_hashes(passwords)
+
+    @staticmethod
+    def needs_password_rehash(saved_password: str) -> bool:
+        """
+        Static method responsible for checking whether a stored password hash is outdated.
+
+        Args:
+            saved_password (str): The hashed password stored in the database.
+
+        Returns:
+            bool: True if the hash was produced with a different method or cost.
+        """
+
+        return password_hasher.needs_rehash(saved_password)
 
     @classmethod
     def validate_session(cls, session_id: str) -> bool:
         """
         Validate if a session with the given session_id exists and is active.
 
+        The session state is served from the session cache when available and
+        stored in it after a database lookup.
+
         Args:
             session_id (str): The Session ID extracted from the token.
 
         Raises:
             UnauthorizedTokenException: If the session does not exist or is inactive.
         """
+
+        cached_session = session_cache.get(session_id)
+
+        if cached_session is not None:
+            return cached_session
+
         session_db = next(DatabaseConfig().get_db())
         try:
 
@@ -208,8 +338,10 @@ class AuthUtil:
                 }
                 __repository.deactivate_session(session, update_data)
                 session_db.commit()
+                session_cache.set(session_id, False)
                 return False
 
+            session_cache.set(session_id, True)
             return True
 
         finally:
@@ -220,6 +352,9 @@ class AuthUtil:
         """
         Invalidate if a session with the given session_id exists and is active.
 
+        A session whose refresh token is still valid is kept active, since its
+        access token can be renewed through the refresh endpoint.
+
         Args:
             session_id (str): The Session ID extracted from the token.
 
@@ -235,7 +370,14 @@ class AuthUtil:
 
             session = __repository.find_session_by_session_id(session_id)
 
-            if session and (session.is_active is True):
+            if (
+                session and
+                (session.is_active is True) and
+                (
+                    session.refresh_expires_at is None or
+                    session.refresh_expires_at <= datetime.now()
+                )
+            ):
 
                 update_data = {
                     "is_active": False,
@@ -246,6 +388,8 @@ class AuthUtil:
 
                 session_db.commit()
 
+                session_cache.invalidate(session_id)
+
                 return True
 
             return False
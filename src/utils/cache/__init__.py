@@ -0,0 +1,187 @@
+# /src/utils/cache/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+import threading
+import time
+from collections import OrderedDict
+
+# Core
+from src.core.configurations.environment import EnvConfig
+
+
+class SessionCacheUtil:
+    """
+    Class responsible for caching the active/inactive state of authentication sessions.
+
+    This class keeps a bounded, in-process map of `session_id -> is_active` so that
+    hot sessions can be validated without a database round trip. Entries expire after
+    a time to live and the least recently used entry is evicted when the cache is full.
+
+    The cache is local to each worker process, so the time to live bounds how long a
+    session deactivated by another worker can still be seen as active.
+
+    Class Args:
+        max_size (int | None): Maximum number of cached sessions.
+        ttl_seconds (int | None): Time to live, in seconds, of each entry.
+    """
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        ttl_seconds: int | None = None
+    ) -> None:
+        """
+        Constructor method for SessionCacheUtil.
+
+        Initializes the cache storage, its limits and the hit/miss counters.
+
+        Args:
+            max_size (int | None, optional): Maximum number of cached sessions.
+                Defaults to `AUTH_SESSION_CACHE_MAX_SIZE`.
+            ttl_seconds (int | None, optional): Time to live, in seconds, of each entry.
+                Defaults to `AUTH_SESSION_CACHE_TTL_SECONDS`.
+        """
+
+        self.__max_size: int = (
+            max_size if max_size is not None
+            else EnvConfig().auth_session_cache_max_size
+        )
+        self.__ttl_seconds: int = (
+            ttl_seconds if ttl_seconds is not None
+            else EnvConfig().auth_session_cache_ttl_seconds
+        )
+        self.__entries: OrderedDict[str, tuple[bool, float]] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Property method responsible for returning whether the cache is enabled.
+
+        A maximum size or time to live of zero disables the cache.
+
+        Args:
+            None
+
+        Returns:
+            bool: True if the cache stores entries, otherwise False.
+        """
+
+        return self.__max_size > 0 and self.__ttl_seconds > 0
+
+    def get(self, session_id: str) -> bool | None:
+        """
+        Public method responsible for retrieving the cached state of a session.
+
+        Args:
+            session_id (str): The Session ID to look up.
+
+        Returns:
+            bool | None: The cached `is_active` state, or None if the session
+                is not cached or its entry has expired.
+        """
+
+        if not self.enabled:
+            return None
+
+        now = time.monotonic()
+
+        with self.__lock:
+            entry = self.__entries.get(session_id)
+
+            if entry is None:
+                self.__misses += 1
+                return None
+
+            is_active, expires_at = entry
+
+            if expires_at <= now:
+                del self.__entries[session_id]
+                self.__misses += 1
+                return None
+
+            self.__entries.move_to_end(session_id)
+            self.__hits += 1
+            return is_active
+
+    def set(self, session_id: str, is_active: bool) -> None:
+        """
+        Public method responsible for storing the state of a session.
+
+        When the cache is full, the least recently used entry is evicted.
+
+        Args:
+            session_id (str): The Session ID to store.
+            is_active (bool): Whether the session is active.
+
+        Returns:
+            None
+        """
+
+        if not self.enabled:
+            return
+
+        expires_at = time.monotonic() + self.__ttl_seconds
+
+        with self.__lock:
+            self.__entries[session_id] = (is_active, expires_at)
+            self.__entries.move_to_end(session_id)
+
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, session_id: str) -> None:
+        """
+        Public method responsible for removing a session from the cache.
+
+        Args:
+            session_id (str): The Session ID to remove.
+
+        Returns:
+            None
+        """
+
+        with self.__lock:
+            self.__entries.pop(session_id, None)
+
+    def clear(self) -> None:
+        """
+        Public method responsible for removing every entry and resetting the counters.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Property method responsible for returning the cache counters.
+
+        Args:
+            None
+
+        Returns:
+            dict[str, int]: The number of hits, misses and cached entries.
+        """
+
+        with self.__lock:
+            return {
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "size": len(self.__entries),
+            }
+
+
+session_cache = SessionCacheUtil()
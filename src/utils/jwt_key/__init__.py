@@ -0,0 +1,173 @@
+# /src/utils/jwt_key/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+from pathlib import Path
+from typing import Any
+
+import jwt
+
+# Core
+from src.core.configurations.environment import EnvConfig
+
+
+class JWTKeyUtil:
+    """
+    Class responsible for loading and caching the keys used to sign and verify JWT tokens.
+
+    With an HMAC algorithm (`HS256`, the default) the shared `SECRET_KEY` both signs
+    and verifies tokens. With an asymmetric algorithm (`RS256`, `ES256`, `EdDSA`, ...)
+    tokens are signed with the PEM private key at `JWT_PRIVATE_KEY_PATH` and carry
+    its `JWT_KEY_ID` as `kid` header; they are verified with the matching public
+    key, chosen by `kid` among the current key and the previous ones listed in
+    `JWT_PUBLIC_KEYS`, so keys can be rotated without invalidating issued tokens.
+
+    The PEM files are parsed once, when the instance is created, and the key objects
+    are passed to PyJWT as is, so no key is parsed per token.
+
+    The public keys are also exposed as a JSON Web Key Set, which lets other
+    services validate tokens locally.
+
+    Asymmetric algorithms require the `cryptography` package (`pyjwt[crypto]`).
+
+    Class Args:
+        None
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor method for JWTKeyUtil.
+
+        Args:
+            None
+
+        Raises:
+            ValueError: If `JWT_ALGORITHM` is not supported, or the keys of an
+                asymmetric algorithm are missing or invalid.
+        """
+
+        self.__algorithm_name: str = EnvConfig().jwt_algorithm
+
+        try:
+            self.__algorithm = jwt.get_algorithm_by_name(self.__algorithm_name)
+        except NotImplementedError:
+            raise ValueError(
+                f"Unsupported JWT_ALGORITHM '{self.__algorithm_name}'! Asymmetric algorithms require the cryptography package."
+            )
+
+        self.__symmetric: bool = self.__algorithm_name.startswith("HS")
+
+        if self.__symmetric:
+            self.__key_id: str | None = None
+            self.__signing_key: Any = EnvConfig().jwt_secret_key
+            self.__verification_keys: dict[str | None, Any] = {None: self.__signing_key}
+            self.__jwks: dict[str, list[dict[str, Any]]] = {"keys": []}
+            return
+
+        if not EnvConfig().jwt_private_key_path or not EnvConfig().jwt_key_id:
+            raise ValueError(
+                f"JWT_ALGORITHM '{self.__algorithm_name}' requires JWT_PRIVATE_KEY_PATH and JWT_KEY_ID!"
+            )
+
+        self.__key_id = EnvConfig().jwt_key_id
+        self.__signing_key = self.__algorithm.prepare_key(
+            Path(EnvConfig().jwt_private_key_path).read_bytes()
+        )
+        self.__verification_keys = {self.__key_id: self.__signing_key.public_key()}
+
+        for key_id, path in EnvConfig().jwt_public_keys.items():
+            if key_id != self.__key_id:
+                self.__verification_keys[key_id] = self.__algorithm.prepare_key(
+                    Path(path).read_bytes()
+                )
+
+        self.__jwks = {"keys": []}
+
+        for key_id, key in self.__verification_keys.items():
+            jwk = self.__algorithm.to_jwk(key, as_dict=True)
+            jwk.update({"kid": key_id, "alg": self.__algorithm_name, "use": "sig"})
+            self.__jwks["keys"].append(jwk)
+
+    @property
+    def algorithm(self) -> str:
+        """
+        Property method responsible for returning the signing algorithm.
+
+        Args:
+            None
+
+        Returns:
+            str: The JWT algorithm name.
+        """
+
+        return self.__algorithm_name
+
+    @property
+    def key_id(self) -> str | None:
+        """
+        Property method responsible for returning the key ID of the signing key.
+
+        Args:
+            None
+
+        Returns:
+            str | None: The signing key ID, or None with an HMAC algorithm.
+        """
+
+        return self.__key_id
+
+    @property
+    def signing_key(self) -> Any:
+        """
+        Property method responsible for returning the key used to sign tokens.
+
+        Args:
+            None
+
+        Returns:
+            Any: The secret or the private key object.
+        """
+
+        return self.__signing_key
+
+    def verification_key(self, key_id: str | None) -> Any:
+        """
+        Public method responsible for returning the key used to verify a token.
+
+        Args:
+            key_id (str | None): The `kid` header of the token.
+
+        Returns:
+            Any: The secret or the public key object.
+
+        Raises:
+            jwt.InvalidKeyError: If no key matches the key ID.
+        """
+
+        if self.__symmetric:
+            return self.__signing_key
+
+        try:
+            return self.__verification_keys[key_id]
+        except KeyError:
+            raise jwt.InvalidKeyError(f"Unknown key ID '{key_id}'!")
+
+    @property
+    def jwks(self) -> dict[str, list[dict[str, Any]]]:
+        """
+        Property method responsible for returning the public keys as a JSON Web Key Set.
+
+        The set is empty with an HMAC algorithm, since the secret must not be published.
+
+        Args:
+            None
+
+        Returns:
+            dict[str, list[dict[str, Any]]]: The JWKS document.
+        """
+
+        return self.__jwks
+
+
+jwt_keys = JWTKeyUtil()
@@ -79,4 +79,19 @@ class LoggerUtil:
 
         self.__logger.warning(message)
 
+    @property
+    def stats(self) -> dict[str, int | str]:
+        """
+        Property method responsible for returning the log queue gauges and counters.
+
+        Args:
+            None
+
+        Returns:
+            dict[str, int | str]: The queued records, queue capacity, overflow policy,
+                and the records dropped and sampled out since startup.
+        """
+
+        return LoggerConfig.stats()
+
 log = LoggerUtil()
\ No newline at end of file
@@ -0,0 +1,300 @@
+# /src/utils/metrics/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+import atexit
+import os
+import threading
+from typing import Any
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Core
+from src.core.configurations.database import DatabaseConfig
+from src.core.configurations.environment import EnvConfig
+from src.core.configurations.logger import LoggerConfig
+
+# Utils
+from src.utils.cache import session_cache
+from src.utils.password import password_hasher
+
+
+class MetricsUtil:
+    """
+    Class responsible for collecting the application metrics in the Prometheus format.
+
+    Requests are counted per method, route template and status, their latency is
+    recorded in a histogram per method and route template, and the requests being
+    handled are tracked by an in-flight gauge. Route templates (e.g.
+    `/api/v1/users/{user_id}`) keep the number of series bounded; requests that
+    match no route are labelled `unmatched`.
+
+    The connection pools, the session cache, the password hashing queue and the
+    log queue are published as gauges and counters, refreshed from their own
+    `stats` at each scrape and, with several workers, every `METRICS_REFRESH_SECONDS`
+    in each worker. The session cache hit ratio is
+    `rate(session_cache_hits_total) / (rate(session_cache_hits_total) + rate(session_cache_misses_total))`.
+
+    With several uvicorn workers, `PROMETHEUS_MULTIPROC_DIR` must point to a
+    directory shared by the workers (and emptied before the server starts): each
+    worker then writes its metrics to its own memory-mapped files, and the worker
+    serving `/metrics` aggregates the files of every worker, so a scrape never
+    waits on the other workers.
+
+    Class Args:
+        None
+    """
+
+    __latency_buckets = (
+        0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+    )
+
+    __unmatched_route = "unmatched"
+
+    def __init__(self) -> None:
+        """
+        Constructor method for MetricsUtil.
+
+        Args:
+            None
+        """
+
+        self.__multiprocess_dir: str = EnvConfig().prometheus_multiproc_dir
+        self.__refresh_lock = threading.Lock()
+        self.__last_counts: dict[tuple[str, ...], int] = {}
+
+        if self.__multiprocess_dir:
+            os.makedirs(self.__multiprocess_dir, exist_ok=True)
+            atexit.register(multiprocess.mark_process_dead, os.getpid())
+
+        # Request metrics
+        self.__requests = Counter(
+            "http_requests_total",
+            "HTTP requests handled, by method, route template and status.",
+            ["method", "route", "status"],
+        )
+        self.__latency = Histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency, by method and route template.",
+            ["method", "route"],
+            buckets=self.__latency_buckets,
+        )
+        self.__in_flight = Gauge(
+            "http_requests_in_flight",
+            "HTTP requests being handled.",
+            multiprocess_mode="livesum",
+        )
+
+        # Labelled children, looked up without the lock of `labels()`
+        self.__request_children: dict[tuple[str, str, str], Any] = {}
+        self.__latency_children: dict[tuple[str, str], Any] = {}
+
+        # Database pool metrics
+        self.__pool_gauges = {
+            gauge: Gauge(
+                f"db_pool_{name}",
+                description,
+                ["pool"],
+                multiprocess_mode="livesum",
+            )
+            for gauge, name, description in (
+                ("size", "size", "Connections kept in the pool."),
+                ("checkedin", "checked_in", "Idle connections in the pool."),
+                ("checkedout", "checked_out", "Connections in use."),
+                ("overflow", "overflow", "Connections opened beyond the pool size."),
+            )
+        }
+        self.__pool_counters = {
+            counter: Counter(f"db_pool_{name}", description, ["pool"])
+            for counter, name, description in (
+                ("connects", "connects", "Database connections opened."),
+                ("checkouts", "checkouts", "Connections taken from the pool."),
+                ("overflow_checkouts", "overflow_checkouts", "Connections taken beyond the pool size."),
+            )
+        }
+
+        # Session cache metrics
+        self.__cache_hits = Counter("session_cache_hits", "Session lookups served from the cache.")
+        self.__cache_misses = Counter("session_cache_misses", "Session lookups sent to the database.")
+        self.__cache_entries = Gauge(
+            "session_cache_entries", "Sessions in the cache.", multiprocess_mode="livesum"
+        )
+
+        # Password hashing metrics
+        self.__hash_waiting = Gauge(
+            "password_hash_waiting", "Password hashes waiting for a slot.", multiprocess_mode="livesum"
+        )
+        self.__hash_in_flight = Gauge(
+            "password_hash_in_flight", "Password hashes running.", multiprocess_mode="livesum"
+        )
+
+        # Log queue metrics
+        self.__log_queued = Gauge(
+            "log_queue_records", "Log records waiting to be written.", multiprocess_mode="livesum"
+        )
+        self.__log_dropped = Counter("log_records_dropped", "Log records dropped because the queue was full.")
+
+    @property
+    def multiprocess(self) -> bool:
+        """
+        Property method responsible for returning whether the metrics are shared by several workers.
+
+        Args:
+            None
+
+        Returns:
+            bool: True if `PROMETHEUS_MULTIPROC_DIR` is set, otherwise False.
+        """
+
+        return bool(self.__multiprocess_dir)
+
+    def request_started(self) -> None:
+        """
+        Public method responsible for counting a request as in flight.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        self.__in_flight.inc()
+
+    def request_finished(
+        self,
+        method: str,
+        route: str | None,
+        status_code: int,
+        duration: float
+    ) -> None:
+        """
+        Public method responsible for recording a handled request.
+
+        Args:
+            method (str): The HTTP method.
+            route (str | None): The matched route template, or None if no route matched.
+            status_code (int): The response status code.
+            duration (float): The handling time, in seconds.
+
+        Returns:
+            None
+        """
+
+        route = route or self.__unmatched_route
+
+        request_key = (method, route, str(status_code))
+        requests = self.__request_children.get(request_key)
+
+        if requests is None:
+            requests = self.__request_children.setdefault(
+                request_key, self.__requests.labels(*request_key)
+            )
+
+        latency_key = (method, route)
+        latency = self.__latency_children.get(latency_key)
+
+        if latency is None:
+            latency = self.__latency_children.setdefault(
+                latency_key, self.__latency.labels(*latency_key)
+            )
+
+        requests.inc()
+        latency.observe(duration)
+        self.__in_flight.dec()
+
+    def refresh(self) -> None:
+        """
+        Public method responsible for publishing the pool, cache, hashing and log queue metrics of this worker.
+
+        Gauges are set to the current values, and counters are increased by the
+        change of the matching totals since the previous refresh.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        with self.__refresh_lock:
+            for pool_stats in DatabaseConfig.pool_stats():
+                pool = str(pool_stats["name"])
+
+                for gauge, metric in self.__pool_gauges.items():
+                    if gauge in pool_stats:
+                        metric.labels(pool).set(pool_stats[gauge])
+
+                for counter, metric in self.__pool_counters.items():
+                    self.__increase(metric.labels(pool), ("db_pool", counter, pool), pool_stats[counter])
+
+            cache_stats = session_cache.stats
+            self.__increase(self.__cache_hits, ("session_cache", "hits"), cache_stats["hits"])
+            self.__increase(self.__cache_misses, ("session_cache", "misses"), cache_stats["misses"])
+            self.__cache_entries.set(cache_stats["size"])
+
+            hash_stats = password_hasher.stats
+            self.__hash_waiting.set(hash_stats["waiting"])
+            self.__hash_in_flight.set(hash_stats["in_flight"])
+
+            log_stats = LoggerConfig.stats()
+
+            if log_stats:
+                self.__log_queued.set(log_stats["queued"])
+                self.__increase(self.__log_dropped, ("log", "dropped"), int(log_stats["dropped"]))
+
+    def render(self) -> tuple[bytes, str]:
+        """
+        Public method responsible for rendering the metrics in the Prometheus text format.
+
+        The metrics of this worker are refreshed first. In multiprocess mode the
+        metrics of every worker are aggregated.
+
+        Args:
+            None
+
+        Returns:
+            tuple[bytes, str]: The metrics document and its content type.
+        """
+
+        self.refresh()
+
+        if self.multiprocess:
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+            return generate_latest(registry), CONTENT_TYPE_LATEST
+
+        return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+    def __increase(self, counter: Any, key: tuple[str, ...], total: int) -> None:
+        """
+        Private method responsible for increasing a counter up to the current value of a total.
+
+        Args:
+            counter (Any): The counter, or labelled counter, to increase.
+            key (tuple[str, ...]): The key of the total among the previous values.
+            total (int): The current value of the total.
+
+        Returns:
+            None
+        """
+
+        increase = total - self.__last_counts.get(key, 0)
+
+        if increase > 0:
+            counter.inc(increase)
+
+        self.__last_counts[key] = total
+
+
+metrics = MetricsUtil()
@@ -0,0 +1,300 @@
+# /src/utils/password/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+# Core
+from src.core.configurations.environment import EnvConfig
+
+# Utils
+from src.utils.logger import log
+
+
+class PasswordHashUtil:
+    """
+    Class responsible for hashing and verifying passwords outside the request threads.
+
+    PBKDF2 and scrypt are CPU bound and hold the GIL for their whole duration, so
+    this class runs them in a `ProcessPoolExecutor`. A semaphore bounds the number
+    of hashes submitted at once, so a login burst queues up instead of pinning
+    every worker process.
+
+    The pool processes are started with `forkserver` rather than forked from this
+    multi-threaded process, where a lock held by another thread at fork time
+    could deadlock the child.
+
+    The hash parameters (method and cost) come from the environment, and
+    `needs_rehash` tells whether a stored hash was produced with outdated ones.
+
+    Class Args:
+        None
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor method for PasswordHashUtil.
+
+        Loads the hashing parameters. The process pool is created lazily, on the
+        first hash, so each server worker process owns its own pool.
+
+        Args:
+            None
+
+        Raises:
+            ValueError: If `PASSWORD_HASH_METHOD` is not supported.
+        """
+
+        _method = EnvConfig().password_hash_method
+
+        if _method == "pbkdf2":
+            self.__method: str = f"pbkdf2:sha256:{EnvConfig().password_hash_iterations}"
+        elif _method == "scrypt":
+            self.__method = f"scrypt:{EnvConfig().password_hash_scrypt_n}:8:1"
+        else:
+            raise ValueError(
+                f"Invalid PASSWORD_HASH_METHOD '{_method}'! Allowed values: pbkdf2, scrypt"
+            )
+
+        self.__workers: int = EnvConfig().password_hash_workers
+        self.__semaphore = threading.BoundedSemaphore(
+            max(EnvConfig().password_hash_max_concurrency, 1)
+        )
+        self.__executor: ProcessPoolExecutor | None = None
+        self.__executor_lock = threading.Lock()
+        self.__counter_lock = threading.Lock()
+        self.__waiting: int = 0
+        self.__in_flight: int = 0
+
+    @property
+    def method(self) -> str:
+        """
+        Property method responsible for returning the current hash method string.
+
+        Args:
+            None
+
+        Returns:
+            str: The hash method, e.g. `pbkdf2:sha256:1000000`.
+        """
+
+        return self.__method
+
+    def generate_password_hash(self, password: str) -> str:
+        """
+        Public method responsible for hashing a password with the current parameters.
+
+        Args:
+            password (str): The plain-text password to hash.
+
+        Returns:
+            str: The hashed password.
+        """
+
+        return self.__run(generate_password_hash, password, self.__method)
+
+    def generate_password_hashes(self, passwords: list[str]) -> list[str]:
+        """
+        Public method responsible for hashing many passwords in parallel.
+
+        The passwords are hashed in windows of at most `PASSWORD_HASH_WORKERS`,
+        each hash holding its own concurrency slot, and the slots are released
+        between windows. The pool queue thus never holds more than one window of
+        the batch, so a login submitted during a bulk import waits for at most
+        one hash per process instead of for the whole batch.
+
+        Args:
+            passwords (list[str]): The plain-text passwords to hash.
+
+        Returns:
+            list[str]: The hashed passwords, in the same order.
+        """
+
+        hashes: list[str] = []
+        window = max(self.__workers, 1)
+
+        while len(hashes) < len(passwords):
+            with self.__slots(window) as slots:
+                batch = passwords[len(hashes):len(hashes) + slots]
+                executor = self.__get_executor()
+
+                if executor is None:
+                    hashes.extend(generate_password_hash(password, self.__method) for password in batch)
+                    continue
+
+                try:
+                    futures = [
+                        executor.submit(generate_password_hash, password, self.__method)
+                        for password in batch
+                    ]
+                    hashes.extend(future.result() for future in futures)
+                except BrokenProcessPool as error:
+                    log.error(f"Password hashing process pool is broken, hashing inline: {error}")
+                    self.shutdown()
+                    hashes.extend(generate_password_hash(password, self.__method) for password in batch)
+
+        return hashes
+
+    def check_password_hash(self, request_password: str, saved_password: str) -> bool:
+        """
+        Public method responsible for verifying a password against a stored hash.
+
+        Args:
+            request_password (str): The plain-text password entered by the user.
+            saved_password (str): The hashed password stored in the database.
+
+        Returns:
+            bool: True if the passwords match, otherwise False.
+        """
+
+        return self.__run(check_password_hash, saved_password, request_password)
+
+    def needs_rehash(self, saved_password: str) -> bool:
+        """
+        Public method responsible for checking whether a stored hash uses outdated parameters.
+
+        Args:
+            saved_password (str): The hashed password stored in the database.
+
+        Returns:
+            bool: True if the hash method or cost differs from the current configuration.
+        """
+
+        return saved_password.split("$", 1)[0] != self.__method
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Property method responsible for returning the hashing queue gauges.
+
+        Args:
+            None
+
+        Returns:
+            dict[str, int]: The number of hashes waiting for a slot, the number
+                running and the configured worker processes.
+        """
+
+        with self.__counter_lock:
+            return {
+                "waiting": self.__waiting,
+                "in_flight": self.__in_flight,
+                "workers": self.__workers,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Public method responsible for shutting down the process pool.
+
+        Args:
+            wait (bool, optional): Whether to wait for the worker processes to exit. Defaults to False.
+
+        Returns:
+            None
+        """
+
+        with self.__executor_lock:
+            if self.__executor is not None:
+                self.__executor.shutdown(wait=wait, cancel_futures=True)
+                self.__executor = None
+
+    def __run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Private method responsible for running a hashing function under the concurrency limit.
+
+        The function runs in the process pool, or in the calling thread when
+        `PASSWORD_HASH_WORKERS` is 0 or the pool is broken.
+
+        Args:
+            func (Callable[..., Any]): The werkzeug hashing function.
+            *args (Any): Positional arguments for the function.
+
+        Returns:
+            Any: The function result.
+        """
+
+        with self.__slots():
+            executor = self.__get_executor()
+
+            if executor is None:
+                return func(*args)
+
+            try:
+                return executor.submit(func, *args).result()
+            except BrokenProcessPool as error:
+                log.error(f"Password hashing process pool is broken, hashing inline: {error}")
+                self.shutdown()
+                return func(*args)
+
+    @contextmanager
+    def __slots(self, count: int = 1) -> Iterator[int]:
+        """
+        Private method responsible for holding concurrency slots and updating the queue gauges.
+
+        The first slot is waited for; the others are only taken if free, so
+        callers asking for several slots never block each other.
+
+        Args:
+            count (int, optional): The maximum number of slots to hold. Defaults to 1.
+
+        Yields:
+            int: The number of slots held, between 1 and `count`.
+        """
+
+        with self.__counter_lock:
+            self.__waiting += 1
+
+        self.__semaphore.acquire()
+        acquired = 1
+
+        while acquired < count and self.__semaphore.acquire(blocking=False):
+            acquired += 1
+
+        with self.__counter_lock:
+            self.__waiting -= 1
+            self.__in_flight += acquired
+
+        try:
+            yield acquired
+        finally:
+            with self.__counter_lock:
+                self.__in_flight -= acquired
+
+            for _ in range(acquired):
+                self.__semaphore.release()
+
+    def __get_executor(self) -> ProcessPoolExecutor | None:
+        """
+        Private method responsible for returning the process pool, creating it on first use.
+
+        Args:
+            None
+
+        Returns:
+            ProcessPoolExecutor | None: The process pool, or None if hashing runs inline.
+        """
+
+        if self.__workers <= 0:
+            return None
+
+        with self.__executor_lock:
+            if self.__executor is None:
+                self.__executor = ProcessPoolExecutor(
+                    max_workers=self.__workers,
+                    mp_context=multiprocessing.get_context("forkserver"),
+                )
+            return self.__executor
+
+
+password_hasher = PasswordHashUtil()
+
+atexit.register(password_hasher.shutdown, wait=True)
@@ -0,0 +1,156 @@
+# /src/utils/permission/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+import threading
+from datetime import datetime
+
+# Core
+from src.core.configurations.database import DatabaseConfig
+
+# Utils
+from src.utils.logger import log
+
+
+class PermissionCacheUtil:
+    """
+    Class responsible for keeping the role to permissions map used by authorization checks.
+
+    The whole `role_permissions` table is small, so it is loaded in one query into an
+    in-process `role_id -> frozenset(permission_id)` map, and a permission check is a
+    set lookup with no database access.
+
+    The map is loaded at startup and reloaded every `AUTH_PERMISSION_REFRESH_SECONDS`.
+    A reload swaps the map in one assignment, and the version is only incremented
+    when the permissions actually changed.
+
+    Class Args:
+        None
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor method for PermissionCacheUtil.
+
+        Args:
+            None
+        """
+
+        self.__permissions: dict[str, frozenset[str]] = {}
+        self.__lock = threading.Lock()
+        self.__version: int = 0
+        self.__last_refresh: datetime | None = None
+
+    def has_permission(self, role_id: str, permission_id: str) -> bool:
+        """
+        Public method responsible for checking whether a role is granted a permission.
+
+        Args:
+            role_id (str): The role of the user, as found in the token.
+            permission_id (str): The required permission.
+
+        Returns:
+            bool: True if the role is granted the permission, otherwise False.
+        """
+
+        return permission_id in self.__permissions.get(role_id, frozenset())
+
+    def permissions(self, role_id: str) -> frozenset[str]:
+        """
+        Public method responsible for returning the permissions of a role.
+
+        Args:
+            role_id (str): The role of the user.
+
+        Returns:
+            frozenset[str]: The permissions granted to the role (empty if unknown).
+        """
+
+        return self.__permissions.get(role_id, frozenset())
+
+    @property
+    def version(self) -> int:
+        """
+        Property method responsible for returning the version of the permission map.
+
+        Args:
+            None
+
+        Returns:
+            int: A counter incremented each time the loaded permissions change.
+        """
+
+        return self.__version
+
+    def refresh(self) -> None:
+        """
+        Public method responsible for reloading the permissions of every role.
+
+        Errors are logged and the previous map is kept.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        session_db = next(DatabaseConfig().get_db())
+
+        try:
+
+            from src.data.repositories import RoleRepository
+
+            role_permissions = RoleRepository(session_db).find_role_permissions()
+
+        except Exception as error:
+            log.error(f"Error refreshing the permission cache: {error}")
+            return
+
+        finally:
+            session_db.close()
+
+        permissions: dict[str, set[str]] = {}
+
+        for role_id, permission_id in role_permissions:
+            granted = permissions.setdefault(role_id, set())
+            if permission_id is not None:
+                granted.add(permission_id)
+
+        loaded = {
+            role_id: frozenset(granted)
+            for role_id, granted in permissions.items()
+        }
+
+        with self.__lock:
+            if loaded != self.__permissions:
+                self.__permissions = loaded
+                self.__version += 1
+                log.info(f"Permission cache loaded (version {self.__version}, {len(loaded)} roles).")
+
+            self.__last_refresh = datetime.now()
+
+    @property
+    def stats(self) -> dict[str, int | str | None]:
+        """
+        Property method responsible for returning the permission cache gauges.
+
+        Args:
+            None
+
+        Returns:
+            dict[str, int | str | None]: The number of roles, the version and the time of the last refresh.
+        """
+
+        with self.__lock:
+            return {
+                "roles": len(self.__permissions),
+                "version": self.__version,
+                "last_refresh": (
+                    self.__last_refresh.isoformat() if self.__last_refresh else None
+                ),
+            }
+
+
+permission_cache = PermissionCacheUtil()
@@ -3,7 +3,7 @@
 # flake8: noqa: E501
 
 from http import HTTPStatus
-from typing import Callable, Dict, Union
+from typing import Any, Callable, Dict, Union
 
 from fastapi.responses import JSONResponse
 
@@ -24,23 +24,25 @@ class ResponseUtil:
         status_code: int,
         message: str | None = None,
         data: Dict[str, str] | None = None,
+        meta: Dict[str, Any] | None = None,
     ) -> JSONResponse:
         """
         Public method responsible for generating a standardized JSON response.
 
         This method creates a response containing a status code, a status name,
-        an optional message, and optional data.
+        an optional message, optional data and optional metadata (e.g. pagination).
 
         Args:
             status_code (int): The HTTP status code for the response.
             message (str, optional): A message describing the response. Defaults to None.
             data (Dict[str, str], optional): Additional data to include in the response. Defaults to None.
+            meta (Dict[str, Any], optional): Metadata about the data, such as the next page cursor. Defaults to None.
 
         Returns:
             JSONResponse: A formatted JSON response containing the specified status code, message, and data.
         """
 
-        response_content: Dict[str, Union[str, Dict[str, str]]] = {
+        response_content: Dict[str, Union[str, Dict[str, Any]]] = {
             "status_code": str(status_code),
             "status_name": HTTPStatus(status_code).phrase,
         }
@@ -51,6 +53,9 @@ class ResponseUtil:
         if data is not None:
             response_content["data"] = data
 
+        if meta is not None:
+            response_content["meta"] = meta
+
         return JSONResponse(status_code=status_code, content=response_content)
 
 json_response: Callable[..., JSONResponse] = ResponseUtil().json_response
@@ -0,0 +1,186 @@
+# /src/utils/revocation/__init__.py
+
+# flake8: noqa: E501
+
+# PY
+import threading
+from datetime import datetime, timedelta
+
+# Core
+from src.core.configurations.database import DatabaseConfig
+from src.core.configurations.environment import EnvConfig
+
+# Utils
+from src.utils.logger import log
+
+
+class RevocationListUtil:
+    """
+    Class responsible for keeping the set of revoked sessions used by stateless token validation.
+
+    With `AUTH_MODE=stateless`, tokens are validated from their signature and expiry
+    only, and this in-process list of revoked (logged out or replaced) session IDs
+    takes the place of the per-request `sessions_auth` lookup.
+
+    The list is refreshed incrementally from the database every
+    `AUTH_REVOCATION_REFRESH_SECONDS`, reading only the sessions deactivated since
+    the previous refresh, so a session revoked by another worker process is
+    honoured after at most that delay. Revocations made by this process are applied
+    immediately.
+
+    An entry is dropped once every token of its session has expired, which bounds
+    the list to the sessions revoked within `JWT_ACCESS_TOKEN_EXPIRE_MINUTES`.
+
+    Class Args:
+        None
+    """
+
+    __modes = ("stateful", "stateless")
+
+    # Re-read window before the previous refresh, covering logouts committed late
+    __overlap = timedelta(seconds=60)
+
+    def __init__(self) -> None:
+        """
+        Constructor method for RevocationListUtil.
+
+        Args:
+            None
+
+        Raises:
+            ValueError: If `AUTH_MODE` is not supported.
+        """
+
+        _mode = EnvConfig().auth_mode
+
+        if _mode not in self.__modes:
+            raise ValueError(
+                f"Invalid AUTH_MODE '{_mode}'! Allowed values: {', '.join(self.__modes)}"
+            )
+
+        self.__enabled: bool = _mode == "stateless"
+        self.__retention = timedelta(minutes=EnvConfig().jwt_access_token_expire_minutes)
+        self.__entries: dict[str, datetime] = {}
+        self.__lock = threading.Lock()
+        self.__watermark: datetime | None = None
+        self.__last_refresh: datetime | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Property method responsible for returning whether stateless token validation is enabled.
+
+        Args:
+            None
+
+        Returns:
+            bool: True if `AUTH_MODE` is `stateless`, otherwise False.
+        """
+
+        return self.__enabled
+
+    def revoke(self, session_id: str) -> None:
+        """
+        Public method responsible for revoking a session in this process.
+
+        Args:
+            session_id (str): The Session ID to revoke.
+
+        Returns:
+            None
+        """
+
+        if not self.__enabled:
+            return
+
+        with self.__lock:
+            self.__entries[session_id] = datetime.now()
+
+    def is_revoked(self, session_id: str) -> bool:
+        """
+        Public method responsible for checking whether a session is revoked.
+
+        Args:
+            session_id (str): The Session ID extracted from the token.
+
+        Returns:
+            bool: True if the session was revoked, otherwise False.
+        """
+
+        return session_id in self.__entries
+
+    def refresh(self) -> None:
+        """
+        Public method responsible for loading the sessions revoked since the previous refresh.
+
+        The first refresh loads every session revoked within the token lifetime.
+        Errors are logged and the previous list is kept.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        if not self.__enabled:
+            return
+
+        now = datetime.now()
+        since = (
+            self.__watermark - self.__overlap
+            if self.__watermark is not None
+            else now - self.__retention
+        )
+
+        session_db = next(DatabaseConfig().get_db())
+
+        try:
+
+            from src.data.repositories import SessionAuthRepository
+
+            revoked_sessions = SessionAuthRepository(session_db).find_revoked_sessions(since)
+
+        except Exception as error:
+            log.error(f"Error refreshing the revocation list: {error}")
+            return
+
+        finally:
+            session_db.close()
+
+        expired_before = now - self.__retention
+
+        with self.__lock:
+            for session_id, logout_at in revoked_sessions:
+                self.__entries[session_id] = logout_at
+
+            self.__entries = {
+                session_id: revoked_at
+                for session_id, revoked_at in self.__entries.items()
+                if revoked_at >= expired_before
+            }
+            self.__watermark = now
+            self.__last_refresh = now
+
+    @property
+    def stats(self) -> dict[str, int | str | None]:
+        """
+        Property method responsible for returning the revocation list gauges.
+
+        Args:
+            None
+
+        Returns:
+            dict[str, int | str | None]: The number of revoked sessions and the time of the last refresh.
+        """
+
+        with self.__lock:
+            return {
+                "size": len(self.__entries),
+                "last_refresh": (
+                    self.__last_refresh.isoformat() if self.__last_refresh else None
+                ),
+            }
+
+
+revocation_list = RevocationListUtil()